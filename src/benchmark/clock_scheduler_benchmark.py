@@ -0,0 +1,97 @@
+import random
+import time
+
+from network.server.clock_scheduler import ClockScheduler
+
+'''
+runs the clocks of many simultaneous games on a simulated time line, every game moves every few seconds and some
+games never move again so their flag falls. the heap only looks at the clocks that ran out, polling has to scan the
+deadline of every game on each tick
+run from the src directory: python -m benchmark.clock_scheduler_benchmark
+'''
+
+GAME_COUNT: int = 50_000
+SIMULATED_SECONDS: int = 60
+TICK: float = 0.1
+MOVE_INTERVAL: tuple[float, float] = 1, 10
+CLOCK_TIME: float = 180
+# chance a game is abandoned on every move so its clock runs until the flag falls
+STALL_CHANCE: float = 0.01
+
+
+def run_heap(moves: list[tuple[float, int, float]]) -> tuple[float, float, int]:
+    scheduler: ClockScheduler = ClockScheduler()
+    schedule_seconds: float = 0
+    tick_seconds: float = 0
+    flags: int = 0
+    index: int = 0
+    now: float = 0
+    while now < SIMULATED_SECONDS:
+        now += TICK
+        start: float = time.perf_counter()
+        while index < len(moves) and moves[index][0] <= now:
+            _, match_id, deadline = moves[index]
+            scheduler.schedule(match_id, deadline)
+            index += 1
+        schedule_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        flags += len(scheduler.pop_due(now))
+        tick_seconds += time.perf_counter() - start
+    return schedule_seconds, tick_seconds, flags
+
+
+def run_polling(moves: list[tuple[float, int, float]]) -> tuple[float, float, int]:
+    deadlines: dict[int, float] = {}
+    schedule_seconds: float = 0
+    tick_seconds: float = 0
+    flags: int = 0
+    index: int = 0
+    now: float = 0
+    while now < SIMULATED_SECONDS:
+        now += TICK
+        start: float = time.perf_counter()
+        while index < len(moves) and moves[index][0] <= now:
+            _, match_id, deadline = moves[index]
+            deadlines[match_id] = deadline
+            index += 1
+        schedule_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        fallen: list[int] = [match_id for match_id, deadline in deadlines.items() if deadline <= now]
+        for match_id in fallen:
+            del deadlines[match_id]
+        flags += len(fallen)
+        tick_seconds += time.perf_counter() - start
+    return schedule_seconds, tick_seconds, flags
+
+
+def get_moves() -> list[tuple[float, int, float]]:
+    # (time of the move, match id, flag fall deadline of the side to move afterwards)
+    random.seed(0)
+    moves: list[tuple[float, int, float]] = []
+    for match_id in range(GAME_COUNT):
+        played: float = random.uniform(*MOVE_INTERVAL)
+        time_left: float = random.uniform(1, CLOCK_TIME)
+        while played < SIMULATED_SECONDS:
+            moves.append((played, match_id, played + time_left))
+            if random.random() < STALL_CHANCE:
+                break
+            played += random.uniform(*MOVE_INTERVAL)
+            time_left = random.uniform(1, CLOCK_TIME)
+    moves.sort()
+    return moves
+
+
+def run() -> None:
+    moves: list[tuple[float, int, float]] = get_moves()
+    ticks: int = int(SIMULATED_SECONDS / TICK)
+    print(f"{GAME_COUNT} games, {len(moves)} moves over {SIMULATED_SECONDS}s, {ticks} ticks")
+    for name, runner in (("heap", run_heap), ("polling", run_polling)):
+        schedule_seconds, tick_seconds, flags = runner(moves)
+        print(f"{name:<8}: {schedule_seconds / len(moves) * 1_000_000:.2f} us per move, "
+              f"{tick_seconds / ticks * 1000:.3f} ms per tick finding flags, {flags} flags fell")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import time
+import typing
+
+from config.logging_manager import AppLoggers
+from config.logging_manager import LoggingManager
+from config.tk_config import LOCAL_CHESS_DB_INFO
+from database.chess_db import ChessDataBase
+from database.chess_db import DataBaseInfo
+from database.models import Base
+from database.models import User
+
+'''
+writes finished games with create_game, one transaction per game on the calling thread, and with queue_game,
+where the write behind thread groups them into batched transactions. a sqlite file stands in for mysql
+run from the src directory: python -m benchmark.database_benchmark
+'''
+
+USER_COUNT: int = 200
+GAME_COUNT: int = 2_000
+SAMPLE_MOVES: str = "1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 4. Ba4 Nf6 5. O-O Be7 1-0"
+RESULTS: tuple[str, ...] = ("WHITE", "BLACK", "DRAW")
+
+
+class SQLiteDataBase(ChessDataBase):
+    def __init__(self, path: str) -> None:
+        super().__init__(DataBaseInfo(*LOCAL_CHESS_DB_INFO))
+        self.path: str = path
+
+    def get_connection_url(self) -> str:
+        return f"sqlite:///{self.path}"
+
+
+class WriteResult(typing.NamedTuple):
+    name: str
+    caller_seconds: float
+    total_seconds: float
+
+
+def create_database(path: str) -> tuple[SQLiteDataBase, list[User]]:
+    database: SQLiteDataBase = SQLiteDataBase(path)
+    Base.metadata.create_all(database.get_engine())
+    for index in range(USER_COUNT):
+        database.create_user(f"player{index}", "password")
+    users: list[User] = [user for index in range(USER_COUNT) if
+                         (user := database.get_user(f"player{index}")) is not None]
+    return database, users
+
+
+def write_games(database: SQLiteDataBase, users: list[User], is_queued: bool) -> WriteResult:
+    write: typing.Callable[..., typing.Any] = database.queue_game if is_queued else database.create_game
+    start: float = time.perf_counter()
+    for index in range(GAME_COUNT):
+        white: User = users[index % len(users)]
+        black: User = users[(index * 7 + 1) % len(users)]
+        write(white, black, SAMPLE_MOVES, RESULTS[index % len(RESULTS)], "300 0")
+
+    caller_seconds: float = time.perf_counter() - start
+    database.stop_write_queue()
+    return WriteResult("queue_game" if is_queued else "create_game", caller_seconds, time.perf_counter() - start)
+
+
+def run() -> None:
+    print(f"{'method':<14}{'games':>8}{'caller ms/game':>16}{'games/s':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        LoggingManager.load_configs()
+        LoggingManager.configure(AppLoggers.DATABASE, file=os.path.join(directory, "database.log"))
+        for is_queued in (False, True):
+            database, users = create_database(os.path.join(directory, f"chess_{is_queued}.db"))
+            result: WriteResult = write_games(database, users, is_queued)
+            print(f"{result.name:<14}{GAME_COUNT:>8}{result.caller_seconds / GAME_COUNT * 1000:>16.4f}"
+                  f"{GAME_COUNT / result.total_seconds:>12.0f}")
+            database.get_engine().dispose()
+
+
+if __name__ == "__main__":
+    run()
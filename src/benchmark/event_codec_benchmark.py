@@ -0,0 +1,88 @@
+import pickle
+import time
+import typing
+from uuid import uuid1
+
+from event.event import Event
+from event.event_codec import EventDecoder
+from event.event_codec import encode_frame
+from event.game_events import EndGameEvent
+from event.game_events import MoveEvent
+from event.game_events import UpdateCapturedPiecesEvent
+from event.game_events import UpdateFenEvent
+from event.launcher_events import LaunchGameEvent
+from event.launcher_events import ServerVerificationEvent
+
+'''
+compares the framed binary codec against the previous pickle path
+run from the src directory: python -m benchmark.event_codec_benchmark
+'''
+
+ITERATIONS: int = 20_000
+
+
+class CodecResult(typing.NamedTuple):
+    name: str
+    size: int
+    encode_per_sec: float
+    decode_per_sec: float
+
+
+def get_sample_payloads() -> dict[str, Event | list[Event]]:
+    match_id: int = uuid1().int
+    fen: str = "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"
+    return {
+        "move": MoveEvent(match_id, ('g', '1'), ('f', '3'), "WHITE", "N", "2023-06-18T18:34:00.123456+00:00"),
+        "update fen": [UpdateFenEvent(match_id, fen, 291.3, 295.7, 62, 45)],
+        "capture": [UpdateFenEvent(match_id, fen, 291.3, 295.7, 62, 45),
+                    UpdateCapturedPiecesEvent(match_id, "pPnB")],
+        "end game": [EndGameEvent(match_id, "WHITE", "CHECKMATE")],
+        "verification": ServerVerificationEvent("player", 1000, 1, "5f4dcc3b5aa765d61d8327deb882cf99"),
+        "launch game": [LaunchGameEvent(match_id, 300.0, "WHITE")],
+    }
+
+
+def time_per_sec(func: typing.Callable[[], typing.Any]) -> float:
+    start: float = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+def bench_pickle(payload: Event | list[Event]) -> CodecResult:
+    data: bytes = pickle.dumps(payload)
+    return CodecResult("pickle", len(data), time_per_sec(lambda: pickle.dumps(payload)),
+                       time_per_sec(lambda: pickle.loads(data)))
+
+
+def bench_codec(payload: Event | list[Event]) -> CodecResult:
+    data: bytes = encode_frame(payload)
+    decoder: EventDecoder = EventDecoder()
+    return CodecResult("codec", len(data), time_per_sec(lambda: encode_frame(payload)),
+                       time_per_sec(lambda: decoder.feed(data)))
+
+
+def bench_stream(payload: Event | list[Event], frames: int = 64, chunk_size: int = 7) -> float:
+    stream: bytes = encode_frame(payload) * frames
+    chunks: list[bytes] = [stream[index: index + chunk_size] for index in range(0, len(stream), chunk_size)]
+    decoder: EventDecoder = EventDecoder()
+    start: float = time.perf_counter()
+    decoded: int = 0
+    for chunk in chunks:
+        decoded += len(decoder.feed(chunk))
+    return decoded / (time.perf_counter() - start)
+
+
+def run() -> None:
+    print(f"{'payload':<14}{'codec':<7}{'bytes':>7}{'encode/s':>12}{'decode/s':>12}")
+    for name, payload in get_sample_payloads().items():
+        for result in (bench_pickle(payload), bench_codec(payload)):
+            print(f"{name:<14}{result.name:<7}{result.size:>7}{result.encode_per_sec:>12.0f}"
+                  f"{result.decode_per_sec:>12.0f}")
+
+    move: Event | list[Event] = get_sample_payloads()["move"]
+    print(f"streamed decode in 7 byte reads: {bench_stream(move):.0f} events/s")
+
+
+if __name__ == "__main__":
+    run()
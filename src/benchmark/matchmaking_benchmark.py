@@ -0,0 +1,77 @@
+import random
+import statistics
+import time
+
+from chess.timer.timer_config import DefaultConfigs
+from chess.timer.timer_config import TimerConfig
+from config.tk_config import MATCHMAKING_TICK
+from network.server.matchmaker import MatchUp
+from network.server.matchmaker import Matchmaker
+
+'''
+queues simulated users on the matchmaker and runs its ticks on a simulated clock, measures the time spent pairing
+and the simulated wait and rating difference of the match ups
+run from the src directory: python -m benchmark.matchmaking_benchmark
+'''
+
+USER_COUNT: int = 10_000
+# users that enter the queue during every tick once the initial burst is queued
+ARRIVALS_PER_TICK: int = 200
+TICK_COUNT: int = 120
+ELO_MEAN: int = 1500
+ELO_DEVIATION: int = 350
+TIMER_CONFIGS: tuple[TimerConfig, ...] = (
+    DefaultConfigs.BULLET_1_0, DefaultConfigs.BLITZ_3_0, DefaultConfigs.BLITZ_3_2, DefaultConfigs.BLITZ_5_0,
+    DefaultConfigs.RAPID_15_10,
+)
+
+
+def queue_users(matchmaker: Matchmaker, first_id: int, count: int, now: float, elos: dict[int, int],
+                queued_at: dict[int, float]) -> None:
+    for u_id in range(first_id, first_id + count):
+        elos[u_id] = max(0, int(random.gauss(ELO_MEAN, ELO_DEVIATION)))
+        queued_at[u_id] = now
+        matchmaker.add(u_id, elos[u_id], random.choice(TIMER_CONFIGS), now)
+
+
+def run() -> None:
+    random.seed(0)
+    matchmaker: Matchmaker = Matchmaker()
+    elos: dict[int, int] = {}
+    queued_at: dict[int, float] = {}
+
+    start: float = time.perf_counter()
+    queue_users(matchmaker, 0, USER_COUNT, 0, elos, queued_at)
+    enqueue_seconds: float = time.perf_counter() - start
+
+    tick_seconds: list[float] = []
+    waits: list[float] = []
+    differences: list[int] = []
+    next_id: int = USER_COUNT
+    for tick in range(1, TICK_COUNT + 1):
+        now: float = tick * MATCHMAKING_TICK
+        start = time.perf_counter()
+        match_ups: list[MatchUp] = matchmaker.tick(now)
+        tick_seconds.append(time.perf_counter() - start)
+
+        for match_up in match_ups:
+            waits.extend(now - queued_at[u_id] for u_id in (match_up.white_id, match_up.black_id))
+            differences.append(abs(elos[match_up.white_id] - elos[match_up.black_id]))
+
+        queue_users(matchmaker, next_id, ARRIVALS_PER_TICK, now, elos, queued_at)
+        next_id += ARRIVALS_PER_TICK
+
+    quantiles: list[float] = statistics.quantiles(waits, n=20)
+    print(f"queued users          : {USER_COUNT} then {ARRIVALS_PER_TICK} per {MATCHMAKING_TICK}s tick")
+    print(f"enqueue               : {enqueue_seconds / USER_COUNT * 1_000_000:.2f} us/user")
+    print(f"first tick            : {tick_seconds[0] * 1000:.2f} ms")
+    print(f"tick mean / max       : {statistics.mean(tick_seconds) * 1000:.2f} / {max(tick_seconds) * 1000:.2f} ms")
+    print(f"match ups             : {len(differences)} ({len(differences) / sum(tick_seconds):.0f} per second of "
+          f"pairing)")
+    print(f"still queued          : {len(matchmaker)}")
+    print(f"simulated wait p50/p95: {quantiles[9]:.1f} / {quantiles[18]:.1f} s")
+    print(f"elo difference mean   : {statistics.mean(differences):.1f}, max {max(differences)}")
+
+
+if __name__ == "__main__":
+    run()
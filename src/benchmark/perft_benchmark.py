@@ -0,0 +1,92 @@
+import time
+import typing
+
+from chess_engine.movement.piece_movement import PieceMovement
+from chess_engine.movement.piece_movement import get_available_moves
+from chess_engine.notation.forsyth_edwards_notation import Fen
+from chess_engine.notation.forsyth_edwards_notation import FenChars
+from chess_engine.notation.forsyth_edwards_notation import encode_fen_data
+
+from chess.bitboard.bitboard_position import BitboardPosition
+from chess.bitboard.bitboard_position import START_FEN
+from chess.bitboard.bitboard_position import perft
+
+'''
+counts the leaf nodes of the move tree (perft) with the bitboard position and with chess_engine,
+the counts are checked against the published results of each position
+run from the src directory: python -m benchmark.perft_benchmark
+'''
+
+
+class PerftPosition(typing.NamedTuple):
+    name: str
+    notation: str
+    # expected node count for depth 1, 2, ...
+    nodes: tuple[int, ...]
+    bitboard_depth: int
+    chess_engine_depth: int
+
+
+PERFT_POSITIONS: tuple[PerftPosition, ...] = (
+    PerftPosition("start", START_FEN, (20, 400, 8902, 197281), 4, 3),
+    PerftPosition("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                  (48, 2039, 97862), 3, 2),
+    PerftPosition("endgame", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", (14, 191, 2812, 43238), 4, 3),
+    PerftPosition("promotions", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+                  (6, 264, 9467), 3, 2),
+)
+
+
+def chess_engine_perft(fen: Fen, depth: int) -> int:
+    if depth == 0:
+        return 1
+
+    nodes: int = 0
+    is_white_turn: bool = fen.is_white_turn()
+    for from_index in range(64):
+        piece: str = fen[from_index]
+        if piece == FenChars.BLANK_PIECE or piece.isupper() != is_white_turn:
+            continue
+
+        for dest_index in get_available_moves(from_index, fen):
+            for target_fen in get_target_fens(piece, dest_index, is_white_turn):
+                child: Fen = Fen(encode_fen_data(fen.data))
+                child.make_move(from_index, dest_index, target_fen)
+                nodes += chess_engine_perft(child, depth - 1)
+    return nodes
+
+
+def get_target_fens(piece: str, dest_index: int, is_white_turn: bool) -> list[str]:
+    if piece.upper() != FenChars.DEFAULT_PAWN or 8 <= dest_index < 56:
+        return [piece]
+
+    promotions: list[str] = [FenChars.DEFAULT_QUEEN, FenChars.DEFAULT_ROOK, FenChars.DEFAULT_BISHOP,
+                             FenChars.DEFAULT_KNIGHT]
+    return [FenChars.get_piece_fen(promotion, is_white_turn) for promotion in promotions]
+
+
+def timed(func: typing.Callable[[], int]) -> tuple[int, float]:
+    start: float = time.perf_counter()
+    nodes: int = func()
+    return nodes, time.perf_counter() - start
+
+
+def run() -> None:
+    PieceMovement.load()
+    print(f"{'position':<12}{'engine':<14}{'depth':>6}{'nodes':>10}{'expected':>10}{'nodes/s':>12}")
+    for position in PERFT_POSITIONS:
+        runs: list[tuple[str, int, typing.Callable[[], int]]] = [
+            ("bitboard", position.bitboard_depth,
+             lambda: perft(BitboardPosition(position.notation), position.bitboard_depth)),
+            ("chess_engine", position.chess_engine_depth,
+             lambda: chess_engine_perft(Fen(position.notation), position.chess_engine_depth)),
+        ]
+        for engine, depth, func in runs:
+            nodes, seconds = timed(func)
+            expected: int = position.nodes[depth - 1]
+            status: str = "" if nodes == expected else "  MISMATCH"
+            print(f"{position.name:<12}{engine:<14}{depth:>6}{nodes:>10}{expected:>10}{nodes / seconds:>12.0f}{status}")
+
+
+if __name__ == "__main__":
+    run()
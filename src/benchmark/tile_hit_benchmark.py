@@ -0,0 +1,53 @@
+import random
+import time
+
+import pygame
+
+from chess.asset.asset_manager import AssetManager
+from chess.asset.chess_assets import Themes
+from chess.board.board_tile import BoardTile
+from chess.board.chess_board import Board
+from chess.board.side import Side
+from chess.game.game_size import GameSize
+from config.pg_config import DEFAULT_SCALE
+
+'''
+finds the tile under the mouse once per frame, like the axis hover highlight does, for mouse positions spread over
+the board and the gui around it. the scan is the previous implementation that tested the rect of every tile
+run from the src directory: python -m benchmark.tile_hit_benchmark
+'''
+
+FRAMES: int = 100_000
+# the mouse also moves over the gui around the board
+MARGIN: int = 100
+
+
+def get_collided_tile_scan(board: Board, game_offset: pygame.rect.Rect, mouse_pos: tuple[int, int]) -> BoardTile | None:
+    board_offset = pygame.math.Vector2(board.rect.topleft) + pygame.math.Vector2(game_offset.topleft)
+    for tile in board.grid:
+        pos = pygame.math.Vector2(mouse_pos) - board_offset
+        if tile.rect.collidepoint((pos.x, pos.y)):
+            return tile
+    return None
+
+
+def run() -> None:
+    GameSize.load_scale(DEFAULT_SCALE)
+    AssetManager.load_theme(Themes.PLAIN1)
+    board: Board = Board(Side.WHITE)
+    game_offset: pygame.rect.Rect = pygame.rect.Rect(20, 20, 0, 0)
+    random.seed(0)
+    positions: list[tuple[int, int]] = [(random.randint(0, board.rect.width + MARGIN),
+                                         random.randint(0, board.rect.height + MARGIN)) for _ in range(FRAMES)]
+
+    print(f"{FRAMES} frames at scale {DEFAULT_SCALE}")
+    for name, hit_test in (("scan", lambda pos: get_collided_tile_scan(board, game_offset, pos)),
+                           ("arithmetic", lambda pos: board.get_collided_tile(game_offset, pos))):
+        start: float = time.perf_counter()
+        hits: int = sum(hit_test(pos) is not None for pos in positions)
+        seconds: float = time.perf_counter() - start
+        print(f"{name:<10}: {seconds / FRAMES * 1_000_000:.2f} us per frame, {hits} hits")
+
+
+if __name__ == "__main__":
+    run()
@@ -2,8 +2,8 @@ import pygame
 
 from chess.asset.chess_assets import ChessTheme
 from chess.asset.chess_assets import PieceSetAsset
-from chess.asset.chess_assets import PieceSurfaces
-from chess.asset.chess_assets import load_piece_set
+from chess.asset.chess_assets import load_surface_sheet
+from chess.asset.chess_assets import scale_surface
 from chess_engine.notation.forsyth_edwards_notation import FenChars
 from config.pg_config import B_ASSET_INDEX
 from config.pg_config import K_ASSET_INDEX
@@ -12,20 +12,47 @@ from config.pg_config import P_ASSET_INDEX
 from config.pg_config import Q_ASSET_INDEX
 from config.pg_config import R_ASSET_INDEX
 
+'''
+the piece sheets are read from disk once and cut into their unscaled pieces, the pieces of a set are scaled once
+for every scale they are drawn at. starting another game or creating a player reuses them without any file access.
+the pieces do not depend on the theme, their background is a colour key
+'''
+# (white sheet file, black sheet file, scale, piece scale)
+AtlasKey = tuple[str, str, float, float]
+
 
 class AssetManager:
     piece_surfaces: dict[str, pygame.surface.Surface] = {}
     piece_asset_index: dict[str, int] = {}
     theme: ChessTheme | None = None
+    sheets: dict[str, list[pygame.surface.Surface]] = {}
+    atlases: dict[AtlasKey, dict[str, pygame.surface.Surface]] = {}
+
+    @staticmethod
+    def get_sheet(asset_file: str) -> list[pygame.surface.Surface]:
+        sheet: list[pygame.surface.Surface] | None = AssetManager.sheets.get(asset_file)
+        if sheet is None:
+            sheet = load_surface_sheet(asset_file, 1)
+            AssetManager.sheets[asset_file] = sheet
+        return sheet
 
     @staticmethod
-    def load_pieces_surfaces(piece_set: PieceSetAsset, scale: float) -> dict[str, pygame.surface.Surface]:
-        surfaces: dict[str, pygame.surface.Surface] = {}
-        piece_surfaces: PieceSurfaces = load_piece_set(piece_set, scale)
-        assert len(piece_surfaces.white) == len(piece_surfaces.black)
+    def load_pieces_surfaces(piece_set: PieceSetAsset, scale: float,
+                             piece_scale: float = 1) -> dict[str, pygame.surface.Surface]:
+        # the surfaces are shared by every caller, they are only blitted and never drawn on
+        key: AtlasKey = piece_set.white_assets_file, piece_set.black_assets_file, scale, piece_scale
+        surfaces: dict[str, pygame.surface.Surface] | None = AssetManager.atlases.get(key)
+        if surfaces is not None:
+            return surfaces
+
+        surfaces = {}
+        white_pieces: list[pygame.surface.Surface] = AssetManager.get_sheet(piece_set.white_assets_file)
+        black_pieces: list[pygame.surface.Surface] = AssetManager.get_sheet(piece_set.black_assets_file)
+        assert len(white_pieces) == len(black_pieces)
         for fen_value, index in AssetManager.piece_asset_index.items():
-            surfaces[fen_value.upper()] = piece_surfaces.white[index]
-            surfaces[fen_value.lower()] = piece_surfaces.black[index]
+            surfaces[fen_value.upper()] = scale_piece(white_pieces[index], scale, piece_scale)
+            surfaces[fen_value.lower()] = scale_piece(black_pieces[index], scale, piece_scale)
+        AssetManager.atlases[key] = surfaces
         return surfaces
 
     @staticmethod
@@ -58,3 +85,9 @@ class AssetManager:
         if AssetManager.theme is None:
             raise Exception('theme is not loaded')
         return AssetManager.theme
+
+
+def scale_piece(piece: pygame.surface.Surface, scale: float, piece_scale: float) -> pygame.surface.Surface:
+    # scaled in two steps like a piece of the game scale that is resized again
+    surface: pygame.surface.Surface = scale_surface(piece, scale)
+    return surface if piece_scale == 1 else scale_surface(surface, piece_scale)
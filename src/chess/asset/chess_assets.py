@@ -1,7 +1,6 @@
 import dataclasses
 import math
 import random
-import typing
 
 import pygame
 
@@ -46,11 +45,6 @@ class PieceSetAsset:
     black_assets_file: str
 
 
-class PieceSurfaces(typing.NamedTuple):
-    white: list[pygame.surface.Surface]
-    black: list[pygame.surface.Surface]
-
-
 class PieceSetAssets:
     SIMPLE16x16: PieceSetAsset = PieceSetAsset(SIMPLE16x16_PIECE_FILE_WHITE, SIMPLE16x16_PIECE_FILE_BLACK)
     NORMAL16x16: PieceSetAsset = PieceSetAsset(NORMAL16x16_PIECE_FILE_WHITE, NORMAL16x16_PIECE_FILE_BLACK)
@@ -133,8 +127,3 @@ def load_surface(file: str, surface_scale: float) -> pygame.surface.Surface:
     surface = pygame.image.load(file).convert()
     surface = scale_surface(surface, surface_scale)
     return surface
-
-
-def load_piece_set(piece_set: PieceSetAsset, piece_scale: float) -> PieceSurfaces:
-    return PieceSurfaces(load_surface_sheet(piece_set.white_assets_file, piece_scale),
-                         load_surface_sheet(piece_set.black_assets_file, piece_scale))
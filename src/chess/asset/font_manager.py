@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+import pygame
+
+from chess.asset.chess_assets import ChessTheme
+from config.pg_config import TEXT_SURFACE_CACHE_SIZE
+
+'''
+every font file is read and parsed once per size instead of on every use. pygame.quit invalidates the fonts, so they
+are opened again for every game. the gui keeps drawing the same few strings (moves, scores, axis values), so the
+rendered text is kept by font, string and colour. rendered surfaces outlive pygame.quit; they are only dropped when
+the scale changes the font sizes or the theme changes the colours
+'''
+TextKey = tuple[str, int, str, bool, tuple[int, int, int]]
+
+
+class FontManager:
+    fonts: dict[tuple[str, int], pygame.font.Font] = {}
+    text_surfaces: OrderedDict[TextKey, pygame.surface.Surface] = OrderedDict()
+    scale: float | None = None
+    theme: ChessTheme | None = None
+
+    @staticmethod
+    def load(scale: float, theme: ChessTheme) -> None:
+        FontManager.fonts.clear()
+        if scale != FontManager.scale or theme != FontManager.theme:
+            FontManager.text_surfaces.clear()
+        FontManager.scale = scale
+        FontManager.theme = theme
+
+    @staticmethod
+    def get_font(font_file: str, size: int) -> pygame.font.Font:
+        font: pygame.font.Font | None = FontManager.fonts.get((font_file, size))
+        if font is None:
+            font = pygame.font.Font(font_file, size)
+            FontManager.fonts[font_file, size] = font
+        return font
+
+    @staticmethod
+    def render(font_file: str, size: int, text: str, anti_alias: bool,
+               color: tuple[int, int, int]) -> pygame.surface.Surface:
+        # the surface is shared by every caller, it is only blitted and never drawn on
+        text_surfaces: OrderedDict[TextKey, pygame.surface.Surface] = FontManager.text_surfaces
+        key: TextKey = font_file, size, text, anti_alias, color
+        surface: pygame.surface.Surface | None = text_surfaces.get(key)
+        if surface is not None:
+            text_surfaces.move_to_end(key)
+            return surface
+
+        surface = FontManager.get_font(font_file, size).render(text, anti_alias, color)
+        text_surfaces[key] = surface
+        if len(text_surfaces) > TEXT_SURFACE_CACHE_SIZE:
+            text_surfaces.popitem(last=False)
+        return surface
@@ -0,0 +1,43 @@
+from chess.bitboard.bitboard_position import BitboardPosition
+from chess.bitboard.bitboard_position import get_move_promotion
+from chess.bitboard.bitboard_position import get_move_squares
+from chess.bitboard.bitboard_tables import FILES
+from chess.bitboard.bitboard_tables import KING
+from chess.bitboard.bitboard_tables import NO_PIECE
+from chess.bitboard.bitboard_tables import PAWN
+from chess.bitboard.bitboard_tables import PIECE_CHARS
+from chess.bitboard.bitboard_tables import get_square_name
+
+
+def get_san(position: BitboardPosition, move: int, legal_moves: list[int]) -> str:
+    '''
+    standard algebraic notation of a legal move in the position, without the check or checkmate suffix
+    '''
+    from_, dest = get_move_squares(move)
+    piece: int = position.board[from_]
+    piece_char: str = PIECE_CHARS[piece].upper()
+    is_capture: bool = position.get_captured_piece(move) != NO_PIECE
+
+    if piece_char == PIECE_CHARS[KING] and abs(dest - from_) == 2:
+        return 'O-O' if dest > from_ else 'O-O-O'
+
+    if piece_char == PIECE_CHARS[PAWN]:
+        san: str = FILES[from_ % 8] + 'x' + get_square_name(dest) if is_capture else get_square_name(dest)
+        if promotion := get_move_promotion(move):
+            san += '=' + PIECE_CHARS[promotion]
+        return san
+
+    # other pieces of the same type that can also reach the destination
+    rivals: list[int] = [get_move_squares(other)[0] for other in legal_moves if other != move and
+                         get_move_squares(other)[1] == dest and position.board[get_move_squares(other)[0]] == piece]
+    disambiguation: str = ''
+    if rivals:
+        from_name: str = get_square_name(from_)
+        if all(rival % 8 != from_ % 8 for rival in rivals):
+            disambiguation = from_name[0]
+        elif all(rival // 8 != from_ // 8 for rival in rivals):
+            disambiguation = from_name[1]
+        else:
+            disambiguation = from_name
+
+    return piece_char + disambiguation + ('x' if is_capture else '') + get_square_name(dest)
@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import typing
+
+from chess.bitboard.bitboard_tables import A1
+from chess.bitboard.bitboard_tables import A8
+from chess.bitboard.bitboard_tables import B1
+from chess.bitboard.bitboard_tables import B8
+from chess.bitboard.bitboard_tables import BETWEEN
+from chess.bitboard.bitboard_tables import BISHOP
+from chess.bitboard.bitboard_tables import BISHOP_LINES
+from chess.bitboard.bitboard_tables import BLACK
+from chess.bitboard.bitboard_tables import BLACK_KING_SIDE
+from chess.bitboard.bitboard_tables import BLACK_QUEEN_SIDE
+from chess.bitboard.bitboard_tables import C1
+from chess.bitboard.bitboard_tables import C8
+from chess.bitboard.bitboard_tables import CASTLING_CHARS
+from chess.bitboard.bitboard_tables import CASTLING_MASKS
+from chess.bitboard.bitboard_tables import D1
+from chess.bitboard.bitboard_tables import D8
+from chess.bitboard.bitboard_tables import DARK_SQUARES
+from chess.bitboard.bitboard_tables import E1
+from chess.bitboard.bitboard_tables import E8
+from chess.bitboard.bitboard_tables import F1
+from chess.bitboard.bitboard_tables import F8
+from chess.bitboard.bitboard_tables import G1
+from chess.bitboard.bitboard_tables import G8
+from chess.bitboard.bitboard_tables import H1
+from chess.bitboard.bitboard_tables import H8
+from chess.bitboard.bitboard_tables import KING
+from chess.bitboard.bitboard_tables import KING_ATTACKS
+from chess.bitboard.bitboard_tables import KNIGHT
+from chess.bitboard.bitboard_tables import KNIGHT_ATTACKS
+from chess.bitboard.bitboard_tables import LIGHT_SQUARES
+from chess.bitboard.bitboard_tables import NO_PIECE
+from chess.bitboard.bitboard_tables import PAWN
+from chess.bitboard.bitboard_tables import PAWN_ATTACKS
+from chess.bitboard.bitboard_tables import PIECE_CHARS
+from chess.bitboard.bitboard_tables import PIECE_TYPES
+from chess.bitboard.bitboard_tables import PROMOTION_TYPES
+from chess.bitboard.bitboard_tables import QUEEN
+from chess.bitboard.bitboard_tables import ROOK
+from chess.bitboard.bitboard_tables import ROOK_LINES
+from chess.bitboard.bitboard_tables import WHITE
+from chess.bitboard.bitboard_tables import WHITE_KING_SIDE
+from chess.bitboard.bitboard_tables import WHITE_QUEEN_SIDE
+from chess.bitboard.bitboard_tables import bishop_attacks
+from chess.bitboard.bitboard_tables import get_square
+from chess.bitboard.bitboard_tables import get_square_name
+from chess.bitboard.bitboard_tables import rook_attacks
+from chess.bitboard.zobrist import BLACK_TO_MOVE_KEY
+from chess.bitboard.zobrist import CASTLING_KEYS
+from chess.bitboard.zobrist import EN_PASSANT_KEYS
+from chess.bitboard.zobrist import PIECE_KEYS
+
+START_FEN: str = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+# rook (from, dest) of a castling move, keyed by the king destination
+CASTLING_ROOK_MOVES: dict[int, tuple[int, int]] = {G1: (H1, F1), C1: (A1, D1), G8: (H8, F8), C8: (A8, D8)}
+
+'''
+moves are ints: from square (6 bits), dest square (6 bits) and the promotion piece type (3 bits, 0 when the move
+is not a promotion). castling is encoded as the two square king move
+'''
+MOVE_SQUARE_MASK: int = 0b111111
+DEST_SHIFT: int = 6
+PROMOTION_SHIFT: int = 12
+
+
+class UndoInfo(typing.NamedTuple):
+    move: int
+    captured: int
+    castling_rights: int
+    en_passant: int
+    en_passant_key: int
+    half_move_clock: int
+    hash: int
+
+
+class BitboardPosition:
+    def __init__(self, notation: str = START_FEN) -> None:
+        self.pieces: list[int] = [0] * len(PIECE_CHARS)
+        self.occupancy: list[int] = [0, 0]
+        self.board: list[int] = [NO_PIECE] * 64
+        self.side: int = WHITE
+        self.castling_rights: int = 0
+        self.en_passant: int = -1
+        # the en passant file is only part of the hash while the capture is possible
+        self.en_passant_key: int = 0
+        self.half_move_clock: int = 0
+        self.full_move_number: int = 1
+        self.hash: int = 0
+        self.history: list[UndoInfo] = []
+        self.load_fen(notation)
+
+    def load_fen(self, notation: str) -> None:
+        fields: list[str] = notation.split()
+        if len(fields) < 4:
+            raise Exception(f'fen: {notation} is missing fields')
+
+        self.pieces = [0] * len(PIECE_CHARS)
+        self.occupancy = [0, 0]
+        self.board = [NO_PIECE] * 64
+        self.hash = 0
+        self.history.clear()
+
+        square: int = 0
+        for char in fields[0]:
+            if char == '/':
+                continue
+            if char.isdigit():
+                square += int(char)
+                continue
+            self.put_piece(PIECE_CHARS.index(char), square)
+            square += 1
+        if square != 64:
+            raise Exception(f'fen piece placement: {fields[0]} does not describe 64 squares')
+
+        self.side = WHITE if fields[1] == 'w' else BLACK
+        self.castling_rights = 0
+        for right, char in CASTLING_CHARS:
+            if char in fields[2]:
+                self.castling_rights |= right
+        self.en_passant = -1 if fields[3] == '-' else get_square(fields[3])
+        self.half_move_clock = int(fields[4]) if len(fields) > 4 else 0
+        self.full_move_number = int(fields[5]) if len(fields) > 5 else 1
+
+        if self.side == BLACK:
+            self.hash ^= BLACK_TO_MOVE_KEY
+        self.hash ^= CASTLING_KEYS[self.castling_rights]
+        self.en_passant_key = self.get_en_passant_key()
+        self.hash ^= self.en_passant_key
+
+    def get_fen(self) -> str:
+        rows: list[str] = []
+        for row in range(8):
+            placement: str = ''
+            blanks: int = 0
+            for piece in self.board[row * 8: row * 8 + 8]:
+                if piece == NO_PIECE:
+                    blanks += 1
+                    continue
+                if blanks:
+                    placement += str(blanks)
+                    blanks = 0
+                placement += PIECE_CHARS[piece]
+            if blanks:
+                placement += str(blanks)
+            rows.append(placement)
+
+        castling: str = ''.join(char for right, char in CASTLING_CHARS if self.castling_rights & right) or '-'
+        en_passant: str = '-' if self.en_passant == -1 else get_square_name(self.en_passant)
+        side: str = 'w' if self.side == WHITE else 'b'
+        return f"{'/'.join(rows)} {side} {castling} {en_passant} {self.half_move_clock} {self.full_move_number}"
+
+    def put_piece(self, piece: int, square: int) -> None:
+        bit: int = 1 << square
+        self.pieces[piece] |= bit
+        self.occupancy[piece >= PIECE_TYPES] |= bit
+        self.board[square] = piece
+        self.hash ^= PIECE_KEYS[piece][square]
+
+    def remove_piece(self, piece: int, square: int) -> None:
+        bit: int = 1 << square
+        self.pieces[piece] ^= bit
+        self.occupancy[piece >= PIECE_TYPES] ^= bit
+        self.board[square] = NO_PIECE
+        self.hash ^= PIECE_KEYS[piece][square]
+
+    def get_en_passant_key(self) -> int:
+        if self.en_passant == -1:
+            return 0
+        # a pawn of the side to move can capture on the square when a pawn of the other side would attack it from there
+        if PAWN_ATTACKS[self.side ^ 1][self.en_passant] & self.pieces[self.side * PIECE_TYPES + PAWN]:
+            return EN_PASSANT_KEYS[self.en_passant % 8]
+        return 0
+
+    def get_king_square(self, side: int) -> int:
+        return self.pieces[side * PIECE_TYPES + KING].bit_length() - 1
+
+    def is_square_attacked(self, square: int, by_side: int, occupied: int, removed: int = 0) -> bool:
+        pieces: list[int] = self.pieces
+        base: int = by_side * PIECE_TYPES
+        if PAWN_ATTACKS[by_side ^ 1][square] & pieces[base + PAWN] & ~removed:
+            return True
+        if KNIGHT_ATTACKS[square] & pieces[base + KNIGHT] & ~removed:
+            return True
+        if KING_ATTACKS[square] & pieces[base + KING]:
+            return True
+
+        diagonal: int = (pieces[base + BISHOP] | pieces[base + QUEEN]) & ~removed
+        if diagonal & BISHOP_LINES[square] and bishop_attacks(square, occupied) & diagonal:
+            return True
+
+        straight: int = (pieces[base + ROOK] | pieces[base + QUEEN]) & ~removed
+        if straight & ROOK_LINES[square] and rook_attacks(square, occupied) & straight:
+            return True
+        return False
+
+    def is_in_check(self) -> bool:
+        return self.is_square_attacked(self.get_king_square(self.side), self.side ^ 1,
+                                       self.occupancy[WHITE] | self.occupancy[BLACK])
+
+    def get_pinned(self, king_square: int, occupied: int) -> int:
+        base: int = (self.side ^ 1) * PIECE_TYPES
+        queens: int = self.pieces[base + QUEEN]
+        snipers: int = (ROOK_LINES[king_square] & (self.pieces[base + ROOK] | queens)) | \
+                       (BISHOP_LINES[king_square] & (self.pieces[base + BISHOP] | queens))
+        pinned: int = 0
+        while snipers:
+            sniper: int = snipers & -snipers
+            snipers ^= sniper
+            between: int = BETWEEN[king_square][sniper.bit_length() - 1] & occupied
+            if between and not between & (between - 1):
+                pinned |= between
+        return pinned & self.occupancy[self.side]
+
+    def generate_pseudo_moves(self) -> list[int]:
+        us: int = self.side
+        base: int = us * PIECE_TYPES
+        pieces: list[int] = self.pieces
+        own: int = self.occupancy[us]
+        enemy: int = self.occupancy[us ^ 1]
+        occupied: int = own | enemy
+        targets: int = ~own
+        moves: list[int] = []
+
+        # pawns
+        forward: int = -8 if us == WHITE else 8
+        start_row: int = 6 if us == WHITE else 1
+        promotion_row: int = 0 if us == WHITE else 7
+        pawn_captures: list[int] = PAWN_ATTACKS[us]
+        capturable: int = enemy | (1 << self.en_passant if self.en_passant != -1 else 0)
+        pawns: int = pieces[base + PAWN]
+        while pawns:
+            bit: int = pawns & -pawns
+            pawns ^= bit
+            from_: int = bit.bit_length() - 1
+            dests: int = pawn_captures[from_] & capturable
+            push: int = from_ + forward
+            if not occupied >> push & 1:
+                dests |= 1 << push
+                if from_ // 8 == start_row and not occupied >> (push + forward) & 1:
+                    dests |= 1 << (push + forward)
+            while dests:
+                dest_bit: int = dests & -dests
+                dests ^= dest_bit
+                dest: int = dest_bit.bit_length() - 1
+                if dest // 8 == promotion_row:
+                    for promotion in PROMOTION_TYPES:
+                        moves.append(from_ | dest << DEST_SHIFT | promotion << PROMOTION_SHIFT)
+                else:
+                    moves.append(from_ | dest << DEST_SHIFT)
+
+        # pieces
+        for piece_type in (KNIGHT, BISHOP, ROOK, QUEEN, KING):
+            movers: int = pieces[base + piece_type]
+            while movers:
+                bit = movers & -movers
+                movers ^= bit
+                from_ = bit.bit_length() - 1
+                if piece_type == KNIGHT:
+                    dests = KNIGHT_ATTACKS[from_]
+                elif piece_type == BISHOP:
+                    dests = bishop_attacks(from_, occupied)
+                elif piece_type == ROOK:
+                    dests = rook_attacks(from_, occupied)
+                elif piece_type == QUEEN:
+                    dests = bishop_attacks(from_, occupied) | rook_attacks(from_, occupied)
+                else:
+                    dests = KING_ATTACKS[from_]
+                dests &= targets
+                while dests:
+                    dest_bit = dests & -dests
+                    dests ^= dest_bit
+                    moves.append(from_ | (dest_bit.bit_length() - 1) << DEST_SHIFT)
+
+        return moves
+
+    def generate_castling_moves(self, occupied: int) -> list[int]:
+        moves: list[int] = []
+        them: int = self.side ^ 1
+        if self.side == WHITE:
+            if self.castling_rights & WHITE_KING_SIDE and not occupied & (1 << F1 | 1 << G1) and \
+                    not self.is_square_attacked(F1, them, occupied) and not self.is_square_attacked(G1, them, occupied):
+                moves.append(E1 | G1 << DEST_SHIFT)
+            if self.castling_rights & WHITE_QUEEN_SIDE and not occupied & (1 << D1 | 1 << C1 | 1 << B1) and \
+                    not self.is_square_attacked(D1, them, occupied) and not self.is_square_attacked(C1, them, occupied):
+                moves.append(E1 | C1 << DEST_SHIFT)
+        else:
+            if self.castling_rights & BLACK_KING_SIDE and not occupied & (1 << F8 | 1 << G8) and \
+                    not self.is_square_attacked(F8, them, occupied) and not self.is_square_attacked(G8, them, occupied):
+                moves.append(E8 | G8 << DEST_SHIFT)
+            if self.castling_rights & BLACK_QUEEN_SIDE and not occupied & (1 << D8 | 1 << C8 | 1 << B8) and \
+                    not self.is_square_attacked(D8, them, occupied) and not self.is_square_attacked(C8, them, occupied):
+                moves.append(E8 | C8 << DEST_SHIFT)
+        return moves
+
+    def generate_legal_moves(self) -> list[int]:
+        us: int = self.side
+        them: int = us ^ 1
+        occupied: int = self.occupancy[WHITE] | self.occupancy[BLACK]
+        king_square: int = self.get_king_square(us)
+        in_check: bool = self.is_square_attacked(king_square, them, occupied)
+        pinned: int = self.get_pinned(king_square, occupied)
+        en_passant: int = self.en_passant
+        capture_offset: int = 8 if us == WHITE else -8
+        pawn: int = us * PIECE_TYPES + PAWN
+        board: list[int] = self.board
+
+        legal: list[int] = []
+        for move in self.generate_pseudo_moves():
+            from_: int = move & MOVE_SQUARE_MASK
+            dest: int = (move >> DEST_SHIFT) & MOVE_SQUARE_MASK
+            dest_bit: int = 1 << dest
+
+            if from_ == king_square:
+                if self.is_square_attacked(dest, them, occupied ^ (1 << from_), dest_bit):
+                    continue
+
+            elif dest == en_passant and board[from_] == pawn:
+                captured_bit: int = 1 << (dest + capture_offset)
+                after_move: int = (occupied ^ (1 << from_) ^ captured_bit) | dest_bit
+                if self.is_square_attacked(king_square, them, after_move, captured_bit):
+                    continue
+
+            elif in_check or pinned >> from_ & 1:
+                if self.is_square_attacked(king_square, them, (occupied ^ (1 << from_)) | dest_bit, dest_bit):
+                    continue
+
+            legal.append(move)
+
+        if not in_check:
+            legal.extend(self.generate_castling_moves(occupied))
+        return legal
+
+    def make_move(self, move: int) -> None:
+        from_: int = move & MOVE_SQUARE_MASK
+        dest: int = (move >> DEST_SHIFT) & MOVE_SQUARE_MASK
+        promotion: int = move >> PROMOTION_SHIFT
+        us: int = self.side
+        piece: int = self.board[from_]
+        captured: int = self.board[dest]
+
+        self.history.append(UndoInfo(move, captured, self.castling_rights, self.en_passant, self.en_passant_key,
+                                     self.half_move_clock, self.hash))
+        self.hash ^= self.en_passant_key ^ CASTLING_KEYS[self.castling_rights] ^ BLACK_TO_MOVE_KEY
+        self.half_move_clock += 1
+
+        if captured != NO_PIECE:
+            self.remove_piece(captured, dest)
+            self.half_move_clock = 0
+
+        self.remove_piece(piece, from_)
+        self.put_piece(piece if not promotion else us * PIECE_TYPES + promotion, dest)
+
+        piece_type: int = piece - us * PIECE_TYPES
+        en_passant: int = -1
+        if piece_type == PAWN:
+            self.half_move_clock = 0
+            if dest == self.en_passant:
+                self.remove_piece((us ^ 1) * PIECE_TYPES + PAWN, dest + (8 if us == WHITE else -8))
+            elif abs(dest - from_) == 16:
+                en_passant = (from_ + dest) // 2
+
+        elif piece_type == KING and abs(dest - from_) == 2:
+            rook_from, rook_dest = CASTLING_ROOK_MOVES[dest]
+            self.remove_piece(us * PIECE_TYPES + ROOK, rook_from)
+            self.put_piece(us * PIECE_TYPES + ROOK, rook_dest)
+
+        self.castling_rights &= CASTLING_MASKS[from_] & CASTLING_MASKS[dest]
+        self.en_passant = en_passant
+        self.side = us ^ 1
+        if us == BLACK:
+            self.full_move_number += 1
+
+        self.en_passant_key = self.get_en_passant_key()
+        self.hash ^= CASTLING_KEYS[self.castling_rights] ^ self.en_passant_key
+
+    def unmake_move(self) -> None:
+        undo: UndoInfo = self.history.pop()
+        from_: int = undo.move & MOVE_SQUARE_MASK
+        dest: int = (undo.move >> DEST_SHIFT) & MOVE_SQUARE_MASK
+        promotion: int = undo.move >> PROMOTION_SHIFT
+        us: int = self.side ^ 1
+        moved: int = self.board[dest]
+        piece: int = us * PIECE_TYPES + PAWN if promotion else moved
+
+        self.remove_piece(moved, dest)
+        self.put_piece(piece, from_)
+        if undo.captured != NO_PIECE:
+            self.put_piece(undo.captured, dest)
+
+        piece_type: int = piece - us * PIECE_TYPES
+        if piece_type == PAWN and dest == undo.en_passant:
+            self.put_piece((us ^ 1) * PIECE_TYPES + PAWN, dest + (8 if us == WHITE else -8))
+
+        elif piece_type == KING and abs(dest - from_) == 2:
+            rook_from, rook_dest = CASTLING_ROOK_MOVES[dest]
+            self.remove_piece(us * PIECE_TYPES + ROOK, rook_dest)
+            self.put_piece(us * PIECE_TYPES + ROOK, rook_from)
+
+        if us == BLACK:
+            self.full_move_number -= 1
+        self.side = us
+        self.castling_rights = undo.castling_rights
+        self.en_passant = undo.en_passant
+        self.en_passant_key = undo.en_passant_key
+        self.half_move_clock = undo.half_move_clock
+        self.hash = undo.hash
+
+    def get_captured_piece(self, move: int) -> int:
+        from_: int = move & MOVE_SQUARE_MASK
+        dest: int = (move >> DEST_SHIFT) & MOVE_SQUARE_MASK
+        if self.board[dest] != NO_PIECE:
+            return self.board[dest]
+        if dest == self.en_passant and self.board[from_] == self.side * PIECE_TYPES + PAWN:
+            return (self.side ^ 1) * PIECE_TYPES + PAWN
+        return NO_PIECE
+
+    def has_legal_moves(self) -> bool:
+        return len(self.generate_legal_moves()) > 0
+
+    def is_checkmate(self) -> bool:
+        return self.is_in_check() and not self.has_legal_moves()
+
+    def is_stalemate(self) -> bool:
+        return not self.is_in_check() and not self.has_legal_moves()
+
+    def is_material_insufficient(self) -> bool:
+        pieces: list[int] = self.pieces
+        for side in (WHITE, BLACK):
+            base: int = side * PIECE_TYPES
+            if pieces[base + PAWN] or pieces[base + ROOK] or pieces[base + QUEEN]:
+                return False
+
+        knights: int = pieces[KNIGHT] | pieces[PIECE_TYPES + KNIGHT]
+        bishops: int = pieces[BISHOP] | pieces[PIECE_TYPES + BISHOP]
+        minors: int = bin(knights | bishops).count('1')
+        if minors <= 1:
+            return True
+
+        # any number of bishops can not mate when they all stand on the same square color
+        return not knights and (not bishops & LIGHT_SQUARES or not bishops & DARK_SQUARES)
+
+
+def create_move(from_: int, dest: int, promotion: int = 0) -> int:
+    return from_ | dest << DEST_SHIFT | promotion << PROMOTION_SHIFT
+
+
+def get_move_squares(move: int) -> tuple[int, int]:
+    return move & MOVE_SQUARE_MASK, (move >> DEST_SHIFT) & MOVE_SQUARE_MASK
+
+
+def get_move_promotion(move: int) -> int:
+    return move >> PROMOTION_SHIFT
+
+
+def get_fen_hash(notation: str) -> int:
+    return BitboardPosition(notation).hash
+
+
+def perft(position: BitboardPosition, depth: int) -> int:
+    if depth == 0:
+        return 1
+
+    moves: list[int] = position.generate_legal_moves()
+    if depth == 1:
+        return len(moves)
+
+    nodes: int = 0
+    for move in moves:
+        position.make_move(move)
+        nodes += perft(position, depth - 1)
+        position.unmake_move()
+    return nodes
@@ -0,0 +1,166 @@
+'''
+squares use the same indexing as the rest of the game, 0 is a8 and 63 is h1,
+bit n of a bitboard is set when square n is occupied
+'''
+WHITE: int = 0
+BLACK: int = 1
+
+PAWN: int = 0
+KNIGHT: int = 1
+BISHOP: int = 2
+ROOK: int = 3
+QUEEN: int = 4
+KING: int = 5
+PIECE_TYPES: int = 6
+
+# piece codes are color * PIECE_TYPES + piece type, NO_PIECE marks an empty square
+NO_PIECE: int = -1
+PIECE_CHARS: str = 'PNBRQKpnbrqk'
+PROMOTION_TYPES: tuple[int, ...] = (QUEEN, ROOK, BISHOP, KNIGHT)
+
+# castling rights bits, in the same order as the fen castling field
+WHITE_KING_SIDE: int = 1
+WHITE_QUEEN_SIDE: int = 2
+BLACK_KING_SIDE: int = 4
+BLACK_QUEEN_SIDE: int = 8
+CASTLING_CHARS: tuple[tuple[int, str], ...] = (
+    (WHITE_KING_SIDE, 'K'), (WHITE_QUEEN_SIDE, 'Q'), (BLACK_KING_SIDE, 'k'), (BLACK_QUEEN_SIDE, 'q')
+)
+
+FILES: str = 'abcdefgh'
+FULL_BOARD: int = (1 << 64) - 1
+
+A8, B8, C8, D8, E8, F8, G8, H8 = range(8)
+A1, B1, C1, D1, E1, F1, G1, H1 = range(56, 64)
+
+# (row, file) steps, a row step of -1 moves towards the 8th rank
+NORTH: tuple[int, int] = (-1, 0)
+SOUTH: tuple[int, int] = (1, 0)
+EAST: tuple[int, int] = (0, 1)
+WEST: tuple[int, int] = (0, -1)
+NORTH_EAST: tuple[int, int] = (-1, 1)
+NORTH_WEST: tuple[int, int] = (-1, -1)
+SOUTH_EAST: tuple[int, int] = (1, 1)
+SOUTH_WEST: tuple[int, int] = (1, -1)
+
+# rays pointing towards higher square indexes find their nearest blocker with the lowest set bit,
+# the others with the highest set bit
+ROOK_DIRECTIONS: tuple[tuple[int, int], ...] = (SOUTH, EAST, NORTH, WEST)
+BISHOP_DIRECTIONS: tuple[tuple[int, int], ...] = (SOUTH_EAST, SOUTH_WEST, NORTH_EAST, NORTH_WEST)
+KNIGHT_STEPS: tuple[tuple[int, int], ...] = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+KING_STEPS: tuple[tuple[int, int], ...] = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+
+
+def square_bit(row: int, file: int) -> int:
+    if 0 <= row < 8 and 0 <= file < 8:
+        return 1 << (row * 8 + file)
+    return 0
+
+
+def create_step_table(steps: tuple[tuple[int, int], ...]) -> list[int]:
+    table: list[int] = []
+    for square in range(64):
+        row, file = divmod(square, 8)
+        attacks: int = 0
+        for row_step, file_step in steps:
+            attacks |= square_bit(row + row_step, file + file_step)
+        table.append(attacks)
+    return table
+
+
+def create_ray_table(direction: tuple[int, int]) -> list[int]:
+    table: list[int] = []
+    for square in range(64):
+        row, file = divmod(square, 8)
+        ray: int = 0
+        row, file = row + direction[0], file + direction[1]
+        while bit := square_bit(row, file):
+            ray |= bit
+            row, file = row + direction[0], file + direction[1]
+        table.append(ray)
+    return table
+
+
+def create_between_table() -> list[list[int]]:
+    table: list[list[int]] = [[0] * 64 for _ in range(64)]
+    for direction in ROOK_DIRECTIONS + BISHOP_DIRECTIONS:
+        for square in range(64):
+            row, file = divmod(square, 8)
+            between: int = 0
+            row, file = row + direction[0], file + direction[1]
+            while bit := square_bit(row, file):
+                table[square][bit.bit_length() - 1] = between
+                between |= bit
+                row, file = row + direction[0], file + direction[1]
+    return table
+
+
+KNIGHT_ATTACKS: list[int] = create_step_table(KNIGHT_STEPS)
+KING_ATTACKS: list[int] = create_step_table(KING_STEPS)
+# squares attacked by a pawn of the given color standing on the square
+PAWN_ATTACKS: tuple[list[int], list[int]] = (
+    create_step_table((NORTH_EAST, NORTH_WEST)), create_step_table((SOUTH_EAST, SOUTH_WEST))
+)
+
+# positive rays (towards higher indexes) and negative rays for each slider
+ROOK_POSITIVE_RAYS: tuple[list[int], ...] = (create_ray_table(SOUTH), create_ray_table(EAST))
+ROOK_NEGATIVE_RAYS: tuple[list[int], ...] = (create_ray_table(NORTH), create_ray_table(WEST))
+BISHOP_POSITIVE_RAYS: tuple[list[int], ...] = (create_ray_table(SOUTH_EAST), create_ray_table(SOUTH_WEST))
+BISHOP_NEGATIVE_RAYS: tuple[list[int], ...] = (create_ray_table(NORTH_EAST), create_ray_table(NORTH_WEST))
+
+# every square strictly between two squares on the same line, 0 when they are not aligned
+BETWEEN: list[list[int]] = create_between_table()
+ROOK_LINES: list[int] = [ROOK_POSITIVE_RAYS[0][square] | ROOK_POSITIVE_RAYS[1][square] |
+                         ROOK_NEGATIVE_RAYS[0][square] | ROOK_NEGATIVE_RAYS[1][square] for square in range(64)]
+BISHOP_LINES: list[int] = [BISHOP_POSITIVE_RAYS[0][square] | BISHOP_POSITIVE_RAYS[1][square] |
+                           BISHOP_NEGATIVE_RAYS[0][square] | BISHOP_NEGATIVE_RAYS[1][square] for square in range(64)]
+
+# castling rights that survive a move from or to the square
+CASTLING_MASKS: list[int] = [0b1111] * 64
+CASTLING_MASKS[E1] &= ~(WHITE_KING_SIDE | WHITE_QUEEN_SIDE)
+CASTLING_MASKS[H1] &= ~WHITE_KING_SIDE
+CASTLING_MASKS[A1] &= ~WHITE_QUEEN_SIDE
+CASTLING_MASKS[E8] &= ~(BLACK_KING_SIDE | BLACK_QUEEN_SIDE)
+CASTLING_MASKS[H8] &= ~BLACK_KING_SIDE
+CASTLING_MASKS[A8] &= ~BLACK_QUEEN_SIDE
+
+LIGHT_SQUARES: int = sum(1 << square for square in range(64) if (square // 8 + square % 8) % 2 == 0)
+DARK_SQUARES: int = FULL_BOARD ^ LIGHT_SQUARES
+
+
+def rook_attacks(square: int, occupied: int) -> int:
+    attacks: int = 0
+    for rays in ROOK_POSITIVE_RAYS:
+        ray: int = rays[square]
+        if blockers := ray & occupied:
+            ray ^= rays[(blockers & -blockers).bit_length() - 1]
+        attacks |= ray
+    for rays in ROOK_NEGATIVE_RAYS:
+        ray = rays[square]
+        if blockers := ray & occupied:
+            ray ^= rays[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+
+def bishop_attacks(square: int, occupied: int) -> int:
+    attacks: int = 0
+    for rays in BISHOP_POSITIVE_RAYS:
+        ray: int = rays[square]
+        if blockers := ray & occupied:
+            ray ^= rays[(blockers & -blockers).bit_length() - 1]
+        attacks |= ray
+    for rays in BISHOP_NEGATIVE_RAYS:
+        ray = rays[square]
+        if blockers := ray & occupied:
+            ray ^= rays[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+
+def get_square_name(square: int) -> str:
+    return FILES[square % 8] + str(8 - square // 8)
+
+
+def get_square(name: str) -> int:
+    return (8 - int(name[1])) * 8 + FILES.index(name[0])
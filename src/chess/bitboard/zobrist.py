@@ -0,0 +1,16 @@
+import random
+
+from chess.bitboard.bitboard_tables import PIECE_CHARS
+
+'''
+zobrist keys of the bitboard position: a random number for every piece on every square, for black to move, for every
+set of castling rights and for every en passant file. the hash of a position is the xor of the keys that apply to it.
+the seed is fixed so a position has the same hash in every process and in every run
+'''
+ZOBRIST_SEED: int = 0x5EED_C4E55
+_generator: random.Random = random.Random(ZOBRIST_SEED)
+
+PIECE_KEYS: list[list[int]] = [[_generator.getrandbits(64) for _ in range(64)] for _ in PIECE_CHARS]
+BLACK_TO_MOVE_KEY: int = _generator.getrandbits(64)
+CASTLING_KEYS: list[int] = [_generator.getrandbits(64) for _ in range(16)]
+EN_PASSANT_KEYS: list[int] = [_generator.getrandbits(64) for _ in range(8)]
@@ -7,7 +7,6 @@ from chess.asset.asset_manager import AssetManager
 from chess.board.side import Side
 from chess.game.game_surface import GameSurface
 from chess_engine.notation.algebraic_notation import AlgebraicNotation
-from chess_engine.notation.forsyth_edwards_notation import FenChars
 from config.pg_config import BOARD_SIZE
 
 
@@ -23,6 +22,8 @@ class RenderPos(typing.NamedTuple):
 
 
 class BoardTile:
+    # the piece of the tile lives in the bytearray of the board, the tile is only its square on the screen
+    __slots__ = ('rect', 'algebraic_notation', 'index', 'pieces', 'picked_up')
 
     @staticmethod
     def get_board_tiles_index(side: Side) -> typing.Generator[BoardTileIndex, None, None]:
@@ -37,13 +38,22 @@ class BoardTile:
             self,
             rect: pygame.rect.Rect,
             algebraic_notation: AlgebraicNotation,
-            fen_val: str = FenChars.BLANK_PIECE
+            pieces: bytearray
     ):
         self.rect: pygame.rect.Rect = rect
         self.algebraic_notation: AlgebraicNotation = algebraic_notation
-        self.fen_val: str = fen_val
+        self.index: int = algebraic_notation.index
+        self.pieces: bytearray = pieces
         self.picked_up: bool = False
 
+    @property
+    def fen_val(self) -> str:
+        return chr(self.pieces[self.index])
+
+    @fen_val.setter
+    def fen_val(self, fen_val: str) -> None:
+        self.pieces[self.index] = ord(fen_val)
+
     def get_piece_render_pos(self, board_offset: pygame.math.Vector2,
                              piece_surface: pygame.surface.Surface) -> RenderPos:
         if self.picked_up: return self.get_picked_up_piece_render_pos(piece_surface, board_offset)
@@ -63,8 +73,13 @@ class BoardTile:
         pos = pygame.math.Vector2(piece_rect.x, piece_rect.y) - offset
         return RenderPos(pos.x, pos.y)
 
-    def render(self, board_pos: tuple[int, int]) -> None:
+    def get_render_rect(self, board_pos: tuple[int, int]) -> pygame.rect.Rect:
+        piece_surface = AssetManager.get_piece_surface(self.fen_val)
+        piece_pos: RenderPos = BoardTile.get_piece_render_pos(self, pygame.math.Vector2(board_pos), piece_surface)
+        return piece_surface.get_rect(topleft=(piece_pos.x, piece_pos.y))
+
+    def render(self, board_pos: tuple[int, int]) -> pygame.rect.Rect:
         offset = pygame.math.Vector2(board_pos)
         piece_surface = AssetManager.get_piece_surface(self.fen_val)
         piece_pos: RenderPos = BoardTile.get_piece_render_pos(self, offset, piece_surface)
-        GameSurface.get().blit(piece_surface, (piece_pos.x, piece_pos.y))
+        return GameSurface.get().blit(piece_surface, (piece_pos.x, piece_pos.y))
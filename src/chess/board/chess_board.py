@@ -5,6 +5,7 @@ from chess.board.board_tile import BoardTile
 from chess.board.side import Side
 from chess.game.game_size import GameSize
 from chess.game.game_surface import GameSurface
+from chess_engine.notation.forsyth_edwards_notation import Fen
 from chess_engine.notation.forsyth_edwards_notation import FenChars
 from config.pg_config import BOARD_OUTLINE_THICKNESS
 from config.pg_config import BOARD_SIZE
@@ -21,14 +22,14 @@ class Board:
              (SQUARE_SIZE * BOARD_SIZE * GameSize.get_scale()) + (BOARD_OUTLINE_THICKNESS * 2)))
 
     @staticmethod
-    def create_board_grid(side: Side) -> list[BoardTile]:
+    def create_board_grid(side: Side, pieces: bytearray) -> list[BoardTile]:
         grid = []
         size = pygame.math.Vector2(SQUARE_SIZE * GameSize.get_scale())
         outline_thickness = pygame.math.Vector2(BOARD_OUTLINE_THICKNESS)
         for index in BoardTile.get_board_tiles_index(side):
             pos = pygame.math.Vector2(index.col * size.x, index.row * size.y)
             rect = pygame.rect.Rect(pos + outline_thickness, size)
-            grid.append(BoardTile(rect, index.algebraic_notation))
+            grid.append(BoardTile(rect, index.algebraic_notation, pieces))
         if side is Side.BLACK: grid = grid[::-1]
         return grid
 
@@ -52,7 +53,16 @@ class Board:
         return board_surface
 
     def __init__(self, side: Side):
-        self.grid: list[BoardTile] = Board.create_board_grid(side)
+        # the fen value of every square as one byte, in the order of the square indexes
+        self.pieces: bytearray = bytearray(FenChars.BLANK_PIECE.encode() * (BOARD_SIZE * BOARD_SIZE))
+        self.grid: list[BoardTile] = Board.create_board_grid(side, self.pieces)
+        self.picked_tile: BoardTile | None = None
+        # the tiles in the order the pieces are drawn for each orientation, top row first so tall pieces overlap the
+        # row above them
+        self.render_orders: dict[bool, list[BoardTile]] = {True: self.grid, False: self.grid[::-1]}
+        # the tiles in the order they are drawn, left to right and top to bottom
+        self.screen_tiles: list[BoardTile] = self.grid if side is Side.WHITE else self.grid[::-1]
+        self.square_size: float = SQUARE_SIZE * GameSize.get_scale()
         self.surface: pygame.surface.Surface = Board.create_board_surface(self.grid)
         self.rect: pygame.rect.Rect = self.surface.get_rect()
 
@@ -62,35 +72,61 @@ class Board:
     def reload_theme(self) -> None:
         self.surface = Board.create_board_surface(self.grid)
 
+    def set_pieces(self, fen: Fen) -> None:
+        # a single copy into the bytearray the tiles read their pieces from
+        self.pieces[:] = ''.join(fen.expanded).encode()
+
     def reset_picked_up(self) -> None:
-        for sqr in self.grid: sqr.picked_up = False
+        if self.picked_tile is None: return
+        self.picked_tile.picked_up = False
+        self.picked_tile = None
 
     def get_picked_up(self) -> BoardTile:
-        for sqr in self.grid:
-            if sqr.picked_up: return sqr
-        raise Exception(' no piece picked up ')
+        if self.picked_tile is None: raise Exception(' no piece picked up ')
+        return self.picked_tile
 
     def set_picked_up(self, tile: BoardTile) -> None:
         if tile.fen_val == FenChars.BLANK_PIECE: return
         self.reset_picked_up()
         tile.picked_up = True
+        self.picked_tile = tile
 
     def get_collided_tile(self, game_offset: pygame.rect.Rect,
                           mouse_pos: tuple[int, int] | None = None) -> BoardTile | None:
         if mouse_pos is None: mouse_pos = pygame.mouse.get_pos()
-        board_offset = pygame.math.Vector2(self.rect.topleft) + pygame.math.Vector2(game_offset.topleft)
-        for tile in self.grid:
-            pos = pygame.math.Vector2(mouse_pos) - board_offset
-            if tile.rect.collidepoint((pos.x, pos.y)):
-                return tile
-        return None
+        col: int | None = get_square_coordinate(mouse_pos[0] - self.rect.x - game_offset.x, self.square_size)
+        row: int | None = get_square_coordinate(mouse_pos[1] - self.rect.y - game_offset.y, self.square_size)
+        if col is None or row is None:
+            return None
+        return self.screen_tiles[row * BOARD_SIZE + col]
 
-    def render(self) -> None:
-        GameSurface.get().blit(self.surface, self.rect)
+    def render(self) -> pygame.rect.Rect:
+        return GameSurface.get().blit(self.surface, self.rect)
 
     def render_pieces(self, is_white: bool) -> None:
-        grid = self.grid if is_white else self.grid[::-1]
-        for tile in grid:
-            if tile.fen_val == FenChars.BLANK_PIECE: continue
-            if tile.picked_up: continue
-            tile.render(self.rect.topleft)
+        blank: int = ord(FenChars.BLANK_PIECE)
+        board_x, board_y = self.rect.topleft
+        for tile in self.render_orders[is_white]:
+            piece: int = self.pieces[tile.index]
+            if piece == blank or tile.picked_up: continue
+            # the piece stands on the bottom of its tile, tall pieces reach into the tile above
+            piece_surface = AssetManager.get_piece_surface(chr(piece))
+            GameSurface.get().blit(piece_surface, (board_x + tile.rect.x,
+                                                   board_y + tile.rect.bottom - piece_surface.get_height()))
+
+
+def get_square_coordinate(pos: float, square_size: float) -> int | None:
+    '''
+    the column (or row) of the tile under pos, relative to the board, None outside the tiles. the tile rects are
+    truncated to whole pixels, so the division can land one square short and the gaps between tiles hit nothing
+    '''
+    coordinate: int = int((pos - BOARD_OUTLINE_THICKNESS) // square_size)
+    if coordinate + 1 < BOARD_SIZE and pos >= int((coordinate + 1) * square_size + BOARD_OUTLINE_THICKNESS):
+        coordinate += 1
+    if not 0 <= coordinate < BOARD_SIZE:
+        return None
+
+    start: int = int(coordinate * square_size + BOARD_OUTLINE_THICKNESS)
+    if not start <= pos < start + int(square_size):
+        return None
+    return coordinate
@@ -0,0 +1,87 @@
+import sqlite3
+import threading
+import typing
+
+'''
+engine results kept in a sqlite file so positions analysed in earlier games, like the common openings, are answered
+without asking the engine again. entries are keyed by the fen without its move counters and by the engine settings,
+every hit stamps the entry with a counter and the entries with the lowest stamps are evicted first
+'''
+# share of the entries removed at once when the cache is full, so eviction does not run on every insert
+EVICTION_SHARE: float = 0.1
+
+
+class CacheStats(typing.NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+
+    def get_hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+def normalize_fen(fen: str) -> str:
+    # the half move clock and the full move number do not change the best move
+    return ' '.join(fen.split()[:4])
+
+
+class AnalysisCache:
+    def __init__(self, path: str, size: int) -> None:
+        assert size > 0, "the cache needs room for at least one entry"
+        self.size: int = size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.lock: threading.Lock = threading.Lock()
+        # the engine workers store their results, so the connection is shared between threads behind the lock
+        self.connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS analysis "
+                                "(key TEXT PRIMARY KEY, result TEXT NOT NULL, used INTEGER NOT NULL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS analysis_used ON analysis (used)")
+        self.entries: int = self.connection.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+        self.used: int = self.connection.execute("SELECT COALESCE(MAX(used), 0) FROM analysis").fetchone()[0]
+
+    def get(self, key: str) -> str | None:
+        with self.lock:
+            row: tuple[str] | None = self.connection.execute("SELECT result FROM analysis WHERE key = ?",
+                                                             (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.used += 1
+            self.connection.execute("UPDATE analysis SET used = ? WHERE key = ?", (self.used, key))
+            self.connection.commit()
+            return row[0]
+
+    def put(self, key: str, result: str) -> None:
+        with self.lock:
+            self.used += 1
+            is_new: bool = self.connection.execute("SELECT 1 FROM analysis WHERE key = ?", (key,)).fetchone() is None
+            self.connection.execute("INSERT OR REPLACE INTO analysis (key, result, used) VALUES (?, ?, ?)",
+                                    (key, result, self.used))
+            self.entries += is_new
+            if self.entries > self.size:
+                self.evict()
+            self.connection.commit()
+
+    def evict(self) -> None:
+        count: int = self.entries - self.size + int(self.size * EVICTION_SHARE)
+        self.connection.execute("DELETE FROM analysis WHERE key IN "
+                                "(SELECT key FROM analysis ORDER BY used LIMIT ?)", (count,))
+        self.entries = self.connection.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+
+    def get_stats(self) -> CacheStats:
+        with self.lock:
+            return CacheStats(self.hits, self.misses, self.entries)
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+def get_cache_key(kind: str, fen: str, *settings: object) -> str:
+    return ' '.join([kind, normalize_fen(fen), *map(str, settings)])
@@ -1,140 +1,149 @@
 from __future__ import annotations
 
-import datetime
-from threading import Thread
-from typing import Optional
+import sqlite3
+from concurrent.futures import Future
 
 from chess_engine.movement.validate_move import is_checkmate
-from chess_engine.notation.algebraic_notation import AlgebraicNotation
 from chess_engine.notation.forsyth_edwards_notation import Fen
-from stockfish import Stockfish
-from stockfish.models import StockfishException
 
+from chess.bitboard.bitboard_position import get_fen_hash
 from chess.board.side import Side
+from chess.bot.analysis_cache import AnalysisCache
+from chess.bot.engine_pool import EnginePool
+from chess.bot.engine_pool import EngineSettings
+from chess.bot.opening_book import OpeningBook
+from chess.bot.opening_book import get_uci
+from chess.bot.opening_book import open_or_build_book
+from chess.bot.uci_move import get_move_event
 from chess.chess_player import Player
+from config.logging_manager import AppLoggers
+from config.logging_manager import LoggingManager
+from config.tk_config import ANALYSIS_CACHE_FILE
+from config.tk_config import ANALYSIS_CACHE_SIZE
+from config.tk_config import ENGINE_POOL_SIZE
+from config.tk_config import OPENING_BOOK_FILE
+from config.tk_config import OPENING_BOOK_MAX_PLY
+from config.tk_config import OPENING_BOOK_PGN_FILE
 from config.user_config import UserConfig
-from event.game_events import MoveEvent
 from event.local_event_queue import LocalEvents
 
 
 class StockFishBot:
-    stock_fish: Stockfish | None = None
+    engine_pool: EnginePool | None = None
+    opening_book: OpeningBook | None = None
 
     @staticmethod
     def create_bot(engine_path: str = "stockfish") -> bool:
-        try:
-            StockFishBot.stock_fish = Stockfish(engine_path)
-            return True
-        except FileNotFoundError:
-            return False
-        except OSError:
+        engine_pool: EnginePool = EnginePool(engine_path, ENGINE_POOL_SIZE, StockFishBot.open_cache())
+        if not engine_pool.start():
+            engine_pool.shut_down()
             return False
 
+        if StockFishBot.engine_pool is not None:
+            StockFishBot.engine_pool.shut_down()
+        StockFishBot.engine_pool = engine_pool
+        if StockFishBot.opening_book is None:
+            StockFishBot.opening_book = StockFishBot.open_opening_book()
+        return True
+
+    @staticmethod
+    def open_opening_book() -> OpeningBook | None:
+        try:
+            return open_or_build_book(OPENING_BOOK_FILE, OPENING_BOOK_PGN_FILE, OPENING_BOOK_MAX_PLY)
+        except OSError as err:
+            LoggingManager.get_logger(AppLoggers.BOT).error("could not build the opening book due to : %s", err)
+            return None
+
     @staticmethod
-    def get() -> Stockfish:
-        if StockFishBot.stock_fish is None:
+    def open_cache() -> AnalysisCache | None:
+        # the bot still plays without a cache, every position is just searched again
+        try:
+            return AnalysisCache(ANALYSIS_CACHE_FILE, ANALYSIS_CACHE_SIZE)
+        except sqlite3.Error:
+            return None
+
+    @staticmethod
+    def get() -> EnginePool:
+        if StockFishBot.engine_pool is None:
             raise Exception('stock fish bot not created')
-        return StockFishBot.stock_fish
+        return StockFishBot.engine_pool
 
     def __init__(self, fen: Fen, side: Side, player: Player) -> None:
         self.side: Side = side
         self.fen: Fen = fen
         self.player: Player = player
-        self.move_thread: Thread = self.get_move_thread()
-        StockFishBot.get().update_engine_parameters(
-            {
-                "UCI_Elo": UserConfig.get().data.bot_elo,
-                "Skill Level": UserConfig.get().data.bot_skill_level
-            }
-        )
-
-    def get_best_move(self) -> str | None:
-        player_time_left: float = self.player.timer_gui.own_timer.time_left
-        bot_time_left: float = self.player.timer_gui.opponents_timer.time_left
-        white_time: float = player_time_left if self.player.side is Side.WHITE else bot_time_left
-        black_time: float = player_time_left if self.player.side is Side.BLACK else bot_time_left
+        self.settings: EngineSettings = EngineSettings(UserConfig.get().data.bot_elo,
+                                                       UserConfig.get().data.bot_skill_level)
+        # the search of the side that is moving, its move is played once the pool is done with it
+        self.pending_move: tuple[Side, Future[str | None]] | None = None
 
+    def request_move(self, side: Side) -> None:
         if is_checkmate(self.fen):
-            return None
-
-        # maybe change this to if the fen is invalid return None
-        # this might be cleaner but not so sure about the implications
-        assert StockFishBot.get().is_fen_valid(self.fen.notation), "fen is not valid!"
-        StockFishBot.get().set_fen_position(self.fen.notation)
-
-        try:
-            if UserConfig.get().data.bot_use_time:
-                return StockFishBot.get().get_best_move(wtime=int(white_time * 1000), btime=int(black_time * 1000))
-            else:
-                return StockFishBot.get().get_best_move()
-
-        except StockfishException:
-            return None
+            return
 
-    def get_move_thread(self, side: Optional[Side] = None) -> Thread:
-        if side is None:
-            return Thread(target=self.make_move, daemon=True)
+        # book moves are played straight away, the engine is only asked once the game leaves the book
+        if StockFishBot.opening_book is not None:
+            book_move: int | None = StockFishBot.opening_book.choose_move(get_fen_hash(self.fen.notation))
+            if book_move is not None:
+                self.make_move(side, get_uci(book_move))
+                return
+
+        if UserConfig.get().data.bot_use_time:
+            player_time_left: float = self.player.timer_gui.own_timer.time_left
+            bot_time_left: float = self.player.timer_gui.opponents_timer.time_left
+            white_time: float = player_time_left if self.player.side is Side.WHITE else bot_time_left
+            black_time: float = player_time_left if self.player.side is Side.BLACK else bot_time_left
+            future: Future[str | None] = StockFishBot.get().get_best_move(self.fen.notation, self.settings,
+                                                                          int(white_time * 1000),
+                                                                          int(black_time * 1000))
+        else:
+            future = StockFishBot.get().get_best_move(self.fen.notation, self.settings)
+
+        self.pending_move = side, future
+
+    def is_searching(self) -> bool:
+        # plays the move of a finished search, True while the search is still running
+        if self.pending_move is None:
+            return False
 
-        return Thread(target=self.make_move, args=(side,), daemon=True)
+        side, future = self.pending_move
+        if not future.done():
+            return True
 
-    def make_move(self, side: Side | None = None) -> None:
-        if side is None:
-            side = self.side
+        self.pending_move = None
+        if not future.cancelled() and future.exception() is None:
+            self.make_move(side, future.result())
+        return False
 
-        move: None | str = self.get_best_move()
-        time_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        target_fen: str | None = None
+    def cancel(self) -> None:
+        if self.pending_move is not None:
+            self.pending_move[1].cancel()
+            self.pending_move = None
 
+    def make_move(self, side: Side, move: str | None) -> None:
         # crashed once cause move was None so. ;)
         # crashed during bot v bot, checkmate move
         if move is None:
             return
 
-        # promotion
-        if len(move) == 5:
-            target_fen = move[len(move) - 1:]
-            move = move[:len(move) - 1]
-
-        from_an_val, dest_an_val = move[:2], move[2:]
-        from_an = AlgebraicNotation(*from_an_val)
-        dest_an = AlgebraicNotation(*dest_an_val)
-
-        if target_fen is None:
-            target_fen = self.fen[from_an.index]
-
-        ks_king_index = 62 if self.fen.is_white_turn() else 6
-        qs_king_index = 58 if self.fen.is_white_turn() else 2
-        king_index = 60 if self.fen.is_white_turn() else 4
-
-        if from_an.index == king_index:
-            if dest_an.index == ks_king_index:
-                dest_an = AlgebraicNotation.get_an_from_index(dest_an.index + 1)
-            elif dest_an.index == qs_king_index:
-                dest_an = AlgebraicNotation.get_an_from_index(dest_an.index - 1)
-
-        move_event: MoveEvent = MoveEvent(-1, (from_an.file, from_an.rank), (dest_an.file, dest_an.rank),
-                                          side.name, target_fen, time_iso)
-        LocalEvents.get().add_match_event(move_event)
+        LocalEvents.get().add_match_event(get_move_event(self.fen, side, move))
 
     def play_game(self) -> None:
         if self.player.game_over:
+            self.cancel()
             return
 
-        if self.player.turn:
-            return
-
-        if self.move_thread.is_alive():
+        if self.is_searching() or self.player.turn:
             return
 
-        self.move_thread = self.get_move_thread()
-        self.move_thread.start()
+        self.request_move(self.side)
 
     def play_both_sides(self) -> None:
         if self.player.game_over:
+            self.cancel()
             return
 
-        if self.move_thread.is_alive():
+        if self.is_searching():
             return
 
-        self.move_thread = self.get_move_thread(Side.WHITE if self.fen.is_white_turn() else Side.BLACK)
-        self.move_thread.start()
+        self.request_move(Side.WHITE if self.fen.is_white_turn() else Side.BLACK)
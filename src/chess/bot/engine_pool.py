@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import typing
+from concurrent.futures import Future
+
+from stockfish import Stockfish
+
+from chess.bot.analysis_cache import AnalysisCache
+from chess.bot.analysis_cache import get_cache_key
+from config.logging_manager import AppLoggers
+from config.logging_manager import LoggingManager
+
+'''
+every worker thread owns one stockfish process and takes searches from a queue shared by the pool, so as many
+searches run at once as there are processes. a search carries its own engine settings, the worker only sends
+them to its process when they differ from the previous search. a search is cancelled through its future, it is
+dropped if no worker picked it up yet. with an analysis cache the fixed depth searches of a position that was
+already analysed are answered straight away
+'''
+T = typing.TypeVar('T')
+
+
+class EngineSettings(typing.NamedTuple):
+    elo: int
+    skill_level: int
+
+    def get_parameters(self) -> dict[str, str | int | bool]:
+        return {"UCI_Elo": self.elo, "Skill Level": self.skill_level}
+
+
+class EngineJob(typing.NamedTuple):
+    settings: EngineSettings
+    search: typing.Callable[[Stockfish], typing.Any]
+    future: Future[typing.Any]
+
+
+class EnginePool:
+    def __init__(self, engine_path: str, size: int, cache: AnalysisCache | None = None) -> None:
+        assert size > 0, "the pool needs at least one engine"
+        self.engine_path: str = engine_path
+        self.size: int = size
+        self.cache: AnalysisCache | None = cache
+        self.logger: logging.Logger = LoggingManager.get_logger(AppLoggers.BOT)
+        self.jobs: queue.Queue[EngineJob | None] = queue.Queue()
+        self.workers: list[threading.Thread] = []
+
+    def start(self) -> bool:
+        try:
+            engines: list[Stockfish] = [Stockfish(self.engine_path) for _ in range(self.size)]
+        except (FileNotFoundError, OSError) as err:
+            self.logger.error("could not start stockfish at: %s due to : %s", self.engine_path, err)
+            return False
+
+        for index, engine in enumerate(engines):
+            worker: threading.Thread = threading.Thread(target=self.run_worker, args=(engine,),
+                                                        name=f"engine-worker-{index}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+        return True
+
+    def submit(self, settings: EngineSettings, search: typing.Callable[[Stockfish], T]) -> Future[T]:
+        future: Future[T] = Future()
+        self.jobs.put(EngineJob(settings, search, future))
+        return future
+
+    def get_best_move(self, fen: str, settings: EngineSettings, wtime: int | None = None,
+                      btime: int | None = None) -> Future[str | None]:
+        # a timed search depends on the clocks so it is never cached
+        key: str | None = get_cache_key("bestmove", fen, *settings) if wtime is None and btime is None else None
+        if (cached := self.get_cached(key)) is not None:
+            return get_done_future(cached)
+
+        def search(engine: Stockfish) -> str | None:
+            engine.set_fen_position(fen)
+            move: str | None = engine.get_best_move(wtime=wtime, btime=btime)
+            if move is not None:
+                self.put_cached(key, move)
+            return move
+
+        return self.submit(settings, search)
+
+    def get_evaluation(self, fen: str, settings: EngineSettings) -> Future[dict[str, str | int]]:
+        key: str = get_cache_key("eval", fen, *settings)
+        if (cached := self.get_cached(key)) is not None:
+            return get_done_future(json.loads(cached))
+
+        def search(engine: Stockfish) -> dict[str, str | int]:
+            engine.set_fen_position(fen)
+            evaluation: dict[str, str | int] = engine.get_evaluation()
+            self.put_cached(key, json.dumps(evaluation))
+            return evaluation
+
+        return self.submit(settings, search)
+
+    def get_cached(self, key: str | None) -> str | None:
+        if self.cache is None or key is None:
+            return None
+        return self.cache.get(key)
+
+    def put_cached(self, key: str | None, result: str) -> None:
+        if self.cache is not None and key is not None:
+            self.cache.put(key, result)
+
+    def log_cache_stats(self) -> None:
+        if self.cache is None:
+            return
+        hits, misses, entries = stats = self.cache.get_stats()
+        self.logger.info("analysis cache hits: %s misses: %s hit rate: %.2f entries: %s", hits, misses,
+                         stats.get_hit_rate(), entries)
+
+    def get_pending_count(self) -> int:
+        return self.jobs.qsize()
+
+    def run_worker(self, engine: Stockfish | None) -> None:
+        settings: EngineSettings | None = None
+        while (job := self.jobs.get()) is not None:
+            if not job.future.set_running_or_notify_cancel():
+                continue
+
+            if engine is None:
+                engine, settings = self.restart_engine(), None
+            if engine is None:
+                job.future.set_exception(Exception(f'stockfish at: {self.engine_path} is not running'))
+                continue
+
+            try:
+                if job.settings != settings:
+                    engine.update_engine_parameters(job.settings.get_parameters())
+                    settings = job.settings
+                job.future.set_result(job.search(engine))
+
+            except Exception as err:
+                job.future.set_exception(err)
+                # the process crashed or stopped answering, the next searches get a new one
+                self.logger.error("stockfish failed due to : %s", err)
+                quit_engine(engine)
+                engine, settings = self.restart_engine(), None
+
+        if engine is not None:
+            quit_engine(engine)
+
+    def restart_engine(self) -> Stockfish | None:
+        try:
+            return Stockfish(self.engine_path)
+        except Exception as err:
+            self.logger.error("could not restart stockfish due to : %s", err)
+            return None
+
+    def shut_down(self) -> None:
+        for _ in self.workers:
+            self.jobs.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.workers.clear()
+        if self.cache is not None:
+            self.log_cache_stats()
+            self.cache.close()
+
+
+def quit_engine(engine: Stockfish) -> None:
+    # the process might already be gone
+    try:
+        engine.send_quit_command()
+    except Exception:
+        pass
+
+
+def get_done_future(result: T) -> Future[T]:
+    future: Future[T] = Future()
+    future.set_result(result)
+    return future
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import mmap
+import random
+import re
+import struct
+import typing
+
+from chess.bitboard.bitboard_notation import get_san
+from chess.bitboard.bitboard_position import BitboardPosition
+from chess.bitboard.bitboard_position import get_move_promotion
+from chess.bitboard.bitboard_position import get_move_squares
+from chess.bitboard.bitboard_tables import PIECE_CHARS
+from chess.bitboard.bitboard_tables import get_square_name
+from chess.game.chess_match import MatchResult
+
+'''
+polyglot style book: entries sorted by the zobrist hash of the position, every entry is the hash, a move and its
+weight, so the moves of a position are found with a binary search over the memory mapped file.
+the hashes are the ones of the bitboard position and the moves use the bitboard move encoding, so the file can not
+be read by other polyglot readers
+'''
+# hash, move, weight, learn (unused, keeps the polyglot entry size)
+BOOK_ENTRY: struct.Struct = struct.Struct('>QHHI')
+MAX_WEIGHT: int = 0xFFFF
+# the score of a game for the side that moved, polyglot counts a win twice a draw
+WIN_WEIGHT: int = 2
+DRAW_WEIGHT: int = 1
+MOVE_NUMBER: re.Pattern[str] = re.compile(r'^\d+\.+')
+PGN_RESULTS: tuple[str, ...] = ('1-0', '0-1', '1/2-1/2', '*')
+PGN_RESULT_NAMES: dict[str, str] = {'1-0': MatchResult.WHITE.name, '0-1': MatchResult.BLACK.name,
+                                    '1/2-1/2': MatchResult.DRAW.name}
+
+
+class BookMove(typing.NamedTuple):
+    move: int
+    weight: int
+
+
+class OpeningBook:
+    @staticmethod
+    def open(path: str) -> OpeningBook | None:
+        try:
+            with open(path, 'rb') as book_file:
+                # an empty file can not be mapped
+                if not book_file.read(1):
+                    return None
+                return OpeningBook(mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ))
+        except OSError:
+            return None
+
+    def __init__(self, entries: mmap.mmap) -> None:
+        self.entries: mmap.mmap = entries
+        self.size: int = len(entries) // BOOK_ENTRY.size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def get_hash(self, index: int) -> int:
+        return int(BOOK_ENTRY.unpack_from(self.entries, index * BOOK_ENTRY.size)[0])
+
+    def find_first(self, position_hash: int) -> int:
+        low, high = 0, self.size
+        while low < high:
+            middle: int = (low + high) // 2
+            if self.get_hash(middle) < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def get_moves(self, position_hash: int) -> list[BookMove]:
+        moves: list[BookMove] = []
+        for index in range(self.find_first(position_hash), self.size):
+            entry_hash, move, weight, _ = BOOK_ENTRY.unpack_from(self.entries, index * BOOK_ENTRY.size)
+            if entry_hash != position_hash:
+                break
+            moves.append(BookMove(move, weight))
+        return moves
+
+    def choose_move(self, position_hash: int, generator: random.Random | None = None) -> int | None:
+        # moves are picked in proportion to their weight so the bot does not always play the same opening
+        moves: list[BookMove] = self.get_moves(position_hash)
+        if not moves:
+            return None
+        return (generator or random).choices([move.move for move in moves], [move.weight for move in moves])[0]
+
+    def close(self) -> None:
+        self.entries.close()
+
+
+def get_uci(move: int) -> str:
+    from_, dest = get_move_squares(move)
+    promotion: int = get_move_promotion(move)
+    return get_square_name(from_) + get_square_name(dest) + (PIECE_CHARS[promotion] if promotion else '')
+
+
+def find_san_move(position: BitboardPosition, san: str) -> int | None:
+    legal_moves: list[int] = position.generate_legal_moves()
+    san = san.rstrip('+#!?')
+    for move in legal_moves:
+        if get_san(position, move, legal_moves) == san:
+            return move
+    return None
+
+
+def get_san_tokens(movetext: str) -> list[str]:
+    tokens: list[str] = []
+    for token in movetext.split():
+        token = MOVE_NUMBER.sub('', token)
+        if token and token not in PGN_RESULTS:
+            tokens.append(token)
+    return tokens
+
+
+def get_game_weights(movetext: str, result: str, max_ply: int, weights: dict[tuple[int, int], int]) -> None:
+    position: BitboardPosition = BitboardPosition()
+    for ply, san in enumerate(get_san_tokens(movetext)[:max_ply]):
+        if (move := find_san_move(position, san)) is None:
+            return
+
+        is_white: bool = ply % 2 == 0
+        if result == MatchResult.DRAW.name:
+            weight: int = DRAW_WEIGHT
+        elif (result == MatchResult.WHITE.name) == is_white:
+            weight = WIN_WEIGHT
+        else:
+            weight = 0
+        weights[position.hash, move] = weights.get((position.hash, move), 0) + weight
+        position.make_move(move)
+
+
+def build_book(games: typing.Iterable[tuple[str, str]], path: str, max_ply: int) -> int:
+    '''
+    writes the book of the first max_ply moves of the games, a game is its pgn movetext and its result
+    (WHITE, BLACK or DRAW), moves that never scored are left out. returns the number of entries written
+    '''
+    weights: dict[tuple[int, int], int] = {}
+    for movetext, result in games:
+        get_game_weights(movetext, result, max_ply, weights)
+
+    scored: list[tuple[tuple[int, int], int]] = sorted((entry, weight) for entry, weight in weights.items() if weight)
+    scale: float = min(1.0, MAX_WEIGHT / max((weight for _, weight in scored), default=1))
+    with open(path, 'wb') as book_file:
+        for (position_hash, move), weight in scored:
+            book_file.write(BOOK_ENTRY.pack(position_hash, move, max(1, int(weight * scale)), 0))
+    return len(scored)
+
+
+def read_pgn_games(path: str) -> typing.Iterator[tuple[str, str]]:
+    '''
+    the movetext and result of every game of a pgn file, the tag pairs are skipped
+    '''
+    movetext: list[str] = []
+    with open(path) as pgn_file:
+        for line in pgn_file:
+            line = line.strip()
+            if line.startswith('['):
+                continue
+
+            movetext.append(line)
+            tokens: list[str] = line.split()
+            if tokens and tokens[-1] in PGN_RESULTS:
+                yield ' '.join(movetext), PGN_RESULT_NAMES.get(tokens[-1], '')
+                movetext = []
+
+
+def open_or_build_book(path: str, pgn_path: str, max_ply: int) -> OpeningBook | None:
+    # without a book built from the database games the book of the bundled opening lines is used
+    if (book := OpeningBook.open(path)) is not None:
+        return book
+    build_book(read_pgn_games(pgn_path), path, max_ply)
+    return OpeningBook.open(path)
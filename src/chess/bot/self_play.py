@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import collections
+import logging
+import random
+import time
+import typing
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from chess_engine.movement.piece_movement import PieceMovement
+from chess_engine.notation.forsyth_edwards_notation import Fen
+from stockfish import Stockfish
+
+from chess.bitboard.bitboard_position import get_fen_hash
+from chess.board.side import Side
+from chess.bot.engine_pool import EngineSettings
+from chess.bot.opening_book import OpeningBook
+from chess.bot.opening_book import get_uci
+from chess.bot.opening_book import open_or_build_book
+from chess.bot.uci_move import get_move_event
+from chess.game.chess_match import Match
+from chess.game.chess_match import PGN_RESULTS
+from chess.game.chess_match import PGN_UNFINISHED_RESULT
+from chess.game.move_validator import MatchEngine
+from chess.timer.timer_config import TimerConfig
+from config.logging_manager import AppLoggers
+from config.logging_manager import LoggingManager
+from config.tk_config import OPENING_BOOK_FILE
+from config.tk_config import OPENING_BOOK_MAX_PLY
+from config.tk_config import OPENING_BOOK_PGN_FILE
+from event.game_events import EndGameEvent
+from event.game_events import InvalidMoveEvent
+
+'''
+bot games without pygame: every worker process owns a stockfish process and plays whole games against it through a
+Match, the same match the server validates its games with. the match clocks run on a virtual clock that only moves
+by the time a side spends on its move, so a game takes as long as its searches and not as long as its time control.
+a side spends a share of its time left on every move, the engine searches for that time multiplied by the time scale
+'''
+# a side plans its time as if this many moves were left in the game
+MOVES_TO_GO: int = 30
+# a move never takes more than this share of the time left so the flag does not fall
+MAX_TIME_SHARE: float = 0.5
+
+
+class SelfPlayConfig(typing.NamedTuple):
+    engine_path: str
+    timer_config: TimerConfig
+    match_engine: MatchEngine
+    settings: EngineSettings
+    time_scale: float
+    seed: int
+
+
+class GameRecord(typing.NamedTuple):
+    game_id: int
+    result: str
+    reason: str
+    plies: int
+    movetext: str
+    seconds: float
+
+    def get_pgn(self, config: SelfPlayConfig) -> str:
+        player: str = f"stockfish elo {config.settings.elo} skill {config.settings.skill_level}"
+        tags: list[tuple[str, str]] = [
+            ("Event", "self play"),
+            ("Round", str(self.game_id + 1)),
+            ("White", player),
+            ("Black", player),
+            ("Result", PGN_RESULTS.get(self.result, PGN_UNFINISHED_RESULT)),
+            ("TimeControl", f"{config.timer_config.time:g}+{config.timer_config.increment:g}"),
+            ("Termination", self.reason),
+        ]
+        return ''.join(f'[{name} "{value}"]\n' for name, value in tags) + f"\n{self.movetext}\n\n"
+
+
+class VirtualClock:
+    def __init__(self) -> None:
+        self.now: float = 0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class SelfPlayWorker:
+    # set in every worker process by the pool initializer
+    engine: Stockfish | None = None
+    opening_book: OpeningBook | None = None
+
+    @staticmethod
+    def start(engine_path: str) -> None:
+        PieceMovement.load()
+        SelfPlayWorker.engine = Stockfish(engine_path)
+        SelfPlayWorker.opening_book = OpeningBook.open(OPENING_BOOK_FILE)
+
+    @staticmethod
+    def get() -> Stockfish:
+        if SelfPlayWorker.engine is None:
+            raise Exception('self play worker not started')
+        return SelfPlayWorker.engine
+
+
+def get_think_time(match: Match, side: Side) -> float:
+    time_left: float = match.white_time_left if side is Side.WHITE else match.black_time_left
+    return min(time_left * MAX_TIME_SHARE, time_left / MOVES_TO_GO + match.timer_config.increment)
+
+
+def get_book_move(fen: Fen, generator: random.Random) -> str | None:
+    if SelfPlayWorker.opening_book is None:
+        return None
+    book_move: int | None = SelfPlayWorker.opening_book.choose_move(get_fen_hash(fen.notation), generator)
+    return None if book_move is None else get_uci(book_move)
+
+
+def play_game(config: SelfPlayConfig, game_id: int) -> GameRecord:
+    engine: Stockfish = SelfPlayWorker.get()
+    engine.update_engine_parameters(config.settings.get_parameters())
+    # the book moves differ between games but a game is the same every time it is played with the same seed
+    generator: random.Random = random.Random(config.seed + game_id)
+    clock: VirtualClock = VirtualClock()
+    match: Match = Match(config.timer_config, config.match_engine, clock)
+    reason: str = ''
+    start: float = time.perf_counter()
+
+    while not match.is_over():
+        fen: Fen = match.get_fen()
+        side: Side = Side.WHITE if fen.is_white_turn() else Side.BLACK
+        if (move := get_book_move(fen, generator)) is None:
+            think_time: float = get_think_time(match, side)
+            engine.set_fen_position(fen.notation)
+            move = engine.get_best_move_time(max(1, int(think_time * config.time_scale * 1000)))
+            clock.advance(think_time)
+
+        # no legal move left, the match should have ended the game already
+        if move is None:
+            break
+
+        for event in match.process_game_event(get_move_event(fen, side, move)):
+            if isinstance(event, InvalidMoveEvent):
+                raise Exception(f'game: {game_id} engine move: {move} rejected in position: {fen.notation}')
+            if isinstance(event, EndGameEvent):
+                reason = event.reason
+
+    return GameRecord(game_id, match.result or '', reason, len(match.move_record), match.get_pgn(),
+                      time.perf_counter() - start)
+
+
+def run_self_play(config: SelfPlayConfig, games: int, workers: int | None, pgn_path: str) -> None:
+    '''
+    plays the games on a pool of worker processes, writes every game to the pgn file as soon as it is over and logs
+    the results and the throughput
+    '''
+    logger: logging.Logger = LoggingManager.get_logger(AppLoggers.BOT)
+    # built once here, the workers only read it
+    try:
+        if (book := open_or_build_book(OPENING_BOOK_FILE, OPENING_BOOK_PGN_FILE, OPENING_BOOK_MAX_PLY)) is not None:
+            book.close()
+    except OSError as err:
+        logger.error("could not build the opening book due to : %s", err)
+
+    results: collections.Counter[str] = collections.Counter()
+    reasons: collections.Counter[str] = collections.Counter()
+    plies: int = 0
+    failed: int = 0
+    start: float = time.perf_counter()
+    with open(pgn_path, 'w') as pgn_file, ProcessPoolExecutor(workers, initializer=SelfPlayWorker.start,
+                                                              initargs=(config.engine_path,)) as executor:
+        futures: list[Future[GameRecord]] = [executor.submit(play_game, config, game_id) for game_id in range(games)]
+        for future in as_completed(futures):
+            try:
+                record: GameRecord = future.result()
+            except BrokenProcessPool as err:
+                logger.error("self play workers stopped due to : %s", err)
+                return
+            except Exception as err:
+                failed += 1
+                logger.error("self play game failed due to : %s", err)
+                continue
+
+            pgn_file.write(record.get_pgn(config))
+            results[record.result or PGN_UNFINISHED_RESULT] += 1
+            reasons[record.reason] += 1
+            plies += record.plies
+            logger.debug("game %s: %s %s after %s plies in %.2fs", record.game_id + 1, record.result,
+                         record.reason, record.plies, record.seconds)
+
+    seconds: float = time.perf_counter() - start
+    played: int = sum(results.values())
+    logger.info("played %s games in %.1fs, %.0f games per hour, %.0f plies per second", played, seconds,
+                played / seconds * 3600, plies / seconds)
+    logger.info("results: %s, failed: %s", dict(results), failed)
+    logger.info("terminations: %s", dict(reasons))
@@ -0,0 +1,40 @@
+import datetime
+
+from chess_engine.notation.algebraic_notation import AlgebraicNotation
+from chess_engine.notation.forsyth_edwards_notation import Fen
+
+from chess.board.side import Side
+from event.game_events import MoveEvent
+
+
+def get_move_event(fen: Fen, side: Side, move: str) -> MoveEvent:
+    '''
+    the move event of an engine move in uci notation, castling is sent as the king dropped next to the rook
+    '''
+    time_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    target_fen: str | None = None
+
+    # promotion
+    if len(move) == 5:
+        target_fen = move[len(move) - 1:]
+        move = move[:len(move) - 1]
+
+    from_an_val, dest_an_val = move[:2], move[2:]
+    from_an = AlgebraicNotation(*from_an_val)
+    dest_an = AlgebraicNotation(*dest_an_val)
+
+    if target_fen is None:
+        target_fen = fen[from_an.index]
+
+    ks_king_index = 62 if fen.is_white_turn() else 6
+    qs_king_index = 58 if fen.is_white_turn() else 2
+    king_index = 60 if fen.is_white_turn() else 4
+
+    # a rook can make the same move as a castling king
+    if from_an.index == king_index and target_fen.lower() == 'k':
+        if dest_an.index == ks_king_index:
+            dest_an = AlgebraicNotation.get_an_from_index(dest_an.index + 1)
+        elif dest_an.index == qs_king_index:
+            dest_an = AlgebraicNotation.get_an_from_index(dest_an.index - 1)
+
+    return MoveEvent(-1, (from_an.file, from_an.rank), (dest_an.file, dest_an.rank), side.name, target_fen, time_iso)
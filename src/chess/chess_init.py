@@ -4,6 +4,7 @@ from chess.asset.asset_manager import AssetManager
 from chess.asset.chess_assets import ChessTheme
 from chess.asset.chess_assets import PieceSetAsset
 from chess.asset.chess_assets import PieceSetAssets
+from chess.asset.font_manager import FontManager
 from chess.board.chess_board import Board
 from chess.game.game_size import GameSize
 from chess.game.game_surface import GameSurface
@@ -18,12 +19,14 @@ from gui.timer_gui import TimerGui
 from gui.timer_gui import TimerRects
 
 
-def init_chess(theme: ChessTheme, piece_set: PieceSetAsset, scale: float) -> None:
+def init_chess(theme: ChessTheme, piece_set: PieceSetAsset, scale: float, vsync: bool = False) -> None:
     GameSize.reset()
     pygame.init()
 
     PieceMovement.load()
     GameSize.load_scale(scale)
+    # before any gui measures its text, the fonts of the previous game were closed by pygame.quit
+    FontManager.load(scale, theme)
 
     board_rect: pygame.rect.Rect = Board.calculate_board_rect()
     end_game_rect: pygame.rect.Rect = EndGameGui.calculate_end_game_rect()
@@ -44,16 +47,16 @@ def init_chess(theme: ChessTheme, piece_set: PieceSetAsset, scale: float) -> Non
     GameSize.add_rects_height(timer_rects.timer, timer_rects.spacing, board_rect, axis_rects.x_axis, timer_rects.timer)
 
     GameSurface.create_surface()
-    pygame.display.set_mode(calculate_window_size(*GameSurface.get().get_size()))
+    GameSurface.create_display(calculate_window_size(*GameSurface.get().get_size()), vsync)
     pygame.display.set_caption("")
 
     AssetManager.load_theme(theme)
     GameSurface.get().fill(AssetManager.get_theme().primary_dark)
     pygame.display.get_surface().fill(AssetManager.get_theme().primary_dark)
 
-    AssetManager.load_pieces(PieceSetAssets.NORMAL16x16, scale)
-    pygame.display.set_icon(AssetManager.get_piece_surface(FenChars.get_piece_fen(FenChars.DEFAULT_KING, False)))
     AssetManager.load_pieces(piece_set, scale)
+    icon_pieces = AssetManager.load_pieces_surfaces(PieceSetAssets.NORMAL16x16, scale)
+    pygame.display.set_icon(icon_pieces[FenChars.get_piece_fen(FenChars.DEFAULT_KING, False)])
 
 
 def calculate_window_size(width: int, height: int) -> tuple[int, int]:
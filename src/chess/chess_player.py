@@ -68,8 +68,9 @@ class Player:
     @staticmethod
     def get_player_local(side: Side, match: Match, game_offset: pygame.rect.Rect) -> Player:
         player = Player(side, match.timer_config.time, game_offset)
-        player.update_turn(match.fen)
-        player.update_pieces_location(match.fen)
+        match_fen: Fen = match.get_fen()
+        player.update_turn(match_fen)
+        player.update_pieces_location(match_fen)
         return player
 
     def __init__(self, side: Side, time_left: float, game_offset: pygame.rect.Rect):
@@ -89,6 +90,9 @@ class Player:
         self.timed_out: bool = False
         self.final_render: bool = True
         self.match_id: Optional[int] = None
+        self.dirty_rects: list[pygame.rect.Rect] = []
+        # where the picked up piece was drawn during the last frame
+        self.drag_rect: pygame.rect.Rect | None = None
 
         self.promotion_gui: PromotionGui = PromotionGui(self.side, self.board.get_rect())
         self.captured_gui: CapturedGui = CapturedGui('', self.board.get_rect())
@@ -285,48 +289,77 @@ class Player:
         self.end_game_gui.resign.set_hover(True)
         self.state = State.PICK_PIECE
 
-    def render(self) -> None:
+    def render(self) -> list[pygame.rect.Rect]:
+        # regions of the game surface drawn since the last call, the launchers only update these on the display
+        dirty_rects: list[pygame.rect.Rect] = self.dirty_rects
+        self.dirty_rects = []
+
         if self.game_over:
             if not pygame.get_init():
-                return
-            self.end_game_gui.game_over_gui.quit_button.render(self.game_offset)
-            return
+                return dirty_rects
+            dirty_rects.append(self.end_game_gui.game_over_gui.quit_button.render(self.game_offset))
+            return dirty_rects
 
-        self.timer_gui.render()
-        self.axis_gui.render()
-        self.played_moves_gui.render()
-        self.end_game_gui.render(self.game_offset)
+        if self.is_render_required or self.is_drag_outside_board():
+            self.render_all()
+            dirty_rects.append(GameSurface.get().get_rect())
 
-        if self.is_render_required or self.state is State.DROP_PIECE:
-            GameSurface.get().fill(AssetManager.get_theme().primary_dark)
-            self.timer_gui.render()
-            self.end_game_gui.render(self.game_offset)
-            self.captured_gui.render(self.side)
-            self.board.render()
-            self.axis_gui.render()
-            self.played_moves_gui.render()
-            self.previous_move_gui.render()
-            self.board.render_pieces(self.side is Side.WHITE)
+        else:
+            dirty_rects.extend(self.timer_gui.render())
+            dirty_rects.extend(self.axis_gui.render())
+            dirty_rects.extend(self.played_moves_gui.render())
+            dirty_rects.extend(self.end_game_gui.render(self.game_offset))
             if self.state is State.DROP_PIECE:
-                picked: BoardTile = self.board.get_picked_up()
-                self.available_moves_gui.render(picked, self.board, self.side, self.turn)
-                picked.render(self.game_offset.topleft)
+                dirty_rects.append(self.render_board())
 
         if self.state is State.PICKING_PROMOTION:
-            self.promotion_gui.render()
+            dirty_rects.extend(self.promotion_gui.render())
 
         if self.state is State.RESPOND_DRAW or \
                 self.state is State.DRAW_DOUBLE_CHECK or \
                 self.state is State.RESIGN_DOUBLE_CHECK:
-            self.verify_gui.render(self.game_offset)
+            dirty_rects.extend(self.verify_gui.render(self.game_offset))
 
         self.set_require_render(False)
+        return dirty_rects
+
+    def render_all(self) -> None:
+        GameSurface.get().fill(AssetManager.get_theme().primary_dark)
+        self.timer_gui.render(True)
+        self.end_game_gui.render(self.game_offset)
+        self.captured_gui.render(self.side)
+        self.axis_gui.render(True)
+        self.played_moves_gui.render(True)
+        self.render_board()
+
+    def render_board(self) -> pygame.rect.Rect:
+        board_rect: pygame.rect.Rect = self.board.render()
+        self.previous_move_gui.render()
+        self.board.render_pieces(self.side is Side.WHITE)
+        self.drag_rect = None
+        if self.state is State.DROP_PIECE:
+            picked: BoardTile = self.board.get_picked_up()
+            self.available_moves_gui.render(picked, self.board, self.side, self.turn)
+            self.drag_rect = picked.render(self.game_offset.topleft)
+        return board_rect
+
+    def is_drag_outside_board(self) -> bool:
+        # the dragged piece only stays within the redrawn board region while it is over the board
+        if self.state is not State.DROP_PIECE:
+            return False
+        if self.drag_rect is not None and not self.board.rect.contains(self.drag_rect):
+            return True
+        return not self.board.rect.contains(self.board.get_picked_up().get_render_rect(self.game_offset.topleft))
+
+    def is_idle(self) -> bool:
+        # nothing on screen changes on its own while no clock is running and no piece is dragged
+        if self.game_over:
+            return True
+        return not self.timer_gui.is_running() and self.state is not State.DROP_PIECE
 
     def update_pieces_location(self, fen: Fen) -> None:
-        for index, fen_val in enumerate(fen.expanded):
-            tile = self.board.grid[index]
-            tile.fen_val = fen_val
-            self.available_moves_gui.update_available_moves(fen, self.side, index)
+        self.board.set_pieces(fen)
+        self.available_moves_gui.update_available_moves(fen)
         self.set_require_render(True)
 
     def end_game(self, game_result: str, result_type: str) -> None:
@@ -339,6 +372,7 @@ class Player:
         self.end_game_gui.game_over_gui.set_final_frame(game_result, result_type)
         if self.final_render:
             self.end_game_gui.game_over_gui.render(self.game_offset)
+            self.dirty_rects.append(GameSurface.get().get_rect())
 
     def update_turn(self, fen: Fen) -> None:
         if self.side is Side.WHITE:
@@ -1,21 +1,16 @@
-import datetime
 import enum
+import time
+import typing
 
-from chess_engine.movement.validate_move import is_checkmate
-from chess_engine.movement.validate_move import is_material_insufficient
-from chess_engine.movement.validate_move import is_move_valid
-from chess_engine.movement.validate_move import is_stale_mate
-from chess_engine.movement.validate_move import is_take
 from chess_engine.notation.algebraic_notation import AlgebraicNotation
 from chess_engine.notation.forsyth_edwards_notation import Fen
-from chess_engine.notation.forsyth_edwards_notation import FenChars
-from chess_engine.notation.forsyth_edwards_notation import encode_fen_data
-from chess_engine.notation.forsyth_edwards_notation import validate_fen_castling_rights
-from chess_engine.notation.forsyth_edwards_notation import validate_fen_en_passant_rights
-from chess_engine.notation.forsyth_edwards_notation import validate_fen_piece_placement
 
 from chess.board.side import Side
+from chess.game.move_record import MoveRecord
+from chess.game.move_validator import MatchEngine
+from chess.game.move_validator import MoveValidator
 from chess.timer.timer_config import TimerConfig
+from config.pg_config import ABANDONMENT
 from config.pg_config import AGREEMENT
 from config.pg_config import CHECKMATE
 from config.pg_config import FIFTY_MOVE_RULE
@@ -49,38 +44,81 @@ class MatchResult(enum.Enum):
     DRAW = enum.auto()
 
 
+PGN_RESULTS: dict[str, str] = {
+    MatchResult.WHITE.name: '1-0',
+    MatchResult.BLACK.name: '0-1',
+    MatchResult.DRAW.name: '1/2-1/2',
+}
+PGN_UNFINISHED_RESULT: str = '*'
+
+
 class RepetitionCounter:
     def __init__(self) -> None:
-        self.reached_positions: dict[str, int] = {}
+        # zobrist hash of every position since the last irreversible move, the side to move is part of the hash
+        self.reached_positions: dict[int, int] = {}
         self.three_fold_repetition: bool = False
 
-    def add_position(self, piece_placement: str, en_passant: str, castling_rights: str) -> None:
-        validate_fen_piece_placement(piece_placement)
-        validate_fen_en_passant_rights(en_passant)
-        validate_fen_castling_rights(castling_rights)
-        position = piece_placement + en_passant + castling_rights
-        if position not in self.reached_positions:
-            self.reached_positions[position] = 1
-            return
+    def add_position(self, position_hash: int, is_irreversible: bool) -> None:
+        # positions before a capture or a pawn move can never be reached again
+        if is_irreversible:
+            self.reached_positions.clear()
 
-        if self.reached_positions[position] >= 2:
+        count: int = self.reached_positions.get(position_hash, 0) + 1
+        self.reached_positions[position_hash] = count
+        if count >= 3:
             self.three_fold_repetition = True
-        else:
-            self.reached_positions[position] += 1
 
     def is_three_fold_repetition(self) -> bool:
         return self.three_fold_repetition
 
 
 class Match:
-    def __init__(self, timer_config: TimerConfig):
-        self.fen: Fen = Fen()
+    def __init__(self, timer_config: TimerConfig, engine: MatchEngine = MatchEngine.CHESS_ENGINE,
+                 clock: typing.Callable[[], float] = time.monotonic, is_local: bool = False):
+        self.validator: MoveValidator = MoveValidator.create(engine)
         self.captured_pieces: str = ''
         self.timer_config = timer_config
-        self.prev_time: datetime.datetime | None = None
+        # monotonic time unless the match is played on a virtual clock
+        self.clock: typing.Callable[[], float] = clock
+        # the players of a local match run its clocks, a server match is only ended by its own clock
+        self.is_local: bool = is_local
+        # clock time of the last move, the clocks only start running after the first move
+        self.prev_time: float | None = None
         self.white_time_left: float = timer_config.time
         self.black_time_left: float = timer_config.time
         self.repetition_counter: RepetitionCounter = RepetitionCounter()
+        self.repetition_counter.add_position(self.validator.get_position_hash(), True)
+        self.move_record: MoveRecord = MoveRecord()
+        self.result: str | None = None
+
+    def get_fen(self) -> Fen:
+        return self.validator.get_fen()
+
+    def is_over(self) -> bool:
+        return self.result is not None
+
+    def get_pgn(self) -> str:
+        return self.move_record.get_pgn(PGN_RESULTS.get(self.result or '', PGN_UNFINISHED_RESULT))
+
+    def get_flag_deadline(self) -> float | None:
+        # monotonic time the clock of the side to move runs out
+        if self.prev_time is None or self.is_over():
+            return None
+        return self.prev_time + (self.white_time_left if self.validator.is_white_turn() else self.black_time_left)
+
+    def check_flag(self, now: float) -> list[GameEvent]:
+        deadline: float | None = self.get_flag_deadline()
+        if deadline is None or now < deadline:
+            return []
+
+        side: Side = Side.WHITE if self.validator.is_white_turn() else Side.BLACK
+        if side is Side.WHITE:
+            self.white_time_left = 0
+        else:
+            self.black_time_left = 0
+        end_game: EndGameEvent = EndGameEvent(-1, side.get_opposite().name, TIMEOUT)
+        self.result = end_game.result
+        return [end_game]
 
     def process_game_event(self, game_event: GameEvent) -> list[GameEvent]:
         response: list[GameEvent] = []
@@ -89,7 +127,7 @@ class Match:
             response.append(OpponentPromotionEvent(-1))
 
         elif isinstance(game_event, MoveEvent):
-            response.extend(self.process_move_event(game_event, Fen(encode_fen_data(self.fen.data))))
+            response.extend(self.process_move_event(game_event))
 
         elif isinstance(game_event, ResignEvent):
             response.append(EndGameEvent(-1, Side[game_event.side].get_opposite().name, RESIGNATION))
@@ -104,15 +142,28 @@ class Match:
                 response.append(ContinueGameEvent(-1))
 
         elif isinstance(game_event, TimeOutEvent):
-            response.append(EndGameEvent(-1, Side[game_event.side].get_opposite().name, TIMEOUT))
+            if self.is_local:
+                response.append(EndGameEvent(-1, Side[game_event.side].get_opposite().name, TIMEOUT))
+            else:
+                # a client can not flag its opponent, the flag only falls once the deadline of the server passed
+                response.extend(self.check_flag(self.clock()))
 
         else:
             assert False, f" {game_event.type.name} : event not recognised"
 
         response.extend(self.check_for_draws(response))
+        for event in response:
+            if isinstance(event, EndGameEvent):
+                self.result = event.result
 
         return response
 
+    def abandon(self, side: str) -> list[GameEvent]:
+        # the server forfeits the match of a player who disconnected
+        end_game: EndGameEvent = EndGameEvent(-1, Side[side].get_opposite().name, ABANDONMENT)
+        self.result = end_game.result
+        return [end_game]
+
     def process_local_move(self) -> None:
         local_events: LocalEvents = LocalEvents.get()
         if (event := local_events.get_match_event()) is None:
@@ -121,44 +172,45 @@ class Match:
         for game_event in self.process_game_event(event):
             local_events.add_player_event(game_event)
 
-    def process_move_event(self, move: MoveEvent, before_move_fen: Fen) -> list[GameEvent]:
+    def process_move_event(self, move: MoveEvent) -> list[GameEvent]:
         from_index: int = AlgebraicNotation.get_index_from_an(*move.from_)
         dest_index: int = AlgebraicNotation.get_index_from_an(*move.dest)
+        is_white_turn: bool = self.validator.is_white_turn()
 
-        if not is_side_valid(move.side, self.fen.is_white_turn()) or \
-                not is_move_valid(from_index, dest_index, self.fen):
+        if not is_side_valid(move.side, is_white_turn):
+            return [InvalidMoveEvent(-1)]
+
+        # the clocks are timed by the match, the time the client sent with the move is not trusted
+        now: float = self.clock()
+        if flag_fall := self.check_flag(now):
+            return flag_fall
+
+        captured_piece: str | None = self.validator.make_move(from_index, dest_index, move.target_fen)
+        if captured_piece is None:
             return [InvalidMoveEvent(-1)]
 
-        time: datetime.datetime = datetime.datetime.fromisoformat(move.time_iso)
         if self.prev_time is not None:
-            diff = time - self.prev_time
-            if self.fen.data.active_color == FenChars.WHITE_ACTIVE_COLOR:
-                self.white_time_left -= diff.total_seconds()
+            if is_white_turn:
+                self.white_time_left -= now - self.prev_time
                 self.white_time_left += self.timer_config.increment
             else:
-                self.black_time_left -= diff.total_seconds()
+                self.black_time_left -= now - self.prev_time
                 self.black_time_left += self.timer_config.increment
 
-        self.prev_time = time
-        self.fen.make_move(from_index, dest_index, move.target_fen)
-        self.repetition_counter.add_position(self.fen.data.piece_placement, self.fen.data.en_passant_rights,
-                                             self.fen.data.castling_rights)
+        self.prev_time = now
+        self.move_record.add_move(from_index, dest_index, move.target_fen)
+        self.repetition_counter.add_position(self.validator.get_position_hash(),
+                                             self.validator.get_half_move_clock() == 0)
 
-        response: list[GameEvent] = [UpdateFenEvent(-1, self.fen.notation, self.white_time_left, self.black_time_left,
-                                                    from_index, dest_index)]
+        response: list[GameEvent] = [UpdateFenEvent(-1, self.validator.get_notation(), self.white_time_left,
+                                                    self.black_time_left, from_index, dest_index)]
 
-        is_en_passant: bool = before_move_fen.is_move_en_passant(from_index, dest_index)
-        opponent_pawn_fen: str = FenChars.get_piece_fen(FenChars.DEFAULT_PAWN, not before_move_fen.is_white_turn())
-
-        if is_take(before_move_fen, dest_index, is_en_passant, before_move_fen.is_move_castle(from_index, dest_index)):
-            if is_en_passant:
-                self.captured_pieces += opponent_pawn_fen
-            else:
-                self.captured_pieces += before_move_fen[dest_index]
+        if captured_piece:
+            self.captured_pieces += captured_piece
             response.append(UpdateCapturedPiecesEvent(-1, self.captured_pieces))
 
-        if is_checkmate(self.fen, self.fen.is_white_turn()):
-            result: str = MatchResult.BLACK.name if self.fen.is_white_turn() else MatchResult.WHITE.name
+        if self.validator.is_checkmate():
+            result: str = MatchResult.BLACK.name if self.validator.is_white_turn() else MatchResult.WHITE.name
             end_game: EndGameEvent = EndGameEvent(-1, result, CHECKMATE)
             response.append(end_game)
 
@@ -170,15 +222,15 @@ class Match:
                 return []
 
         # Stalemate
-        if is_stale_mate(self.fen):
+        if self.validator.is_stalemate():
             return [EndGameEvent(-1, MatchResult.DRAW.name, STALEMATE)]
 
         # Insufficient Material
-        if is_material_insufficient(self.fen):
+        if self.validator.is_material_insufficient():
             return [EndGameEvent(-1, MatchResult.DRAW.name, INSUFFICIENT_MATERIAL)]
 
         # 50 move-rule
-        if int(self.fen.data.half_move_clock) >= HALF_MOVE_LIMIT:
+        if self.validator.get_half_move_clock() >= HALF_MOVE_LIMIT:
             return [EndGameEvent(-1, MatchResult.DRAW.name, FIFTY_MOVE_RULE)]
 
         # Repetition
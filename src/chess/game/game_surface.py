@@ -5,6 +5,7 @@ from chess.game.game_size import GameSize
 
 class GameSurface:
     surface: pygame.surface.Surface | None = None
+    is_vsync: bool = False
 
     @staticmethod
     def get() -> pygame.surface.Surface:
@@ -16,3 +17,46 @@ class GameSurface:
     @staticmethod
     def create_surface() -> None:
         GameSurface.surface = pygame.surface.Surface((GameSize.get_width(), GameSize.get_height()))
+
+    @staticmethod
+    def create_display(size: tuple[int, int], vsync: bool) -> None:
+        # vsync is only available for scaled or opengl displays, not every driver supports it
+        if vsync:
+            try:
+                pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+                GameSurface.is_vsync = True
+                return
+            except pygame.error:
+                pass
+
+        GameSurface.is_vsync = False
+        pygame.display.set_mode(size)
+
+    @staticmethod
+    def update_display(game_offset: pygame.rect.Rect, dirty_rects: list[pygame.rect.Rect]) -> None:
+        """
+        copies the changed regions of the game surface to the window and only updates those regions,
+        the whole window is flipped when the whole game surface changed or when vsync is on,
+        a vsync display presents the whole frame and the flip waits for the refresh
+        """
+        display: pygame.surface.Surface | None = pygame.display.get_surface()
+        if display is None or not dirty_rects:
+            return
+
+        game_rect: pygame.rect.Rect = GameSurface.get().get_rect()
+        if game_rect in dirty_rects:
+            display.blit(GameSurface.get(), game_offset)
+            pygame.display.flip()
+            return
+
+        display_rects: list[pygame.rect.Rect] = []
+        for rect in dirty_rects:
+            rect = rect.clip(game_rect)
+            display_rect: pygame.rect.Rect = rect.move(game_offset.topleft)
+            display.blit(GameSurface.get(), display_rect, rect)
+            display_rects.append(display_rect)
+
+        if GameSurface.is_vsync:
+            pygame.display.flip()
+        else:
+            pygame.display.update(display_rects)
@@ -0,0 +1,65 @@
+from array import array
+
+from chess.bitboard.bitboard_notation import get_san
+from chess.bitboard.bitboard_tables import PAWN
+from chess.bitboard.bitboard_tables import PIECE_CHARS
+from chess.bitboard.bitboard_tables import PIECE_TYPES
+from chess.bitboard.bitboard_tables import get_square_name
+from chess.game.move_validator import BitboardValidator
+from config.logging_manager import AppLoggers
+from config.logging_manager import LoggingManager
+
+'''
+every move is stored as a 16 bit code: from square (6 bits), dest square (6 bits) and the type of the piece
+standing on the dest square after the move (3 bits), it only differs from the moved piece on a promotion.
+the squares are the ones the players sent, castling is the king dropped on the rook or next to it
+'''
+MOVE_CODE_TYPE: str = 'H'
+SQUARE_MASK: int = 0b111111
+DEST_SHIFT: int = 6
+PIECE_SHIFT: int = 12
+
+
+class MoveRecord:
+    def __init__(self) -> None:
+        self.moves: array[int] = array(MOVE_CODE_TYPE)
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def add_move(self, from_index: int, dest_index: int, target_fen: str) -> None:
+        piece: int = PIECE_CHARS.find(target_fen.lower(), PIECE_TYPES) - PIECE_TYPES
+        if piece < 0:
+            piece = PAWN
+        self.moves.append(from_index | dest_index << DEST_SHIFT | piece << PIECE_SHIFT)
+
+    def get_pgn(self, result: str) -> str:
+        '''
+        replays the recorded moves to write the pgn movetext, only done once when the game is over.
+        the game is still stored and sent when the replay rejects a move the match engine played, the movetext then
+        stops at that move with a comment
+        '''
+        validator: BitboardValidator = BitboardValidator()
+        tokens: list[str] = []
+        for ply, code in enumerate(self.moves):
+            from_index: int = code & SQUARE_MASK
+            dest_index: int = (code >> DEST_SHIFT) & SQUARE_MASK
+            target_fen: str = PIECE_CHARS[PIECE_TYPES + (code >> PIECE_SHIFT)]
+            move: int | None = validator.find_move(from_index, dest_index, target_fen)
+            if move is None:
+                LoggingManager.get_logger(AppLoggers.SERVER).error("recorded move: %s is not legal in position: %s",
+                                                                  code, validator.get_notation())
+                tokens.append(f'{{{get_square_name(from_index)}{get_square_name(dest_index)} is not legal}}')
+                break
+
+            san: str = get_san(validator.position, move, validator.get_legal_moves())
+            validator.make_move(from_index, dest_index, target_fen)
+            if validator.position.is_in_check():
+                san += '#' if not validator.get_legal_moves() else '+'
+
+            if ply % 2 == 0:
+                tokens.append(f'{ply // 2 + 1}.')
+            tokens.append(san)
+
+        tokens.append(result)
+        return ' '.join(tokens)
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import enum
+import typing
+from abc import ABC
+from abc import abstractmethod
+
+from chess_engine.movement.validate_move import is_checkmate
+from chess_engine.movement.validate_move import is_material_insufficient
+from chess_engine.movement.validate_move import is_move_valid
+from chess_engine.movement.validate_move import is_stale_mate
+from chess_engine.movement.validate_move import is_take
+from chess_engine.notation.forsyth_edwards_notation import Fen
+from chess_engine.notation.forsyth_edwards_notation import FenChars
+from chess_engine.notation.forsyth_edwards_notation import encode_fen_data
+
+from chess.bitboard.bitboard_position import BitboardPosition
+from chess.bitboard.bitboard_position import get_fen_hash
+from chess.bitboard.bitboard_position import get_move_promotion
+from chess.bitboard.bitboard_position import get_move_squares
+from chess.bitboard.bitboard_tables import A1
+from chess.bitboard.bitboard_tables import A8
+from chess.bitboard.bitboard_tables import B1
+from chess.bitboard.bitboard_tables import B8
+from chess.bitboard.bitboard_tables import BLACK
+from chess.bitboard.bitboard_tables import C1
+from chess.bitboard.bitboard_tables import C8
+from chess.bitboard.bitboard_tables import CASTLING_CHARS
+from chess.bitboard.bitboard_tables import E1
+from chess.bitboard.bitboard_tables import E8
+from chess.bitboard.bitboard_tables import G1
+from chess.bitboard.bitboard_tables import G8
+from chess.bitboard.bitboard_tables import H1
+from chess.bitboard.bitboard_tables import H8
+from chess.bitboard.bitboard_tables import KING
+from chess.bitboard.bitboard_tables import NO_PIECE
+from chess.bitboard.bitboard_tables import PAWN_ATTACKS
+from chess.bitboard.bitboard_tables import PIECE_CHARS
+from chess.bitboard.bitboard_tables import PIECE_TYPES
+from chess.bitboard.bitboard_tables import QUEEN
+from chess.bitboard.bitboard_tables import WHITE
+from chess.bitboard.bitboard_tables import get_square
+from chess.bitboard.zobrist import BLACK_TO_MOVE_KEY
+from chess.bitboard.zobrist import CASTLING_KEYS
+from chess.bitboard.zobrist import EN_PASSANT_KEYS
+from chess.bitboard.zobrist import PIECE_KEYS
+
+'''
+the gui drops the king on the rook to castle and the bot sends the square next to the king destination,
+both are translated to the two square king move of the bitboard position
+'''
+CASTLING_DESTINATIONS: dict[int, dict[int, int]] = {
+    E1: {H1: G1, G1: G1, A1: C1, B1: C1, C1: C1},
+    E8: {H8: G8, G8: G8, A8: C8, B8: C8, C8: C8},
+}
+
+
+def get_square_key(fen_val: str, square: int) -> int:
+    return 0 if fen_val == FenChars.BLANK_PIECE else PIECE_KEYS[PIECE_CHARS.index(fen_val)][square]
+
+
+def get_state_key(fen: Fen) -> int:
+    '''
+    the keys of the side to move, the castling rights and the en passant file, the same keys the bitboard position
+    hashes them with
+    '''
+    side: int = WHITE if fen.is_white_turn() else BLACK
+    castling_rights: int = 0
+    for right, char in CASTLING_CHARS:
+        if char in fen.data.castling_rights:
+            castling_rights |= right
+    key: int = CASTLING_KEYS[castling_rights] ^ (BLACK_TO_MOVE_KEY if side == BLACK else 0)
+
+    if fen.data.en_passant_rights == '-':
+        return key
+    # the en passant file is only part of the hash while a pawn of the side to move can capture
+    en_passant: int = get_square(fen.data.en_passant_rights)
+    pawn: str = FenChars.get_piece_fen(FenChars.DEFAULT_PAWN, side == WHITE)
+    attackers: int = PAWN_ATTACKS[side ^ 1][en_passant]
+    while attackers:
+        square: int = (attackers & -attackers).bit_length() - 1
+        if fen[square] == pawn:
+            return key ^ EN_PASSANT_KEYS[en_passant % 8]
+        attackers &= attackers - 1
+    return key
+
+
+def get_changed_squares(from_index: int, dest_index: int, is_castle: bool, is_en_passant: bool) -> typing.Iterable[int]:
+    if is_castle:
+        # the king and the rook both move on the back rank
+        back_rank: int = from_index - from_index % 8
+        return range(back_rank, back_rank + 8)
+    if is_en_passant:
+        # the captured pawn stands next to the moving pawn
+        return from_index, dest_index, from_index - from_index % 8 + dest_index % 8
+    return from_index, dest_index
+
+
+class MatchEngine(enum.Enum):
+    CHESS_ENGINE = enum.auto()
+    BITBOARD = enum.auto()
+
+
+class MoveValidator(ABC):
+
+    @staticmethod
+    def create(engine: MatchEngine) -> MoveValidator:
+        if engine is MatchEngine.CHESS_ENGINE:
+            return ChessEngineValidator()
+
+        elif engine is MatchEngine.BITBOARD:
+            return BitboardValidator()
+
+        else:
+            raise Exception(f'match engine: {engine} not recognised')
+
+    @abstractmethod
+    def get_notation(self) -> str:
+        pass
+
+    @abstractmethod
+    def get_fen(self) -> Fen:
+        pass
+
+    @abstractmethod
+    def is_white_turn(self) -> bool:
+        pass
+
+    @abstractmethod
+    def get_half_move_clock(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_position_hash(self) -> int:
+        pass
+
+    @abstractmethod
+    def make_move(self, from_index: int, dest_index: int, target_fen: str) -> str | None:
+        '''
+        returns None when the move is not valid, otherwise the fen of the captured piece or an empty string
+        '''
+
+    @abstractmethod
+    def is_checkmate(self) -> bool:
+        pass
+
+    @abstractmethod
+    def is_stalemate(self) -> bool:
+        pass
+
+    @abstractmethod
+    def is_material_insufficient(self) -> bool:
+        pass
+
+
+class ChessEngineValidator(MoveValidator):
+    def __init__(self) -> None:
+        self.fen: Fen = Fen()
+        # the zobrist hash of the fen, updated from the squares a move changes instead of parsing the fen every move
+        self.hash: int = get_fen_hash(self.fen.notation)
+
+    def get_notation(self) -> str:
+        return self.fen.notation
+
+    def get_fen(self) -> Fen:
+        return self.fen
+
+    def is_white_turn(self) -> bool:
+        return self.fen.is_white_turn()
+
+    def get_half_move_clock(self) -> int:
+        return int(self.fen.data.half_move_clock)
+
+    def get_position_hash(self) -> int:
+        return self.hash
+
+    def make_move(self, from_index: int, dest_index: int, target_fen: str) -> str | None:
+        if not is_move_valid(from_index, dest_index, self.fen):
+            return None
+
+        before_move_fen: Fen = Fen(encode_fen_data(self.fen.data))
+        self.fen.make_move(from_index, dest_index, target_fen)
+
+        is_en_passant: bool = before_move_fen.is_move_en_passant(from_index, dest_index)
+        is_castle: bool = before_move_fen.is_move_castle(from_index, dest_index)
+        self.hash ^= get_state_key(before_move_fen) ^ get_state_key(self.fen)
+        for square in get_changed_squares(from_index, dest_index, is_castle, is_en_passant):
+            self.hash ^= get_square_key(before_move_fen[square], square) ^ get_square_key(self.fen[square], square)
+
+        if not is_take(before_move_fen, dest_index, is_en_passant, is_castle):
+            return ''
+
+        if is_en_passant:
+            return FenChars.get_piece_fen(FenChars.DEFAULT_PAWN, not before_move_fen.is_white_turn())
+        return before_move_fen[dest_index]
+
+    def is_checkmate(self) -> bool:
+        return is_checkmate(self.fen, self.fen.is_white_turn())
+
+    def is_stalemate(self) -> bool:
+        return is_stale_mate(self.fen)
+
+    def is_material_insufficient(self) -> bool:
+        return is_material_insufficient(self.fen)
+
+
+class BitboardValidator(MoveValidator):
+    def __init__(self) -> None:
+        self.position: BitboardPosition = BitboardPosition()
+        # the legal moves of the current position, checkmate and stalemate reuse them after a move
+        self.legal_moves: list[int] | None = None
+
+    def get_notation(self) -> str:
+        return self.position.get_fen()
+
+    def get_fen(self) -> Fen:
+        return Fen(self.position.get_fen())
+
+    def is_white_turn(self) -> bool:
+        return self.position.side == WHITE
+
+    def get_half_move_clock(self) -> int:
+        return self.position.half_move_clock
+
+    def get_position_hash(self) -> int:
+        return self.position.hash
+
+    def get_legal_moves(self) -> list[int]:
+        if self.legal_moves is None:
+            self.legal_moves = self.position.generate_legal_moves()
+        return self.legal_moves
+
+    def find_move(self, from_index: int, dest_index: int, target_fen: str) -> int | None:
+        piece: int = self.position.board[from_index]
+        if piece != NO_PIECE and piece % PIECE_TYPES == KING:
+            dest_index = CASTLING_DESTINATIONS.get(from_index, {}).get(dest_index, dest_index)
+
+        promotion_char: str = target_fen.lower()
+        candidates: list[int] = [move for move in self.get_legal_moves() if get_move_squares(move) ==
+                                 (from_index, dest_index)]
+        for move in candidates:
+            promotion: int = get_move_promotion(move)
+            if not promotion or PIECE_CHARS[PIECE_TYPES + promotion] == promotion_char:
+                return move
+
+        # a promotion without a recognised target piece becomes a queen
+        for move in candidates:
+            if get_move_promotion(move) == QUEEN:
+                return move
+        return None
+
+    def make_move(self, from_index: int, dest_index: int, target_fen: str) -> str | None:
+        move: int | None = self.find_move(from_index, dest_index, target_fen)
+        if move is None:
+            return None
+
+        captured: int = self.position.get_captured_piece(move)
+        self.position.make_move(move)
+        self.legal_moves = None
+        return '' if captured == NO_PIECE else PIECE_CHARS[captured]
+
+    def is_checkmate(self) -> bool:
+        return not self.get_legal_moves() and self.position.is_in_check()
+
+    def is_stalemate(self) -> bool:
+        return not self.get_legal_moves() and not self.position.is_in_check()
+
+    def is_material_insufficient(self) -> bool:
+        return self.position.is_material_insufficient()
@@ -52,7 +52,7 @@ class ChessTimer:
     def stop(self) -> None:
         self.decrement_time = False
 
-    def render(self, pos: pygame.math.Vector2, font: pygame.font.Font, offset_height: bool = False) -> None:
+    def render(self, pos: pygame.math.Vector2, font: pygame.font.Font, offset_height: bool = False) -> pygame.rect.Rect:
         info = ChessTimer.format_seconds(self.time_left, True)
         info_render = font.render(info, True, AssetManager.get_theme().primary_light)
         render_pos = pos
@@ -67,3 +67,4 @@ class ChessTimer:
         info_bg_surface.fill(AssetManager.get_theme().primary_dark)
         GameSurface.get().blit(info_bg_surface, render_rect)
         GameSurface.get().blit(info_render, render_rect)
+        return render_rect
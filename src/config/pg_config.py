@@ -16,6 +16,7 @@ AVAILABLE_MOVE_SCALE: float = 1 / 3
 PROMOTION_PIECE_SCALE: float = 5 / 4
 BOARD_SIZE: int = 8
 DATA_SIZE: int = 4096
+MAX_FRAME_SIZE: int = 1 << 20
 TIMER_FONT_SIZE: int = 18
 DESCRIPTION_FONT_SIZE: int = 22
 DESCRIPTION_BUTTON_WIDTH: int = 300
@@ -87,6 +88,7 @@ STALEMATE = "STALEMATE"
 INSUFFICIENT_MATERIAL = "INSUFFICIENT_MATERIAL"
 FIFTY_MOVE_RULE = "FIFTY_MOVE_RULE"
 REPETITION = "REPETITION"
+ABANDONMENT = "ABANDONMENT"
 
 # -- File Name --
 FONT_FILE: str = "assets/fonts/Oleaguid.ttf"
@@ -114,9 +116,18 @@ N_SCORE: int = 3
 R_SCORE: int = 5
 B_SCORE: int = 3
 Q_SCORE: int = 9
+# a side can lose every piece but the king, each kind of piece is followed by a gap in the captured row
+MAX_CAPTURED_PIECES: int = 15
+CAPTURED_PIECE_KINDS: int = 5
 
 # -- Limits --
 HALF_MOVE_LIMIT = 100
+AVAILABLE_MOVES_CACHE_SIZE: int = 4
+TEXT_SURFACE_CACHE_SIZE: int = 512
+IDLE_FRAME_TIMEOUT: int = 100
+
+# -- Wire Protocol --
+WIRE_SCHEMA_VERSION: int = 2
 
 # -- Mouse Click values --
 MOUSECLICK_LEFT: int = 1
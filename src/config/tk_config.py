@@ -32,14 +32,49 @@ MAX_ELO: int = 3544
 MIN_ELO: int = 0
 MAX_SKILL: int = 20
 MIN_SKILL: int = 0
+# stockfish processes shared by every bot game, one per side is enough for bot vs bot
+ENGINE_POOL_SIZE: int = 2
+ANALYSIS_CACHE_FILE: str = 'src/config/analysis_cache.sqlite3'
+ANALYSIS_CACHE_SIZE: int = 100000
+OPENING_BOOK_FILE: str = 'src/config/opening_book.bin'
+# common opening lines the book is built from when there is no book file yet
+OPENING_BOOK_PGN_FILE: str = 'assets/openings/openings.pgn'
+# plies of every game added to the opening book
+OPENING_BOOK_MAX_PLY: int = 20
+SELF_PLAY_PGN_FILE: str = 'src/config/self_play.pgn'
+# engine search time per second of game clock, 0.01 plays a 5 minute game in at most 6 seconds
+SELF_PLAY_TIME_SCALE: float = 0.01
 MAX_SIZE: int = 7
 MIN_SIZE: int = 3
 CHECK_FOR_MATCH_DELAY: int = 3000
 
 MAX_CONNECTIONS: int = 64
+ASYNC_MAX_CONNECTIONS: int = 10000
+ASYNC_LISTEN_BACKLOG: int = 1024
+MATCHMAKING_TICK: float = 0.5
+ELO_BUCKET_SIZE: int = 50
+RATING_WINDOW: int = 100
+# rating points added to the window for every second in the queue
+RATING_WINDOW_GROWTH: float = 10
+MAX_RATING_WINDOW: int = 1000
+# seconds after a player disconnects before their match is forfeited to the opponent
+MATCH_ABANDON_TIMEOUT: float = 10
+MATCH_ARCHIVE_SIZE: int = 256
 
 CHESS_DB_INFO: tuple[str, str, str, int, str] = 'root', 'chess-database', '35.197.134.140', 3306, 'chess_db'
 LOCAL_CHESS_DB_INFO: tuple[str, str, str, int, str] = 'root', '3247', '127.0.0.1', 3306, 'local_chess_db'
+DB_POOL_SIZE: int = 5
+DB_MAX_OVERFLOW: int = 10
+DB_POOL_RECYCLE: int = 1800
+USER_CACHE_SIZE: int = 4096
+USER_CACHE_TIME_TO_LIVE: float = 60
+ELO_CHANGE: int = 10
+WRITE_QUEUE_BATCH_SIZE: int = 64
+WRITE_QUEUE_FLUSH_INTERVAL: float = 0.05
+# a batch that can not be written is tried again this many times, waiting longer every time
+WRITE_QUEUE_RETRIES: int = 3
+WRITE_QUEUE_RETRY_DELAY: float = 0.5
+GAME_STREAM_BATCH_SIZE: int = 1000
 
 # -- Logging --
 SERVER_SHUT: str = "SERVER SHUTDOWN"
@@ -19,6 +19,8 @@ class UserConfigData:
     bot_skill_level: int = 10
     bot_elo: int = 1350
     bot_use_time: bool = False
+    fps: int = 60
+    vsync: bool = False
 
 
 class UserConfig:
@@ -78,6 +80,12 @@ class UserConfig:
             elif name == "bot_use_time":
                 assert isinstance(value, bool), wrong_type_message + bool.__name__
                 self.data.bot_use_time = value
+            elif name == "fps":
+                assert isinstance(value, int), wrong_type_message + int.__name__
+                self.data.fps = value
+            elif name == "vsync":
+                assert isinstance(value, bool), wrong_type_message + bool.__name__
+                self.data.vsync = value
             else:
                 raise Exception(f"Launcher Config has nor variable: {name}")
 
@@ -1,15 +1,33 @@
+from __future__ import annotations
+
 import dataclasses
 import enum
 import hashlib
 import logging
+import queue
+import threading
+import time
+import typing
 
 import sqlalchemy
-from sqlalchemy import Select, and_, or_, text
-from sqlalchemy.exc import DatabaseError, NoResultFound
+from sqlalchemy import Select, and_, bindparam, func, insert, or_, update
+from sqlalchemy.exc import DatabaseError, IntegrityError, NoResultFound
 from sqlalchemy.orm import Session
 
 from config.logging_manager import AppLoggers, LoggingManager
-from database.models import Game, User
+from config.tk_config import DB_MAX_OVERFLOW
+from config.tk_config import DB_POOL_RECYCLE
+from config.tk_config import DB_POOL_SIZE
+from config.tk_config import ELO_CHANGE
+from config.tk_config import GAME_STREAM_BATCH_SIZE
+from config.tk_config import USER_CACHE_SIZE
+from config.tk_config import USER_CACHE_TIME_TO_LIVE
+from config.tk_config import WRITE_QUEUE_BATCH_SIZE
+from config.tk_config import WRITE_QUEUE_FLUSH_INTERVAL
+from config.tk_config import WRITE_QUEUE_RETRIES
+from config.tk_config import WRITE_QUEUE_RETRY_DELAY
+from database.models import Game, User, UserStats
+from database.user_cache import UserCache
 
 
 @dataclasses.dataclass
@@ -39,12 +57,35 @@ class CreateGameResult(enum.Enum):
     INVALID_TIME_CONFIG = enum.auto()
 
 
+class GameRecord(typing.NamedTuple):
+    white_id: int
+    black_id: int
+    moves: str
+    result: str
+    time_config: str
+
+
+class UserStatistics(typing.NamedTuple):
+    games: int = 0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+
+    def add(self, other: UserStatistics) -> UserStatistics:
+        return UserStatistics(*(own + others for own, others in zip(self, other)))
+
+
 class ChessDataBase:
 
     def __init__(self, db_info: DataBaseInfo) -> None:
         self.logger: logging.Logger = LoggingManager.get_logger(AppLoggers.DATABASE)
         self.db_info: DataBaseInfo = db_info
         self.engine: sqlalchemy.Engine | None = None
+        # finished games waiting to be written by the write behind thread, None stops the thread
+        self.write_queue: queue.Queue[GameRecord | None] = queue.Queue()
+        self.write_thread: threading.Thread | None = None
+        self.write_lock: threading.Lock = threading.Lock()
+        self.user_cache: UserCache = UserCache(USER_CACHE_SIZE, USER_CACHE_TIME_TO_LIVE)
 
     def get_connection_url(self) -> str:
         return f"mysql+mysqlconnector://{self.db_info.user}:{self.db_info.password}@{self.db_info.host}:" \
@@ -52,7 +93,10 @@ class ChessDataBase:
 
     def create_engine(self) -> None:
         try:
-            self.engine = sqlalchemy.create_engine(self.get_connection_url())
+            # pre ping and recycle replace connections that mysql closed after its wait_timeout
+            self.engine = sqlalchemy.create_engine(self.get_connection_url(), pool_size=DB_POOL_SIZE,
+                                                   max_overflow=DB_MAX_OVERFLOW, pool_recycle=DB_POOL_RECYCLE,
+                                                   pool_pre_ping=True)
         except Exception as err:
             self.logger.error("engine could not be created due to : %s", err)
 
@@ -79,6 +123,15 @@ class ChessDataBase:
             except NoResultFound:
                 return None
 
+    def get_cached_user(self, user_name: str) -> User | None:
+        # used by the server, every elo change goes through write_games which drops the changed users
+        if (user := self.user_cache.get(user_name)) is not None:
+            return user
+
+        if (user := self.get_user(user_name)) is not None:
+            self.user_cache.put(user)
+        return user
+
     def create_user(self, user_name: str, user_password: str) -> CreateUserResult:
         if not is_user_name_valid(user_name): return CreateUserResult.INVALID_USER_NAME
         if self.get_user(user_name) is not None: return CreateUserResult.USER_NAME_TAKEN
@@ -89,26 +142,146 @@ class ChessDataBase:
         return CreateUserResult.SUCCESS
 
     def create_game(self, white: User, black: User, moves: str, result: str, time_config: str, ) -> CreateGameResult:
-        if len(result) > 7: return CreateGameResult.INVALID_RESULT
-        if len(time_config) > 20: return CreateGameResult.INVALID_TIME_CONFIG
-
-        with Session(self.get_engine()) as session:
-            game: Game = Game(white_id=white.u_id, black_id=black.u_id, moves=moves, result=result,
-                              time_config=time_config)
-            winner, looser = get_winner_looser(result, white, black)
-
-            queries: list[text] = [
-                text(f"UPDATE users SET elo = {winner.elo + 10} WHERE u_id = {winner.u_id};"),
-                text(f"UPDATE users SET elo = {looser.elo - 10} WHERE u_id = {looser.u_id};"),
-            ]
-            for query in queries:
-                session.execute(query)
-
-            session.add(game)
-            session.commit()
+        if (invalid := validate_game(result, time_config)) is not None: return invalid
+        self.write_games([GameRecord(white.u_id, black.u_id, moves, result, time_config)])
+        return CreateGameResult.SUCCESS
 
+    def queue_game(self, white: User, black: User, moves: str, result: str, time_config: str) -> CreateGameResult:
+        """
+        same as create_game but returns straight away, the game and the elo updates are written later by the
+        write behind thread together with the other games that finished in the meantime
+        """
+        if (invalid := validate_game(result, time_config)) is not None: return invalid
+        self.start_write_queue()
+        self.write_queue.put(GameRecord(white.u_id, black.u_id, moves, result, time_config))
         return CreateGameResult.SUCCESS
 
+    def write_games(self, games: list[GameRecord]) -> None:
+        stats_changes: dict[int, UserStatistics] = {}
+        for game in games:
+            for u_id, score in get_scores(game):
+                stats_changes[u_id] = stats_changes.get(u_id, UserStatistics()).add(get_score_statistics(score))
+
+        with Session(self.get_engine()) as session, session.begin():
+            session.execute(insert(Game), [game._asdict() for game in games])
+            elo_changes: dict[int, int] = {u_id: (stats.wins - stats.losses) * ELO_CHANGE for u_id, stats in
+                                           stats_changes.items() if stats.wins != stats.losses}
+            if elo_changes:
+                session.connection().execute(
+                    update(User).where(User.u_id == bindparam("user_id")).values(elo=User.elo + bindparam("change")),
+                    [{"user_id": u_id, "change": change} for u_id, change in elo_changes.items()]
+                )
+            self.update_user_stats(session, stats_changes)
+        self.user_cache.invalidate(set(stats_changes))
+
+    def update_user_stats(self, session: Session, stats_changes: dict[int, UserStatistics]) -> None:
+        """
+        adds the new results to the cached stats rows, a user without a row gets one counted from the games table
+        """
+        cached: set[int] = set(session.scalars(Select(UserStats.u_id).where(UserStats.u_id.in_(stats_changes))))
+        for u_id in [u_id for u_id in stats_changes if u_id not in cached]:
+            try:
+                with session.begin_nested():
+                    session.execute(insert(UserStats), {"u_id": u_id, **count_user_stats(session, u_id)._asdict()})
+            except IntegrityError:
+                # get_user_stats added the row since it was looked up, it did not count the games of this batch
+                cached.add(u_id)
+
+        if cached:
+            session.connection().execute(
+                update(UserStats).where(UserStats.u_id == bindparam("user_id")).values(
+                    games=UserStats.games + bindparam("games"), wins=UserStats.wins + bindparam("wins"),
+                    losses=UserStats.losses + bindparam("losses"), draws=UserStats.draws + bindparam("draws")),
+                [{"user_id": u_id, **stats_changes[u_id]._asdict()} for u_id in cached]
+            )
+
+    def get_user_stats(self, user: User) -> UserStatistics:
+        try:
+            with Session(self.get_engine()) as session, session.begin():
+                if (stats := session.get(UserStats, user.u_id)) is not None:
+                    return UserStatistics(stats.games, stats.wins, stats.losses, stats.draws)
+
+                counted: UserStatistics = count_user_stats(session, user.u_id)
+                session.add(UserStats(u_id=user.u_id, **counted._asdict()))
+                return counted
+        except IntegrityError:
+            # another request or the write behind thread added the row first, it is read back instead
+            with Session(self.get_engine()) as session:
+                stats = session.get_one(UserStats, user.u_id)
+                return UserStatistics(stats.games, stats.wins, stats.losses, stats.draws)
+
+    def get_head_to_head(self, user: User) -> dict[int, UserStatistics]:
+        """
+        the stats of the user against every opponent they played, keyed by the opponent u_id
+        """
+        head_to_head: dict[int, UserStatistics] = {}
+        with Session(self.get_engine()) as session:
+            for is_white in (True, False):
+                own_id, opp_id = (Game.white_id, Game.black_id) if is_white else (Game.black_id, Game.white_id)
+                select: Select = Select(opp_id, Game.result, func.count()).where(own_id == user.u_id) \
+                    .group_by(opp_id, Game.result)
+                for opp, result, count in session.execute(select):
+                    stats: UserStatistics = get_score_statistics(get_result_score(result, is_white), count)
+                    head_to_head[opp] = head_to_head.get(opp, UserStatistics()).add(stats)
+
+        return head_to_head
+
+    def start_write_queue(self) -> None:
+        with self.write_lock:
+            # a thread that died is replaced so queued games are not left behind
+            if self.write_thread is not None and self.write_thread.is_alive():
+                return
+            self.write_thread = threading.Thread(target=self.write_behind, name="database-write-behind", daemon=True)
+            self.write_thread.start()
+
+    def stop_write_queue(self) -> None:
+        # waits until every queued game is written
+        with self.write_lock:
+            if self.write_thread is None:
+                return
+            self.write_queue.put(None)
+            self.write_thread.join()
+            self.write_thread = None
+
+    def write_behind(self) -> None:
+        is_running: bool = True
+        while is_running:
+            games: list[GameRecord] = []
+            if (game := self.write_queue.get()) is None:
+                break
+            games.append(game)
+
+            # games that finish close together share a transaction
+            while len(games) < WRITE_QUEUE_BATCH_SIZE:
+                try:
+                    game = self.write_queue.get(timeout=WRITE_QUEUE_FLUSH_INTERVAL)
+                except queue.Empty:
+                    break
+                if game is None:
+                    is_running = False
+                    break
+                games.append(game)
+
+            self.write_batch(games)
+
+    def write_batch(self, games: list[GameRecord]) -> None:
+        for attempt in range(WRITE_QUEUE_RETRIES + 1):
+            if attempt:
+                time.sleep(WRITE_QUEUE_RETRY_DELAY * attempt)
+            try:
+                self.write_games(games)
+                self.logger.info("wrote %s games", len(games))
+                return
+            except Exception as err:
+                self.logger.error("could not write %s games due to : %s", len(games), err)
+
+        if len(games) == 1:
+            self.logger.error("dropped game : %s", games[0])
+            return
+        # one bad game fails the whole transaction, written one at a time only the bad games are dropped
+        for game in games:
+            self.write_batch([game])
+
     def get_users_game(self, user: User, opp_user: User | None = None) -> list[Game]:
         result: list[Game] = []
         select: Select = Select(Game).filter(or_(Game.white_id == user.u_id, Game.black_id == user.u_id))
@@ -127,6 +300,13 @@ class ChessDataBase:
 
         return result
 
+    def get_game_moves(self) -> typing.Iterator[tuple[str, str]]:
+        # the movetext and result of every game, fetched in batches so the whole table is never in memory
+        with Session(self.get_engine()) as session:
+            select: Select = Select(Game.moves, Game.result).execution_options(yield_per=GAME_STREAM_BATCH_SIZE)
+            for moves, result in session.execute(select):
+                yield moves, result
+
     def get_engine(self) -> sqlalchemy.Engine:
         if self.engine is None: self.create_engine()
         assert self.engine is not None, "at this point we can be sure the engine has been created"
@@ -144,11 +324,36 @@ def is_user_password_valid(user_password: str) -> bool:
     return len(user_password) > 0
 
 
-def get_winner_looser(result: str, white: User, black: User) -> tuple[User, User]:
+def validate_game(result: str, time_config: str) -> CreateGameResult | None:
+    if len(result) > 7: return CreateGameResult.INVALID_RESULT
+    if len(time_config) > 20: return CreateGameResult.INVALID_TIME_CONFIG
+    return None
+
+
+def get_result_score(result: str, is_white: bool) -> int:
+    # 1 for a win, -1 for a loss and 0 for a draw
     if result == "WHITE":
-        return white, black
+        return 1 if is_white else -1
 
     elif result == "BLACK":
-        return black, white
+        return -1 if is_white else 1
+
+    return 0
+
+
+def get_scores(game: GameRecord) -> list[tuple[int, int]]:
+    return [(game.white_id, get_result_score(game.result, True)), (game.black_id, get_result_score(game.result, False))]
+
+
+def get_score_statistics(score: int, count: int = 1) -> UserStatistics:
+    return UserStatistics(count, count if score > 0 else 0, count if score < 0 else 0, count if score == 0 else 0)
+
 
-    raise ValueError(f"Unexpected result: {result}")
+def count_user_stats(session: Session, u_id: int) -> UserStatistics:
+    # one grouped count per side so each query can use the index on its player column
+    stats: UserStatistics = UserStatistics()
+    for is_white, player_id in ((True, Game.white_id), (False, Game.black_id)):
+        select: Select = Select(Game.result, func.count()).where(player_id == u_id).group_by(Game.result)
+        for result, count in session.execute(select):
+            stats = stats.add(get_score_statistics(get_result_score(result, is_white), count))
+    return stats
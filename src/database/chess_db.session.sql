@@ -21,12 +21,31 @@ CREATE TABLE Games(
 );
 
 
+-- @Block
+CREATE INDEX ix_Games_white_id ON Games(white_id);
+-- @Block
+CREATE INDEX ix_Games_black_id ON Games(black_id);
+
+
+-- @Block
+CREATE TABLE UserStats(
+    u_id INT PRIMARY KEY,
+    games INT NOT NULL DEFAULT 0,
+    wins INT NOT NULL DEFAULT 0,
+    losses INT NOT NULL DEFAULT 0,
+    draws INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (u_id) REFERENCES Users(u_id)
+);
+
+
 -- @Block
 ALTER TABLE Users AUTO_INCREMENT=1;
 -- @Block
 ALTER TABLE Games AUTO_INCREMENT=1;
 
 
+-- @Block
+DROP TABLE UserStats;
 -- @Block
 DROP TABLE Users;
 -- @Block
@@ -37,4 +56,6 @@ DROP TABLE Games;
 -- @Block
 SELECT * FROM Users;
 -- @Block
-SELECT * FROM Games;
\ No newline at end of file
+SELECT * FROM Games;
+-- @Block
+SELECT * FROM UserStats;
\ No newline at end of file
@@ -16,15 +16,25 @@ class User(Base):
     u_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     elo: Mapped[int] = mapped_column(default=1000)
     u_pass: Mapped[str] = mapped_column(nullable=False)
-    u_name: Mapped[str] = mapped_column(nullable=False)
+    u_name: Mapped[str] = mapped_column(nullable=False, unique=True, index=True)
 
 
 class Game(Base):
     __tablename__ = "Games"
 
     g_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    white_id: Mapped[int] = mapped_column(ForeignKey("Users.u_id"), nullable=False)
-    black_id: Mapped[int] = mapped_column(ForeignKey("Users.u_id"), nullable=False)
+    white_id: Mapped[int] = mapped_column(ForeignKey("Users.u_id"), nullable=False, index=True)
+    black_id: Mapped[int] = mapped_column(ForeignKey("Users.u_id"), nullable=False, index=True)
     moves: Mapped[str] = mapped_column(Text(), nullable=False)
     result: Mapped[str] = mapped_column(String(7), nullable=False)
     time_config: Mapped[str] = mapped_column(String(20), nullable=False)
+
+
+class UserStats(Base):
+    __tablename__ = "UserStats"
+
+    u_id: Mapped[int] = mapped_column(ForeignKey("Users.u_id"), primary_key=True)
+    games: Mapped[int] = mapped_column(default=0, nullable=False)
+    wins: Mapped[int] = mapped_column(default=0, nullable=False)
+    losses: Mapped[int] = mapped_column(default=0, nullable=False)
+    draws: Mapped[int] = mapped_column(default=0, nullable=False)
@@ -0,0 +1,42 @@
+import threading
+import time
+from collections import OrderedDict
+
+from database.models import User
+
+
+class UserCache:
+    """
+    least recently used users keyed by name, an entry older than the time to live is fetched again
+    so changes made by other processes are picked up
+    """
+    def __init__(self, size: int, time_to_live: float) -> None:
+        self.size: int = size
+        self.time_to_live: float = time_to_live
+        self.users: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, user_name: str) -> User | None:
+        with self.lock:
+            if (entry := self.users.get(user_name)) is None:
+                return None
+
+            cached_at, user = entry
+            if time.monotonic() - cached_at > self.time_to_live:
+                del self.users[user_name]
+                return None
+
+            self.users.move_to_end(user_name)
+            return user
+
+    def put(self, user: User) -> None:
+        with self.lock:
+            self.users[user.u_name] = time.monotonic(), user
+            self.users.move_to_end(user.u_name)
+            if len(self.users) > self.size:
+                self.users.popitem(last=False)
+
+    def invalidate(self, u_ids: set[int]) -> None:
+        with self.lock:
+            for user_name in [name for name, (_, user) in self.users.items() if user.u_id in u_ids]:
+                del self.users[user_name]
@@ -0,0 +1,229 @@
+import enum
+import struct
+import typing
+
+from config.pg_config import MAX_FRAME_SIZE
+from config.pg_config import WIRE_SCHEMA_VERSION
+from event.event import Event
+from event.event import EventType
+from event.game_events import ContinueGameEvent
+from event.game_events import DrawResponseEvent
+from event.game_events import EndGameEvent
+from event.game_events import InvalidMoveEvent
+from event.game_events import MoveEvent
+from event.game_events import OfferDrawEvent
+from event.game_events import OpponentDrawOfferEvent
+from event.game_events import OpponentPromotionEvent
+from event.game_events import PromotionEvent
+from event.game_events import ResignEvent
+from event.game_events import TimeOutEvent
+from event.game_events import UpdateCapturedPiecesEvent
+from event.game_events import UpdateFenEvent
+from event.launcher_events import DisconnectEvent
+from event.launcher_events import EnterQueueEvent
+from event.launcher_events import LaunchGameEvent
+from event.launcher_events import ServerVerificationEvent
+
+'''
+frame layout, all values are big endian:
+    header  : payload length (uint32), schema version (uint8)
+    payload : event count (uint16), then for every event its type (uint8), the fixed size fields of the event
+              packed in one struct (strings are stored as their byte length) and then the utf-8 string bytes
+'''
+FRAME_HEADER: struct.Struct = struct.Struct('!IB')
+EVENT_COUNT: struct.Struct = struct.Struct('!H')
+EVENT_TYPE: struct.Struct = struct.Struct('!B')
+# match ids are uuid1 ints (128 bits) or -1, so they need one extra byte for the sign
+MATCH_ID_SIZE: int = 17
+
+
+class EventDecodeError(Exception):
+    pass
+
+
+class FieldType(enum.Enum):
+    INT = 'i'
+    FLOAT = 'd'
+    BOOL = '?'
+    MATCH_ID = f'{MATCH_ID_SIZE}s'
+    STR = 'H'
+    COORDINATES = 'HH'
+
+
+class EventSchema(typing.NamedTuple):
+    event_class: type[Event]
+    # attribute names in the same order as the event constructor arguments
+    fields: tuple[tuple[str, FieldType], ...]
+    fixed: struct.Struct
+
+
+def create_schema(event_class: type[Event], *fields: tuple[str, FieldType]) -> EventSchema:
+    return EventSchema(event_class, fields, struct.Struct('!' + ''.join(field.value for _, field in fields)))
+
+
+EVENT_SCHEMAS: dict[EventType, EventSchema] = {
+    # -- game events --
+    EventType.MOVE: create_schema(
+        MoveEvent, ('match_id', FieldType.MATCH_ID), ('from_', FieldType.COORDINATES),
+        ('dest', FieldType.COORDINATES), ('side', FieldType.STR), ('target_fen', FieldType.STR),
+        ('time_iso', FieldType.STR)),
+    EventType.PROMOTION: create_schema(PromotionEvent, ('match_id', FieldType.MATCH_ID)),
+    EventType.RESIGN: create_schema(ResignEvent, ('match_id', FieldType.MATCH_ID), ('side', FieldType.STR)),
+    EventType.OFFER_DRAW: create_schema(OfferDrawEvent, ('match_id', FieldType.MATCH_ID), ('side', FieldType.STR)),
+    EventType.DRAW_RESPONSE: create_schema(
+        DrawResponseEvent, ('match_id', FieldType.MATCH_ID), ('result', FieldType.BOOL)),
+    EventType.TIME_OUT: create_schema(TimeOutEvent, ('match_id', FieldType.MATCH_ID), ('side', FieldType.STR)),
+    EventType.UPDATE_FEN: create_schema(
+        UpdateFenEvent, ('match_id', FieldType.MATCH_ID), ('notation', FieldType.STR),
+        ('white_time', FieldType.FLOAT), ('black_time', FieldType.FLOAT), ('from_', FieldType.INT),
+        ('dest', FieldType.INT)),
+    EventType.END_GAME: create_schema(
+        EndGameEvent, ('match_id', FieldType.MATCH_ID), ('result', FieldType.STR), ('reason', FieldType.STR)),
+    EventType.INVALID_MOVE: create_schema(InvalidMoveEvent, ('match_id', FieldType.MATCH_ID)),
+    EventType.UPDATE_CAP_PIECES: create_schema(
+        UpdateCapturedPiecesEvent, ('match_id', FieldType.MATCH_ID), ('captured_pieces', FieldType.STR)),
+    EventType.OPPONENT_PROMOTION: create_schema(OpponentPromotionEvent, ('match_id', FieldType.MATCH_ID)),
+    EventType.OPPONENT_DRAW_OFFER: create_schema(
+        OpponentDrawOfferEvent, ('match_id', FieldType.MATCH_ID), ('side', FieldType.STR)),
+    EventType.CONTINUE_GAME: create_schema(ContinueGameEvent, ('match_id', FieldType.MATCH_ID)),
+
+    # -- launcher events --
+    EventType.DISCONNECT: create_schema(DisconnectEvent, ('reason', FieldType.STR)),
+    EventType.LAUNCH_GAME: create_schema(
+        LaunchGameEvent, ('match_id', FieldType.MATCH_ID), ('time', FieldType.FLOAT), ('side', FieldType.STR)),
+    EventType.SERVER_VERIFICATION: create_schema(
+        ServerVerificationEvent, ('user_name', FieldType.STR), ('elo', FieldType.INT), ('id', FieldType.INT),
+        ('password', FieldType.STR)),
+    EventType.ENTER_QUEUE: create_schema(EnterQueueEvent, ('timer_name', FieldType.STR)),
+}
+
+EVENT_TYPES: dict[int, EventType] = {event_type.value: event_type for event_type in EventType}
+
+
+def encode_event(event: Event) -> bytes:
+    schema: EventSchema = EVENT_SCHEMAS[event.type]
+    fixed_values: list[typing.Any] = []
+    strings: list[bytes] = []
+    for name, field in schema.fields:
+        value = getattr(event, name)
+        if field is FieldType.STR:
+            data: bytes = value.encode('utf-8')
+            fixed_values.append(len(data))
+            strings.append(data)
+
+        elif field is FieldType.COORDINATES:
+            for part in value:
+                data = part.encode('utf-8')
+                fixed_values.append(len(data))
+                strings.append(data)
+
+        elif field is FieldType.MATCH_ID:
+            fixed_values.append(value.to_bytes(MATCH_ID_SIZE, 'big', signed=True))
+
+        else:
+            fixed_values.append(value)
+
+    return EVENT_TYPE.pack(event.type.value) + schema.fixed.pack(*fixed_values) + b''.join(strings)
+
+
+def decode_event(buffer: bytes, offset: int) -> tuple[Event, int]:
+    (type_value,) = EVENT_TYPE.unpack_from(buffer, offset)
+    offset += EVENT_TYPE.size
+    event_type: EventType | None = EVENT_TYPES.get(type_value)
+    if event_type is None:
+        raise EventDecodeError(f"unknown event type: {type_value}")
+
+    schema: EventSchema = EVENT_SCHEMAS[event_type]
+    fixed_values: tuple[typing.Any, ...] = schema.fixed.unpack_from(buffer, offset)
+    offset += schema.fixed.size
+
+    values: list[typing.Any] = []
+    index: int = 0
+    for _, field in schema.fields:
+        if field is FieldType.STR:
+            end: int = offset + fixed_values[index]
+            values.append(buffer[offset: end].decode('utf-8'))
+            offset = end
+            index += 1
+
+        elif field is FieldType.COORDINATES:
+            file_end: int = offset + fixed_values[index]
+            rank_end: int = file_end + fixed_values[index + 1]
+            values.append((buffer[offset: file_end].decode('utf-8'), buffer[file_end: rank_end].decode('utf-8')))
+            offset = rank_end
+            index += 2
+
+        elif field is FieldType.MATCH_ID:
+            values.append(int.from_bytes(fixed_values[index], 'big', signed=True))
+            index += 1
+
+        else:
+            values.append(fixed_values[index])
+            index += 1
+
+    return schema.event_class(*values), offset
+
+
+def encode_frame(payload: Event | typing.Sequence[Event]) -> bytes:
+    events: typing.Sequence[Event] = [payload] if isinstance(payload, Event) else payload
+    body: bytes = EVENT_COUNT.pack(len(events)) + b''.join(encode_event(event) for event in events)
+    return FRAME_HEADER.pack(len(body), WIRE_SCHEMA_VERSION) + body
+
+
+def decode_payload(buffer: bytes, start: int, end: int) -> list[Event]:
+    try:
+        (count,) = EVENT_COUNT.unpack_from(buffer, start)
+        offset: int = start + EVENT_COUNT.size
+        events: list[Event] = []
+        for _ in range(count):
+            event, offset = decode_event(buffer, offset)
+            events.append(event)
+    except (struct.error, UnicodeDecodeError) as error:
+        raise EventDecodeError(f"malformed payload: {error}") from error
+
+    if offset != end:
+        raise EventDecodeError(f"payload length {end - start} does not match its events")
+    return events
+
+
+class EventDecoder:
+    """
+    buffers the bytes read from a stream socket, a single read can contain part of a frame
+    or multiple frames, only the events of complete frames are returned by feed
+    """
+
+    def __init__(self) -> None:
+        self.partial: bytearray = bytearray()
+        # bytes needed before the partial frame can be decoded
+        self.required: int = 0
+
+    def feed(self, data: bytes) -> list[Event]:
+        if self.partial:
+            self.partial.extend(data)
+            if len(self.partial) < self.required:
+                return []
+            data = bytes(self.partial)
+            self.partial.clear()
+
+        events: list[Event] = []
+        offset: int = 0
+        self.required = FRAME_HEADER.size
+        while len(data) - offset >= FRAME_HEADER.size:
+            length, version = FRAME_HEADER.unpack_from(data, offset)
+            if version != WIRE_SCHEMA_VERSION:
+                raise EventDecodeError(f"expected schema version {WIRE_SCHEMA_VERSION} instead got: {version}")
+            if length > MAX_FRAME_SIZE:
+                raise EventDecodeError(f"frame of {length} bytes exceeds the limit of {MAX_FRAME_SIZE}")
+
+            start: int = offset + FRAME_HEADER.size
+            end: int = start + length
+            if len(data) < end:
+                self.required = FRAME_HEADER.size + length
+                break
+
+            events.extend(decode_payload(data, start, end))
+            offset = end
+
+        if offset < len(data):
+            self.partial.extend(data[offset:])
+        return events
@@ -1,19 +1,17 @@
-import pickle
 import socket
+import typing
 
 from event.event import Event
+from event.event_codec import EventDecoder
+from event.event_codec import encode_frame
 
 
 class EventManager:
 
     @staticmethod
-    def dispatch(connection: socket.socket, payload: Event | list[Event]):
-        connection.send(pickle.dumps(payload))
+    def dispatch(connection: socket.socket, payload: Event | typing.Sequence[Event]):
+        connection.sendall(encode_frame(payload))
 
     @staticmethod
-    def load_events(events_bytes: bytes) -> list[Event]:
-        return pickle.loads(events_bytes)
-
-    @staticmethod
-    def load_event(events_bytes: bytes) -> Event:
-        return pickle.loads(events_bytes)
+    def load_events(frames_bytes: bytes) -> list[Event]:
+        return EventDecoder().feed(frames_bytes)
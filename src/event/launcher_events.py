@@ -21,8 +21,9 @@ class ServerVerificationEvent(LauncherEvent):
 
 class EnterQueueEvent(LauncherEvent):
 
-    def __init__(self) -> None:
+    def __init__(self, timer_name: str) -> None:
         super().__init__(EventType.ENTER_QUEUE)
+        self.timer_name: str = timer_name
 
 
 # -- Events sent from the Server to the Client --
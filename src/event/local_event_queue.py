@@ -32,6 +32,9 @@ class LocalEvents:
 
         return self.player.get()
 
+    def is_empty(self) -> bool:
+        return self.match.empty() and self.player.empty()
+
     def add_player_event(self, event: GameEvent) -> None:
         self.player.put(event)
 
@@ -1,4 +1,5 @@
 import typing
+from collections import OrderedDict
 
 import pygame
 
@@ -12,22 +13,55 @@ from chess_engine.notation.forsyth_edwards_notation import FenChars
 from config.pg_config import AVAILABLE_ALPHA
 from config.pg_config import AVAILABLE_MOVE_COLOR
 from config.pg_config import AVAILABLE_MOVE_SCALE
-from config.pg_config import BOARD_SIZE
+from config.pg_config import AVAILABLE_MOVES_CACHE_SIZE
+
+
+class PositionMoves(typing.NamedTuple):
+    fen: Fen
+    # available moves of the pieces that have been picked up in this position
+    moves: dict[int, list[int]]
 
 
 class AvailableMovesGui:
+    # shared by every player, so two players viewing the same position only compute each piece once
+    positions: OrderedDict[str, PositionMoves] = OrderedDict()
+
+    @staticmethod
+    def get_position_moves(notation: str) -> PositionMoves:
+        positions: OrderedDict[str, PositionMoves] = AvailableMovesGui.positions
+        position: PositionMoves | None = positions.get(notation)
+        if position is not None:
+            positions.move_to_end(notation)
+            return position
+
+        position = PositionMoves(Fen(notation), {})
+        positions[notation] = position
+        if len(positions) > AVAILABLE_MOVES_CACHE_SIZE:
+            positions.popitem(last=False)
+        return position
+
     def __init__(self) -> None:
-        self.available_moves: dict[int, list[int]] = {index: [] for index in range(BOARD_SIZE * BOARD_SIZE)}
-
-    def update_available_moves(self, fen: Fen, side: Side, piece_index: int) -> None:
-        is_black_and_lower = side is Side.BLACK and fen[piece_index].islower()
-        is_white_and_upper = side is Side.WHITE and fen[piece_index].isupper()
-        correct_side = True if is_black_and_lower or is_white_and_upper else False
-        if fen[piece_index] == FenChars.BLANK_PIECE or not correct_side:
-            self.available_moves[piece_index] = []
-            return None
-        available_moves = get_available_moves(piece_index, fen)
-        self.available_moves[piece_index] = available_moves
+        self.position: PositionMoves | None = None
+
+    def update_available_moves(self, fen: Fen) -> None:
+        self.position = AvailableMovesGui.get_position_moves(fen.notation)
+
+    def get_available_moves(self, piece_index: int, side: Side) -> list[int]:
+        if self.position is None:
+            return []
+
+        fen_val: str = self.position.fen[piece_index]
+        is_black_and_lower = side is Side.BLACK and fen_val.islower()
+        is_white_and_upper = side is Side.WHITE and fen_val.isupper()
+        if fen_val == FenChars.BLANK_PIECE or not (is_black_and_lower or is_white_and_upper):
+            return []
+
+        # moves are only computed when a piece is picked up, not for every piece after every move
+        available_moves: list[int] | None = self.position.moves.get(piece_index)
+        if available_moves is None:
+            available_moves = get_available_moves(piece_index, self.position.fen)
+            self.position.moves[piece_index] = available_moves
+        return available_moves
 
     def render(self, picked: BoardTile, board: Board, side: Side, turn: bool) -> None:
         if not turn: return
@@ -35,13 +69,13 @@ class AvailableMovesGui:
             if picked.fen_val.islower(): return
         if side is Side.BLACK:
             if picked.fen_val.isupper(): return
-        for surface, pos in self.get_available_moves_surface(picked, board):
+        for surface, pos in self.get_available_moves_surface(picked, board, side):
             GameSurface.get().blit(surface, pos)
 
-    def get_available_moves_surface(self, picked: BoardTile, board: Board) -> \
+    def get_available_moves_surface(self, picked: BoardTile, board: Board, side: Side) -> \
             typing.Generator[tuple[pygame.surface.Surface, pygame.math.Vector2], None, None]:
         board_offset = pygame.math.Vector2(board.rect.topleft)
-        for index in self.available_moves[picked.algebraic_notation.index]:
+        for index in self.get_available_moves(picked.algebraic_notation.index, side):
             tile = board.grid[index]
             tile_size = pygame.math.Vector2(tile.rect.size) * AVAILABLE_MOVE_SCALE
             available_surface = pygame.surface.Surface(tile_size)
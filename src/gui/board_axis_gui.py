@@ -3,6 +3,7 @@ import typing
 
 from chess.board.side import Side
 from chess.asset.asset_manager import AssetManager
+from chess.asset.font_manager import FontManager
 from chess.game.game_surface import GameSurface
 from chess.game.game_surface import GameSize
 from chess.board.board_tile import BoardTile
@@ -43,8 +44,8 @@ class AxisRects(typing.NamedTuple):
 class BoardAxisGui:
 
     @staticmethod
-    def get_font() -> pygame.font.Font:
-        return pygame.font.Font(FONT_FILE, int(GameSize.get_relative_size(AXIS_FONT_SIZE)))
+    def render_value(value: str, color: tuple[int, int, int]) -> pygame.surface.Surface:
+        return FontManager.render(FONT_FILE, int(GameSize.get_relative_size(AXIS_FONT_SIZE)), value, False, color)
 
     @staticmethod
     def calculate_axis_rects() -> AxisRects:
@@ -83,11 +84,10 @@ class BoardAxisGui:
     @staticmethod
     def create_values_dict() -> dict[str, pygame.surface.Surface]:
         values_dict: dict[str, pygame.surface.Surface] = {}
-        anti_alias: bool = False
-        font = BoardAxisGui.get_font()
         for rank, file in enumerate(['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']):
-            values_dict[str(rank + 1)] = font.render(str(rank + 1), anti_alias, AssetManager.get_theme().primary_light)
-            values_dict[file] = font.render(file, anti_alias, AssetManager.get_theme().primary_light)
+            color: tuple[int, int, int] = AssetManager.get_theme().primary_light
+            values_dict[str(rank + 1)] = BoardAxisGui.render_value(str(rank + 1), color)
+            values_dict[file] = BoardAxisGui.render_value(file, color)
         return values_dict
 
     def __init__(self, board_pos: pygame.rect.Rect, side: Side) -> None:
@@ -97,6 +97,7 @@ class BoardAxisGui:
         self.axis: AxisGrids = BoardAxisGui.create_axis()
         self.axis_pos: AxisPos = self.calculate_pos()
         self.values_render_dict: dict[str, pygame.surface.Surface] = BoardAxisGui.create_values_dict()
+        self.is_dirty: bool = True
         self.update_surfaces()
         self.prev_hover: TileHover | None = None
 
@@ -122,21 +123,14 @@ class BoardAxisGui:
             rank_render = self.values_render_dict[value]
             self.axis_surfaces.y_axis_surface.blit(
                 rank_render, rank_render.get_rect(centery=rect.centery))
+        self.is_dirty = True
 
     def update_axis_val_render(self, tile_hover: TileHover | None, render_color: tuple[int, int, int]) -> None:
         if tile_hover is None:
             self.reset_hover()
             return
-        self.values_render_dict[tile_hover.rank] = BoardAxisGui.get_font().render(
-            tile_hover.rank,
-            False,
-            render_color
-        )
-        self.values_render_dict[tile_hover.file] = BoardAxisGui.get_font().render(
-            tile_hover.file,
-            False,
-            render_color
-        )
+        self.values_render_dict[tile_hover.rank] = BoardAxisGui.render_value(tile_hover.rank, render_color)
+        self.values_render_dict[tile_hover.file] = BoardAxisGui.render_value(tile_hover.file, render_color)
         self.update_surfaces()
 
     def reset_hover(self) -> None:
@@ -159,6 +153,10 @@ class BoardAxisGui:
         self.update_axis_val_render(current_hover, AssetManager.get_theme().secondary_dark)
         self.prev_hover = current_hover
 
-    def render(self) -> None:
-        GameSurface.get().blit(self.axis_surfaces.x_axis_surface, self.axis_pos.x_axis_pos)
-        GameSurface.get().blit(self.axis_surfaces.y_axis_surface, self.axis_pos.y_axis_pos)
+    def render(self, force: bool = False) -> list[pygame.rect.Rect]:
+        if not force and not self.is_dirty:
+            return []
+
+        self.is_dirty = False
+        return [GameSurface.get().blit(self.axis_surfaces.x_axis_surface, self.axis_pos.x_axis_pos),
+                GameSurface.get().blit(self.axis_surfaces.y_axis_surface, self.axis_pos.y_axis_pos)]
@@ -2,6 +2,7 @@ import dataclasses
 
 import pygame
 
+from chess.asset.font_manager import FontManager
 from chess.game.game_surface import GameSurface
 from config.pg_config import HOVER_ALPHA
 
@@ -33,7 +34,7 @@ class ButtonGui:
         self.hover_surface.fill(hover_color)
 
     def set_font(self, font_file: str, font_size: int, anti_alias: bool, font_color: tuple[int, int, int]) -> None:
-        self.font_info = FontRenderInfo(pygame.font.Font(font_file, font_size), anti_alias, font_color)
+        self.font_info = FontRenderInfo(FontManager.get_font(font_file, font_size), anti_alias, font_color)
 
     def set_label(self, text: str) -> None:
         if self.font_info is None: raise Exception('Font not initialised')
@@ -45,10 +46,11 @@ class ButtonGui:
     def set_hover(self, hover: bool) -> None:
         self.hover = hover
 
-    def render(self, game_offset: pygame.rect.Rect) -> None:
+    def render(self, game_offset: pygame.rect.Rect) -> pygame.rect.Rect:
         GameSurface.get().blit(self.surface, self.rect)
-        if not self.hover or not self.enabled: return
+        if not self.hover or not self.enabled: return self.rect
         vec_offset: pygame.math.Vector2 = pygame.math.Vector2(game_offset.topleft)
         mouse_pos = pygame.math.Vector2(pygame.mouse.get_pos()) - vec_offset
         if self.rect.collidepoint(mouse_pos.x, mouse_pos.y):
             GameSurface.get().blit(self.hover_surface, self.rect)
+        return self.rect
@@ -4,14 +4,16 @@ import pygame
 
 from chess.asset.asset_manager import AssetManager
 from chess.asset.chess_assets import PieceSetAssets
-from chess.asset.chess_assets import scale_surface
+from chess.asset.font_manager import FontManager
 from chess.board.side import Side
 from chess.game.game_size import GameSize
 from chess.game.game_surface import GameSurface
 from chess_engine.notation.forsyth_edwards_notation import FenChars
 from chess_engine.notation.forsyth_edwards_notation import validate_fen_val
 from config.pg_config import B_SCORE
+from config.pg_config import CAPTURED_PIECE_KINDS
 from config.pg_config import FONT_FILE
+from config.pg_config import MAX_CAPTURED_PIECES
 from config.pg_config import MAX_SCORE
 from config.pg_config import N_SCORE
 from config.pg_config import OPP_TIMER_SPACING
@@ -21,6 +23,12 @@ from config.pg_config import R_SCORE
 from config.pg_config import SCORE_FONT_SIZE
 from config.pg_config import X_AXIS_HEIGHT
 
+'''
+the server sends every piece captured so far on every capture, only the pieces that were not seen yet are added.
+the captured pieces of a colour are drawn into a surface sized for all of them, grouped by score, so a capture only
+redraws its group and the groups after it. the score surfaces are kept by score for the whole game
+'''
+
 
 @dataclasses.dataclass
 class CapturedPiecesScore:
@@ -29,27 +37,18 @@ class CapturedPiecesScore:
 
 
 @dataclasses.dataclass
-class CapturedPiecesSurface:
-    white: pygame.surface.Surface
-    black: pygame.surface.Surface
-    score: pygame.surface.Surface
+class CapturedRow:
+    surface: pygame.surface.Surface
+    counts: dict[str, int]
+    # the drawn part of the surface
+    width: int
 
 
 class CapturedGui:
 
     @staticmethod
-    def get_font() -> pygame.font.Font:
-        return pygame.font.Font(FONT_FILE, int(GameSize.get_relative_size(SCORE_FONT_SIZE)))
-
-    @staticmethod
-    def create_captured_dict(captured_pieces: str) -> dict[str, int]:
-        captured_dict: dict[str, int] = {}
-        for piece in captured_pieces:
-            if piece in captured_dict:
-                captured_dict[piece] += 1
-            else:
-                captured_dict[piece] = 1
-        return captured_dict
+    def get_font_size() -> int:
+        return int(GameSize.get_relative_size(SCORE_FONT_SIZE))
 
     @staticmethod
     def get_piece_score(piece_fen_val: str) -> int:
@@ -71,95 +70,101 @@ class CapturedGui:
         else:
             raise Exception(f'piece_fen_val : {piece_fen_val} is not valid')
 
+    @staticmethod
+    def get_piece_order(piece_fen_val: str) -> tuple[int, str]:
+        return CapturedGui.get_piece_score(piece_fen_val), piece_fen_val
+
     def __init__(
             self,
             captured_pieces: str,
             board_rect: pygame.rect.Rect,
             captured_scale: float = 7 / 20
     ):
-        for val in captured_pieces: validate_fen_val(val)
         self.captured_scale: float = captured_scale
         self.board_rect: pygame.rect.Rect = board_rect
-        self.captured_pieces: dict[str, int] = CapturedGui.create_captured_dict(captured_pieces)
         self.pieces: dict[str, pygame.surface.Surface] = self.copy_and_resize_pieces()
-        self.score: CapturedPiecesScore = self.calculate_captured_pieces_score()
-        self.captured_surfaces: CapturedPiecesSurface = self.create_captured_surfaces()
+        self.piece_size: pygame.math.Vector2 = self.get_piece_size()
+        self.captured_pieces: str = ''
+        self.score: CapturedPiecesScore = CapturedPiecesScore(0, 0)
+        self.white_row: CapturedRow = self.create_row()
+        self.black_row: CapturedRow = self.create_row()
+        self.score_surfaces: dict[int, pygame.surface.Surface] = {}
         self.pos_offset: pygame.math.Vector2 = pygame.math.Vector2(0, (X_AXIS_HEIGHT * GameSize.get_scale()))
+        self.set_captured_pieces(captured_pieces)
 
     def set_captured_pieces(self, new_cap_pieces: str) -> None:
-        for val in new_cap_pieces: validate_fen_val(val)
-        self.captured_pieces = CapturedGui.create_captured_dict(new_cap_pieces)
-        self.score = self.calculate_captured_pieces_score()
-        self.captured_surfaces = self.create_captured_surfaces()
-
-    def calculate_captured_pieces_score(self) -> CapturedPiecesScore:
-        white_score = black_score = 0
-        for fen_val, count in self.captured_pieces.items():
-            score = CapturedGui.get_piece_score(fen_val) * count
-            if fen_val.isupper():
-                black_score += score
-
-            else:
-                white_score += score
-        return CapturedPiecesScore(white_score, black_score)
-
-    def create_captured_surfaces(self) -> CapturedPiecesSurface:
-        piece_size = self.get_piece_size()
-
-        w_surface_size: pygame.math.Vector2 = pygame.math.Vector2(0, piece_size.y)
-        b_surface_size: pygame.math.Vector2 = pygame.math.Vector2(0, piece_size.y)
-
-        for piece, count in self.captured_pieces.items():
-            if piece.isupper():
-                w_surface_size.x += (piece_size.x // 2) * count
-                w_surface_size.x += (piece_size.x // 2)
-            else:
-                b_surface_size.x += (piece_size.x // 2) * count
-                b_surface_size.x += (piece_size.x // 2)
-
-        score_surface = pygame.surface.Surface(CapturedGui.get_font().size(MAX_SCORE))
-        w_captured_surface = pygame.surface.Surface(w_surface_size)
-        b_captured_surface = pygame.surface.Surface(b_surface_size)
-
+        if not new_cap_pieces.startswith(self.captured_pieces):
+            self.clear_captured_pieces()
+        # only the pieces that were not seen yet are validated
+        new_pieces: str = new_cap_pieces[len(self.captured_pieces):]
+        for val in new_pieces: validate_fen_val(val)
+        for piece in new_pieces:
+            self.add_captured_piece(piece)
+        self.captured_pieces = new_cap_pieces
+
+    def clear_captured_pieces(self) -> None:
+        self.captured_pieces = ''
+        self.score = CapturedPiecesScore(0, 0)
+        for row in (self.white_row, self.black_row):
+            row.counts.clear()
+            row.width = 0
+
+    def add_captured_piece(self, piece: str) -> None:
+        score: int = CapturedGui.get_piece_score(piece)
+        if piece.isupper():
+            self.score.black += score
+            row: CapturedRow = self.white_row
+        else:
+            self.score.white += score
+            row = self.black_row
+        row.counts[piece] = row.counts.get(piece, 0) + 1
+        self.update_row(row, piece)
+
+    def create_row(self) -> CapturedRow:
+        width: int = int(self.piece_size.x // 2) * (MAX_CAPTURED_PIECES + CAPTURED_PIECE_KINDS)
+        return CapturedRow(pygame.surface.Surface((width, self.piece_size.y)), {}, 0)
+
+    def update_row(self, row: CapturedRow, piece: str) -> None:
+        step: int = int(self.piece_size.x // 2)
+        order: list[str] = sorted(row.counts, key=CapturedGui.get_piece_order)
+        row.width = sum((count + 1) * step for count in row.counts.values())
+        # only more pieces than a side has (promoted pieces) outgrow the surface
+        if row.width > row.surface.get_width():
+            row.surface = pygame.surface.Surface((row.width, self.piece_size.y))
+            start: int = 0
+        else:
+            start = order.index(piece)
+
+        x: int = sum((row.counts[captured] + 1) * step for captured in order[:start])
+        row.surface.fill(AssetManager.get_theme().primary_dark, (x, 0, row.surface.get_width() - x, self.piece_size.y))
+        for captured in order[start:]:
+            for _ in range(row.counts[captured]):
+                row.surface.blit(self.pieces[captured], (x, 0))
+                x += step
+            x += step
+
+    def get_score_surface(self, score: int) -> pygame.surface.Surface:
+        score_surface: pygame.surface.Surface | None = self.score_surfaces.get(score)
+        if score_surface is not None:
+            return score_surface
+
+        score_surface = pygame.surface.Surface(
+            FontManager.get_font(FONT_FILE, CapturedGui.get_font_size()).size(MAX_SCORE))
         score_surface.fill(AssetManager.get_theme().primary_dark)
-        w_captured_surface.fill(AssetManager.get_theme().primary_dark)
-        b_captured_surface.fill(AssetManager.get_theme().primary_dark)
-
-        score: str = '+' + str(abs(self.score.white - self.score.black))
-        font_render: pygame.surface.Surface = CapturedGui.get_font().render(score, True,
-                                                                            AssetManager.get_theme().primary_light)
+        font_render: pygame.surface.Surface = FontManager.render(FONT_FILE, CapturedGui.get_font_size(), f'+{score}',
+                                                                 True, AssetManager.get_theme().primary_light)
         score_rect = font_render.get_rect(center=score_surface.get_rect().center)
         score_surface.blit(font_render, score_rect)
-
-        w_pos = pygame.math.Vector2(0)
-        b_pos = pygame.math.Vector2(0)
-        piece_keys: list[str] = list(self.captured_pieces.keys())
-        piece_keys.sort(key=lambda p: (CapturedGui.get_piece_score(p), p))
-        for piece in piece_keys:
-            if piece.isupper():
-                for _ in range(self.captured_pieces[piece]):
-                    w_captured_surface.blit(self.pieces[piece], w_pos)
-                    w_pos.x += (piece_size.x // 2)
-                w_pos.x += (piece_size.x // 2)
-            else:
-                for _ in range(self.captured_pieces[piece]):
-                    b_captured_surface.blit(self.pieces[piece], b_pos)
-                    b_pos.x += (piece_size.x // 2)
-                b_pos.x += (piece_size.x // 2)
-
-        return CapturedPiecesSurface(w_captured_surface, b_captured_surface, score_surface)
+        self.score_surfaces[score] = score_surface
+        return score_surface
 
     def copy_and_resize_pieces(self) -> dict[str, pygame.surface.Surface]:
-        copy_pieces: dict[str, pygame.surface.Surface] = {}
-        for fen_val, surface in AssetManager.load_pieces_surfaces(
-                PieceSetAssets.SIMPLE16x16, GameSize.get_scale()).items():
-            copy_pieces[fen_val] = scale_surface(surface, self.captured_scale)
-        return copy_pieces
+        return AssetManager.load_pieces_surfaces(PieceSetAssets.SIMPLE16x16, GameSize.get_scale(), self.captured_scale)
 
     def render(self, player_side: Side) -> None:
         scale = GameSize.get_scale()
         top_pos = pygame.rect.Rect(*self.board_rect.topleft, 0, 0)
-        top_pos.y -= int((OPP_TIMER_SPACING * scale) + self.get_piece_size().y)
+        top_pos.y -= int((OPP_TIMER_SPACING * scale) + self.piece_size.y)
         bottom_pos = pygame.rect.Rect(*self.board_rect.bottomleft, 0, 0)
         bottom_pos.x += int(self.pos_offset.x)
         bottom_pos.y += int(self.pos_offset.y)
@@ -175,17 +180,15 @@ class CapturedGui:
         else:
             greater_material_side = Side.BLACK
 
-        own_captured_surface = self.captured_surfaces.black \
-            if player_side == Side.WHITE else self.captured_surfaces.white
-        opp_captured_surface = self.captured_surfaces.white \
-            if player_side == Side.WHITE else self.captured_surfaces.black
+        own_captured_row = self.black_row if player_side == Side.WHITE else self.white_row
+        opp_captured_row = self.white_row if player_side == Side.WHITE else self.black_row
         if greater_material_side == player_side:
             score_pos = pygame.rect.Rect(bottom_pos)
-            score_pos.x += own_captured_surface.get_width()
+            score_pos.x += own_captured_row.width
 
         else:
             score_pos = pygame.rect.Rect(top_pos)
-            score_pos.x += opp_captured_surface.get_width()
+            score_pos.x += opp_captured_row.width
 
         if player_side is Side.WHITE:
             w_surface_pos = top_pos
@@ -194,10 +197,10 @@ class CapturedGui:
             b_surface_pos = top_pos
             w_surface_pos = bottom_pos
 
-        GameSurface.get().blit(self.captured_surfaces.white, w_surface_pos)
-        GameSurface.get().blit(self.captured_surfaces.black, b_surface_pos)
+        for row, pos in ((self.white_row, w_surface_pos), (self.black_row, b_surface_pos)):
+            GameSurface.get().blit(row.surface, pos, (0, 0, row.width, self.piece_size.y))
         if score_imbalance:
-            GameSurface.get().blit(self.captured_surfaces.score, score_pos)
+            GameSurface.get().blit(self.get_score_surface(abs(self.score.white - self.score.black)), score_pos)
 
     def get_piece_size(self) -> pygame.math.Vector2:
         return pygame.math.Vector2(self.pieces[FenChars.DEFAULT_PAWN].get_rect().size)
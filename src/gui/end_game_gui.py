@@ -45,9 +45,8 @@ class EndGameGui:
         self.offer_draw.set_label(OFFER_DRAW_LABEL)
         self.resign.set_label(RESIGN_LABEL)
 
-    def render(self, game_offset: pygame.rect.Rect) -> None:
-        self.offer_draw.render(game_offset)
-        self.resign.render(game_offset)
+    def render(self, game_offset: pygame.rect.Rect) -> list[pygame.rect.Rect]:
+        return [self.offer_draw.render(game_offset), self.resign.render(game_offset)]
 
     def recalculate_pos(self) -> None:
         self.offer_draw.rect.bottomleft = self.board_rect.bottomright
@@ -1,6 +1,7 @@
 import pygame
 
 from chess.asset.asset_manager import AssetManager
+from chess.asset.font_manager import FontManager
 from chess.game.chess_match import MatchResult
 from chess.game.game_size import GameSize
 from chess.game.game_surface import GameSurface
@@ -23,7 +24,7 @@ from gui.button_gui import ButtonGui
 class GameOverGui:
     @staticmethod
     def get_font(size: int) -> pygame.font.Font:
-        return pygame.font.Font(FONT_FILE, int(GameSize.get_relative_size(size)))
+        return FontManager.get_font(FONT_FILE, int(GameSize.get_relative_size(size)))
 
     def __init__(self, bg_color: tuple[int, int, int]):
         self.final_frame: pygame.surface.Surface = pygame.surface.Surface(GameSurface.get().get_size())
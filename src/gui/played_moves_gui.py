@@ -3,6 +3,7 @@ import dataclasses
 import pygame
 
 from chess.asset.asset_manager import AssetManager
+from chess.asset.font_manager import FontManager
 from chess.game.game_size import GameSize
 from chess.game.game_surface import GameSurface
 from chess_engine.notation.algebraic_notation import AlgebraicNotation
@@ -15,11 +16,16 @@ from config.pg_config import PLAYED_MOVE_FONT_SIZE
 from config.pg_config import SCROLL_SPEED
 from config.pg_config import SQUARE_SIZE
 
+'''
+the moves are kept as their cell surfaces and only the rows inside the scroll window are drawn, so a move costs the
+same in a long game as in a short one. the scroll list is virtual, its height grows by a row like the scroll surface
+it replaces and scrolling moves the window over it
+'''
+
 
 @dataclasses.dataclass
 class PlayedMovesSurfaces:
     background: pygame.surface.Surface
-    scroll: pygame.surface.Surface
     scroll_window: pygame.surface.Surface
 
 
@@ -28,7 +34,8 @@ class PlayedMovesGui:
     @staticmethod
     def create_move_cell_surface(move: str) -> pygame.surface.Surface:
         cell_surface: pygame.surface.Surface = pygame.surface.Surface(PlayedMovesGui.get_move_cell_size())
-        move_render = PlayedMovesGui.get_font().render(move, False, AssetManager.get_theme().secondary_dark)
+        move_render = FontManager.render(FONT_FILE, PlayedMovesGui.get_font_size(), move, False,
+                                         AssetManager.get_theme().secondary_dark)
         cell_surface.fill(AssetManager.get_theme().primary_dark)
         cell_surface.blit(move_render, move_render.get_rect(center=cell_surface.get_rect().center))
         return cell_surface
@@ -40,8 +47,8 @@ class PlayedMovesGui:
         return width, height
 
     @staticmethod
-    def get_font() -> pygame.font.Font:
-        return pygame.font.Font(FONT_FILE, int(GameSize.get_relative_size(PLAYED_MOVE_FONT_SIZE)))
+    def get_font_size() -> int:
+        return int(GameSize.get_relative_size(PLAYED_MOVE_FONT_SIZE))
 
     @staticmethod
     def calculate_background_rect() -> pygame.rect.Rect:
@@ -59,70 +66,69 @@ class PlayedMovesGui:
             (background_rect.width - BOARD_OUTLINE_THICKNESS,
              background_rect.height - (BOARD_OUTLINE_THICKNESS * 2))
         )
-        scroll_surface: pygame.surface.Surface = pygame.surface.Surface(
-            scroll_window_surface.get_size()
-        )
-        scroll_surface.fill(AssetManager.get_theme().primary_dark)
-        background_surface.blit(scroll_surface, (0, BOARD_OUTLINE_THICKNESS))
-        return PlayedMovesSurfaces(background_surface, scroll_surface, scroll_window_surface)
+        scroll_window_surface.fill(AssetManager.get_theme().primary_dark)
+        background_surface.blit(scroll_window_surface, (0, BOARD_OUTLINE_THICKNESS))
+        return PlayedMovesSurfaces(background_surface, scroll_window_surface)
 
     def __init__(self, board_rect: pygame.rect.Rect) -> None:
         self.moves: list[str] = []
+        self.move_cells: list[pygame.surface.Surface] = []
         self.board_rect: pygame.rect.Rect = board_rect
         self.background_rect: pygame.rect.Rect = PlayedMovesGui.calculate_background_rect()
         self.played_surfaces: PlayedMovesSurfaces = PlayedMovesGui.create_played_moves_surfaces(self.background_rect)
-        self.cell_pos: pygame.math.Vector2 = pygame.math.Vector2(0)
+        self.cell_size: tuple[int, int] = PlayedMovesGui.get_move_cell_size()
+        # height of the whole move list, never smaller than the window
+        self.scroll_height: int = self.played_surfaces.scroll_window.get_height()
         self.scroll_pos: pygame.math.Vector2 = pygame.math.Vector2(0)
+        self.is_dirty: bool = True
         self.calculate_pos()
 
     def add_played_move(self, from_index: int, dest_index: int, fen: Fen, target_fen: str) -> None:
         from_an = AlgebraicNotation.get_an_from_index(from_index)
         dest_an = AlgebraicNotation.get_an_from_index(dest_index)
         move: str = generate_move_text(fen, from_an, dest_an, target_fen)
-        self.update_scroll_surface(move)
-        self.moves.append(move)
+        self.add_move(move)
 
-    def recalculate_scroll_size(self, move_surface: pygame.surface.Surface) -> None:
-        move_cell_height: int = PlayedMovesGui.get_move_cell_size()[1]
-        if self.cell_pos.y + move_cell_height < self.played_surfaces.scroll.get_height(): return
-        new_surface = pygame.surface.Surface(
-            (self.played_surfaces.scroll.get_width(),
-             self.played_surfaces.scroll.get_height() + move_surface.get_rect().height))
-        new_surface.fill(AssetManager.get_theme().primary_dark)
-        new_surface.blit(self.played_surfaces.scroll, (0, 0))
-        self.played_surfaces.scroll = new_surface
-
-    def update_scroll_surface(self, move: str) -> None:
-        move_surface = PlayedMovesGui.create_move_cell_surface(move)
-        self.recalculate_scroll_size(move_surface)
-
-        self.played_surfaces.scroll.blit(move_surface, self.cell_pos)
-        if len(self.moves) % 2 == 0:
-            self.cell_pos.x += (move_surface.get_rect().width + BOARD_OUTLINE_THICKNESS)
-        else:
-            self.cell_pos.x -= (move_surface.get_rect().width + BOARD_OUTLINE_THICKNESS)
-            self.cell_pos.y += move_surface.get_rect().height
-        diff = self.played_surfaces.scroll_window.get_height() - self.played_surfaces.scroll.get_height()
-        self.scroll_pos.y = diff
+    def add_move(self, move: str) -> None:
+        self.moves.append(move)
+        self.move_cells.append(PlayedMovesGui.create_move_cell_surface(move))
+        row_bottom: int = ((len(self.moves) - 1) // 2 + 1) * self.cell_size[1]
+        if row_bottom >= self.scroll_height:
+            self.scroll_height += self.cell_size[1]
+        # the window follows the last move
+        self.scroll_pos.y = self.played_surfaces.scroll_window.get_height() - self.scroll_height
         self.update_background_surface()
 
     def update_background_surface(self) -> None:
-        self.played_surfaces.scroll_window.blit(self.played_surfaces.scroll, self.scroll_pos)
-        self.played_surfaces.background.blit(self.played_surfaces.scroll_window, (0, BOARD_OUTLINE_THICKNESS))
+        scroll_window: pygame.surface.Surface = self.played_surfaces.scroll_window
+        scroll_window.fill(AssetManager.get_theme().primary_dark)
+        cell_width, cell_height = self.cell_size
+        scroll_y: int = int(self.scroll_pos.y)
+        first_row: int = max(0, -scroll_y // cell_height)
+        last_row: int = (scroll_window.get_height() - scroll_y) // cell_height
+        for index in range(first_row * 2, min(len(self.move_cells), (last_row + 1) * 2)):
+            cell_x: int = (index % 2) * (cell_width + BOARD_OUTLINE_THICKNESS)
+            scroll_window.blit(self.move_cells[index], (cell_x, (index // 2) * cell_height + scroll_y))
+        self.played_surfaces.background.blit(scroll_window, (0, BOARD_OUTLINE_THICKNESS))
+        self.is_dirty = True
 
     def calculate_pos(self) -> None:
         self.background_rect.topleft = self.board_rect.topright
 
-    def render(self) -> None:
-        GameSurface.get().blit(self.played_surfaces.background, self.background_rect)
+    def render(self, force: bool = False) -> list[pygame.rect.Rect]:
+        if not force and not self.is_dirty:
+            return []
+
+        self.is_dirty = False
+        return [GameSurface.get().blit(self.played_surfaces.background, self.background_rect)]
 
     def scroll_down(self, game_offset: pygame.rect.Rect) -> None:
         mouse_pos = pygame.math.Vector2(pygame.mouse.get_pos()) - pygame.math.Vector2(game_offset.topleft)
         if not self.background_rect.collidepoint((mouse_pos.x, mouse_pos.y)):
             return
-        if self.played_surfaces.scroll.get_size() == self.played_surfaces.scroll_window.get_size():
+        if self.scroll_height == self.played_surfaces.scroll_window.get_height():
             return
-        diff = self.played_surfaces.scroll_window.get_height() - self.played_surfaces.scroll.get_height()
+        diff = self.played_surfaces.scroll_window.get_height() - self.scroll_height
         if self.scroll_pos.y <= diff:
             self.scroll_pos.y = diff
             return
@@ -133,7 +139,7 @@ class PlayedMovesGui:
         mouse_pos = pygame.math.Vector2(pygame.mouse.get_pos()) - pygame.math.Vector2(game_offset.topleft)
         if not self.background_rect.collidepoint((mouse_pos.x, mouse_pos.y)):
             return
-        if self.played_surfaces.scroll.get_size() == self.played_surfaces.scroll_window.get_size():
+        if self.scroll_height == self.played_surfaces.scroll_window.get_height():
             return
         if self.scroll_pos.y >= 0:
             self.scroll_pos.y = 0
@@ -27,6 +27,5 @@ class PromotionGui:
             center.x += piece_width
         return result
 
-    def render(self):
-        for surface, rect, val in self.promotion_pieces:
-            GameSurface.get().blit(surface, rect)
+    def render(self) -> list[pygame.rect.Rect]:
+        return [GameSurface.get().blit(surface, rect) for surface, rect, val in self.promotion_pieces]
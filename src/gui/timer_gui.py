@@ -2,6 +2,7 @@ import typing
 
 import pygame
 
+from chess.asset.font_manager import FontManager
 from chess.board.side import Side
 from chess.game.game_size import GameSize
 from chess_engine.notation.forsyth_edwards_notation import FenChars
@@ -32,7 +33,7 @@ class TimerGui:
 
     @staticmethod
     def get_font() -> pygame.font.Font:
-        return pygame.font.Font(FIVE_FONT_FILE, int(GameSize.get_relative_size(TIMER_FONT_SIZE)))
+        return FontManager.get_font(FIVE_FONT_FILE, int(GameSize.get_relative_size(TIMER_FONT_SIZE)))
 
     def __init__(self, match_time: float, board_rect: pygame.rect.Rect) -> None:
         self.own_timer: ChessTimer = ChessTimer(match_time)
@@ -40,6 +41,8 @@ class TimerGui:
         self.board_rect: pygame.rect.Rect = board_rect
         self.pos_offset: pygame.math.Vector2 = pygame.math.Vector2(0, (X_AXIS_HEIGHT * GameSize.get_scale()))
         self.own_pos, self.opponents_pos = self.calculate_timers_pos(GameSize.get_scale())
+        # time left of both timers as it was last drawn, None when they have to be drawn
+        self.rendered_time: tuple[str, str] | None = None
 
     def calculate_timers_pos(self, scale: float) -> tuple[pygame.math.Vector2, pygame.math.Vector2]:
         text_width, text_height = TimerGui.get_font().size(ChessTimer.format_seconds(650, True))
@@ -53,9 +56,18 @@ class TimerGui:
         return pygame.math.Vector2(own_rect.topleft) + self.pos_offset, \
             pygame.math.Vector2(opp_rect.topleft) - pygame.math.Vector2(0, OPP_TIMER_SPACING * scale)
 
-    def render(self) -> None:
-        self.own_timer.render(self.own_pos, TimerGui.get_font())
-        self.opponents_timer.render(self.opponents_pos, TimerGui.get_font(), True)
+    def render(self, force: bool = False) -> list[pygame.rect.Rect]:
+        rendered_time: tuple[str, str] = (ChessTimer.format_seconds(self.own_timer.time_left, True),
+                                          ChessTimer.format_seconds(self.opponents_timer.time_left, True))
+        if not force and rendered_time == self.rendered_time:
+            return []
+
+        self.rendered_time = rendered_time
+        return [self.own_timer.render(self.own_pos, TimerGui.get_font()),
+                self.opponents_timer.render(self.opponents_pos, TimerGui.get_font(), True)]
+
+    def is_running(self) -> bool:
+        return self.own_timer.decrement_time or self.opponents_timer.decrement_time
 
     def tick(self, delta_time: float) -> None:
         self.own_timer.tick(delta_time)
@@ -83,12 +83,14 @@ class VerifyGui:
     def set_description_label(self, label: str) -> None:
         self.description.set_label(label)
 
-    def render(self, game_offset: pygame.rect.Rect) -> None:
-        GameSurface.get().blit(self.bg_surface, self.bg_rect)
-        self.description.render(game_offset)
-        self.action.render(game_offset)
-        self.yes.render(game_offset)
-        self.no.render(game_offset)
+    def render(self, game_offset: pygame.rect.Rect) -> list[pygame.rect.Rect]:
+        return [
+            GameSurface.get().blit(self.bg_surface, self.bg_rect),
+            self.description.render(game_offset),
+            self.action.render(game_offset),
+            self.yes.render(game_offset),
+            self.no.render(game_offset),
+        ]
 
     def set_result(self, result: bool | None) -> None:
         self.result = result
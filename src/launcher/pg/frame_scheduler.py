@@ -0,0 +1,50 @@
+import pygame
+
+from config.pg_config import IDLE_FRAME_TIMEOUT
+
+
+class FrameScheduler:
+    """
+    limits the game loops to the target fps, while nothing on screen changes on its own the loop
+    blocks until an input event arrives or the idle timeout runs out
+    """
+    # posted from other threads to end an idle wait early, e.g. when the server sends a game event
+    wake_up_event: int = pygame.event.custom_type()
+
+    @staticmethod
+    def wake_up() -> None:
+        if not pygame.display.get_init():
+            return
+        pygame.event.post(pygame.event.Event(FrameScheduler.wake_up_event))
+
+    def __init__(self) -> None:
+        self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.fps: int = 0
+        self.idle_time: int = 0
+
+    def start(self, fps: int) -> None:
+        assert fps >= 0, f"fps can not be negative, got: {fps}"
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.idle_time = 0
+
+    def tick(self) -> float:
+        """
+        waits out the rest of the frame and returns the seconds since the last frame,
+        time spent waiting for events while idle is left out because no clock was running
+        """
+        frame_time: int = self.clock.tick(self.fps) - self.idle_time
+        self.idle_time = 0
+        return max(frame_time, 0) / 1000
+
+    def get_events(self, is_idle: bool) -> list[pygame.event.Event]:
+        if not is_idle:
+            return pygame.event.get()
+
+        wait_start: int = pygame.time.get_ticks()
+        event: pygame.event.Event = pygame.event.wait(IDLE_FRAME_TIMEOUT)
+        self.idle_time += pygame.time.get_ticks() - wait_start
+
+        events: list[pygame.event.Event] = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
@@ -1,5 +1,3 @@
-import time
-
 import pygame
 from chess_engine.notation.forsyth_edwards_notation import Fen
 
@@ -16,17 +14,21 @@ from chess.timer.timer_config import TimerConfig
 from config.pg_config import MOUSECLICK_SCROLL_DOWN
 from config.pg_config import MOUSECLICK_SCROLL_UP
 from config.user_config import UserConfig
+from event.local_event_queue import LocalEvents
+from launcher.pg.frame_scheduler import FrameScheduler
 
 
 class OfflineLauncher:
     def __init__(self) -> None:
-        self.prev_time = time.time()
+        self.frame_scheduler: FrameScheduler = FrameScheduler()
         self.delta_time: float = 0
 
     def set_delta_time(self) -> None:
-        now = time.time()
-        self.delta_time = now - self.prev_time
-        self.prev_time = now
+        self.delta_time = self.frame_scheduler.tick()
+
+    @staticmethod
+    def is_idle(*players: Player) -> bool:
+        return LocalEvents.get().is_empty() and all(player.is_idle() for player in players)
 
     def launch_against_bot(self) -> None:
         done = False
@@ -35,20 +37,22 @@ class OfflineLauncher:
         init_chess(
             Themes.get_theme(UserConfig.get().data.theme_id),
             PieceSetAssets.get_asset(UserConfig.get().data.asset_name),
-            UserConfig.get().data.scale
+            UserConfig.get().data.scale,
+            UserConfig.get().data.vsync
         )
+        self.frame_scheduler.start(UserConfig.get().data.fps)
         center: pygame.rect.Rect = GameSurface.get().get_rect(center=pygame.display.get_surface().get_rect().center)
-        match = Match(TimerConfig.get_timer_config(UserConfig.get().data.timer_config_name))
+        match = Match(TimerConfig.get_timer_config(UserConfig.get().data.timer_config_name), is_local=True)
         player: Player = Player.get_player_local(player_side, match, center)
         player.end_game_gui.offer_draw.set_enable(False)
         player.end_game_gui.resign.set_enable(False)
-        game_fen: Fen = Fen(match.fen.notation)
+        game_fen: Fen = Fen(match.get_fen().notation)
         stock_fish: StockFishBot = StockFishBot(game_fen, bot_side, player)
         while not done:
 
             self.set_delta_time()
 
-            for event in pygame.event.get():
+            for event in self.frame_scheduler.get_events(OfflineLauncher.is_idle(player)):
                 if event.type == pygame.QUIT:
                     done = True
                 player.parse_input(event, game_fen)
@@ -57,13 +61,11 @@ class OfflineLauncher:
             match.process_local_move()
             Player.local_game_process(game_fen, player)
             player.update(self.delta_time)
-            player.render()
-
-            pygame.display.get_surface().blit(GameSurface.get(), center)
-
-            pygame.display.flip()
+            GameSurface.update_display(center, player.render())
 
         pygame.quit()
+        stock_fish.cancel()
+        StockFishBot.get().log_cache_stats()
 
     def launch_bot_vs_bot(self) -> None:
         done = False
@@ -72,22 +74,24 @@ class OfflineLauncher:
         init_chess(
             Themes.get_theme(UserConfig.get().data.theme_id),
             PieceSetAssets.get_asset(UserConfig.get().data.asset_name),
-            UserConfig.get().data.scale
+            UserConfig.get().data.scale,
+            UserConfig.get().data.vsync
         )
+        self.frame_scheduler.start(UserConfig.get().data.fps)
         center: pygame.rect.Rect = GameSurface.get().get_rect(center=pygame.display.get_surface().get_rect().center)
-        match = Match(TimerConfig.get_timer_config(UserConfig.get().data.timer_config_name))
+        match = Match(TimerConfig.get_timer_config(UserConfig.get().data.timer_config_name), is_local=True)
         player: Player = Player.get_player_local(perspective_side, match, center)
         bot_player: Player = Player.get_player_local(opp_side, match, center)
         bot_player.set_final_render(False)
         player.end_game_gui.offer_draw.set_enable(False)
         player.end_game_gui.resign.set_enable(False)
-        game_fen: Fen = Fen(match.fen.notation)
+        game_fen: Fen = Fen(match.get_fen().notation)
         stock_fish: StockFishBot = StockFishBot(game_fen, opp_side, player)
         while not done:
 
             self.set_delta_time()
 
-            for event in pygame.event.get():
+            for event in self.frame_scheduler.get_events(OfflineLauncher.is_idle(player, bot_player)):
                 if event.type == pygame.QUIT:
                     done = True
                 if event.type == pygame.MOUSEBUTTONDOWN:
@@ -101,15 +105,11 @@ class OfflineLauncher:
             Player.local_game_process(game_fen, player, bot_player)
             player.update(self.delta_time)
             bot_player.update(self.delta_time)
-            player.render()
-
-            pygame.display.get_surface().blit(GameSurface.get(), center)
-
-            pygame.display.flip()
+            GameSurface.update_display(center, player.render())
 
         pygame.quit()
-        # FIXME: not the best solution
-        stock_fish.move_thread.join()
+        stock_fish.cancel()
+        StockFishBot.get().log_cache_stats()
 
     def launch_against_human(self) -> None:
         done = False
@@ -117,20 +117,22 @@ class OfflineLauncher:
         init_chess(
             Themes.get_theme(UserConfig.get().data.theme_id),
             PieceSetAssets.get_asset(UserConfig.get().data.asset_name),
-            UserConfig.get().data.scale
+            UserConfig.get().data.scale,
+            UserConfig.get().data.vsync
         )
+        self.frame_scheduler.start(UserConfig.get().data.fps)
         center: pygame.rect.Rect = GameSurface.get().get_rect(center=pygame.display.get_surface().get_rect().center)
-        match = Match(TimerConfig.get_timer_config(UserConfig.get().data.timer_config_name))
+        match = Match(TimerConfig.get_timer_config(UserConfig.get().data.timer_config_name), is_local=True)
         white_player: Player = Player.get_player_local(Side.WHITE, match, center)
         black_player: Player = Player.get_player_local(Side.BLACK, match, center)
-        game_fen: Fen = Fen(match.fen.notation)
+        game_fen: Fen = Fen(match.get_fen().notation)
         while not done:
 
             self.set_delta_time()
 
             current_player = white_player if is_white else black_player
 
-            for event in pygame.event.get():
+            for event in self.frame_scheduler.get_events(OfflineLauncher.is_idle(white_player, black_player)):
                 keys = pygame.key.get_pressed()
                 if event.type == pygame.QUIT:
                     done = True
@@ -146,12 +148,10 @@ class OfflineLauncher:
 
             white_player.update(self.delta_time)
             black_player.update(self.delta_time)
-            current_player.render()
+            dirty_rects: list[pygame.rect.Rect] = current_player.render()
 
             if not pygame.get_init():
                 return
-            pygame.display.get_surface().blit(GameSurface.get(), center)
-
-            pygame.display.flip()
+            GameSurface.update_display(center, dirty_rects)
 
         pygame.quit()
@@ -1,5 +1,4 @@
 import socket
-import time
 from typing import Optional
 
 import pygame
@@ -16,21 +15,20 @@ from config.logging_manager import LoggingManager
 from config.user_config import UserConfig
 from event.event_manager import EventManager
 from event.game_events import ResignEvent
+from launcher.pg.frame_scheduler import FrameScheduler
 
 
 class OnlineLauncher:
 
     def __init__(self) -> None:
         self.logger = LoggingManager.get_logger(AppLoggers.ONLINE_LAUNCHER)
-        self.prev_time = time.time()
+        self.frame_scheduler: FrameScheduler = FrameScheduler()
         self.delta_time: float = 0
         self.player: Optional[Player] = None
         self.match_fen: Fen = Fen()
 
     def set_delta_time(self) -> None:
-        now = time.time()
-        self.delta_time = now - self.prev_time
-        self.prev_time = now
+        self.delta_time = self.frame_scheduler.tick()
 
     def get_player(self) -> Optional[Player]:
         return self.player
@@ -48,8 +46,10 @@ class OnlineLauncher:
         init_chess(
             Themes.get_theme(UserConfig.get().data.theme_id),
             PieceSetAssets.get_asset(UserConfig.get().data.asset_name),
-            UserConfig.get().data.scale
+            UserConfig.get().data.scale,
+            UserConfig.get().data.vsync
         )
+        self.frame_scheduler.start(UserConfig.get().data.fps)
         center = GameSurface.get().get_rect(center=pygame.display.get_surface().get_rect().center)
 
         self.reset_fen()
@@ -62,7 +62,7 @@ class OnlineLauncher:
         while not done:
             self.set_delta_time()
 
-            for event in pygame.event.get():
+            for event in self.frame_scheduler.get_events(player.is_idle()):
                 if event.type == pygame.QUIT:
                     if not player.game_over:
                         EventManager.dispatch(connection, ResignEvent(player.get_match_id(), player.side.name))
@@ -72,10 +72,9 @@ class OnlineLauncher:
 
                 player.parse_input(event, self.match_fen, connection)
 
-            player.render()
+            dirty_rects: list[pygame.rect.Rect] = player.render()
             player.update(self.delta_time, connection)
-            if (screen := pygame.display.get_surface()) is None:
+            if pygame.display.get_surface() is None:
                 return
 
-            screen.blit(GameSurface.get(), center)
-            pygame.display.flip()
+            GameSurface.update_display(center, dirty_rects)
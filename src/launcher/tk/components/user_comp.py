@@ -266,5 +266,5 @@ def set_elo_label(user_vars: UserVars, database: ChessDataBase) -> None:
 
 
 def set_game_stats(user_var: UserVars, database: ChessDataBase) -> None:
-    game_num: int = len(database.get_users_game(LauncherUser.get_user()))
+    game_num: int = database.get_user_stats(LauncherUser.get_user()).games
     user_var.games_played_var.set(f"games played: {game_num}")
@@ -3,22 +3,40 @@ import enum
 import click
 from chess_engine.movement.piece_movement import PieceMovement
 
+from chess.bot.engine_pool import EngineSettings
+from chess.bot.opening_book import build_book
+from chess.bot.opening_book import read_pgn_games
+from chess.bot.self_play import SelfPlayConfig
+from chess.bot.self_play import run_self_play
+from chess.game.move_validator import MatchEngine
+from chess.timer.timer_config import TimerConfig
 from config.logging_manager import AppLoggers
 from config.logging_manager import LoggingManager
 from config.logging_manager import LoggingOut
 from config.tk_config import LOCAL_CHESS_DB_INFO
+from config.tk_config import OPENING_BOOK_FILE
+from config.tk_config import OPENING_BOOK_MAX_PLY
+from config.tk_config import SELF_PLAY_PGN_FILE
+from config.tk_config import SELF_PLAY_TIME_SCALE
 from config.user_config import UserConfig
+from database.chess_db import ChessDataBase
 from database.chess_db import DataBaseInfo
 from launcher.pg.pg_launcher import ChessPygameLauncher
 from launcher.pg.pg_launcher import SinglePlayerGameType
 from launcher.tk.tk_launcher import ChessTkinterLauncher
+from network.server.async_chess_server import AsyncChessServer
 from network.server.chess_server import ChessServer
+from network.server.sharded_chess_server import ShardedChessServer
 
 
 class AppType(enum.Enum):
     LAUNCHER = enum.auto()
     SERVER = enum.auto()
+    ASYNC_SERVER = enum.auto()
+    SHARDED_SERVER = enum.auto()
     PLAYER_V_PLAYER = enum.auto()
+    BUILD_OPENING_BOOK = enum.auto()
+    SELF_PLAY = enum.auto()
 
 
 @click.command()
@@ -27,8 +45,23 @@ class AppType(enum.Enum):
 @click.option('--bot_log_stdout', is_flag=True, help='set bot logging to stdout')
 @click.option('--database_log_stdout', is_flag=True, help='set database logging to stdout')
 @click.option('--launcher_log_stdout', is_flag=True, help='set launcher logging to stdout')
-@click.option('--app_type', default=AppType.LAUNCHER.name, help='select what to launch. LAUNCHER, CLIENT, '
-                                                                'SERVER or LOCAL')
+@click.option('--app_type', default=AppType.LAUNCHER.name, help='select what to launch. LAUNCHER, SERVER, '
+                                                                'ASYNC_SERVER, SHARDED_SERVER, PLAYER_V_PLAYER, '
+                                                                'BUILD_OPENING_BOOK or SELF_PLAY')
+@click.option('--shards', default=0, help='number of match shard processes of the SHARDED_SERVER, '
+                                          '0 uses one per cpu core')
+@click.option('--match_engine', default=MatchEngine.CHESS_ENGINE.name,
+              help='move validation used by the server matches. CHESS_ENGINE or BITBOARD')
+@click.option('--pgn_file', default='', help='pgn file the BUILD_OPENING_BOOK reads, the database games are '
+                                           'used when it is not set. pgn file the SELF_PLAY games are written to')
+@click.option('--games', default=100, help='number of games the SELF_PLAY bot plays against itself')
+@click.option('--workers', default=0, help='number of SELF_PLAY worker processes, 0 uses one per cpu core')
+@click.option('--engine_path', default='stockfish', help='path of the stockfish engine the SELF_PLAY uses')
+@click.option('--time_scale', default=SELF_PLAY_TIME_SCALE, help='SELF_PLAY engine search time per second of game '
+                                                                 'clock')
+@click.option('--seed', default=0, help='seed of the SELF_PLAY opening book moves')
+@click.option('--fps', default=60, help='frames per second of the game window, 0 for no limit')
+@click.option('--vsync', is_flag=True, help='sync the game window with the display refresh rate')
 @click.option('--scale', default=3.5, help='size of chess game, lower than 3.5 will cause the fonts to be unclear')
 @click.option('--theme_id', default=1, help='game theme, possible ids (1 - 4), (-1 for random theme)')
 @click.option('--pieces_asset', default='RANDOM', help='piece assets, possible names SMALL, LARGE, RANDOM')
@@ -51,6 +84,16 @@ def start_app(
         database_log_stdout: bool,
         launcher_log_stdout: bool,
         app_type: str,
+        shards: int,
+        match_engine: str,
+        pgn_file: str,
+        games: int,
+        workers: int,
+        engine_path: str,
+        time_scale: float,
+        seed: int,
+        fps: int,
+        vsync: bool,
         scale: float,
         theme_id: int,
         pieces_asset: str,
@@ -60,6 +103,7 @@ def start_app(
     app: AppType = AppType[app_type]
     database_info: DataBaseInfo = DataBaseInfo(*LOCAL_CHESS_DB_INFO)
     ChessServer.set_database_info(database_info)
+    ChessServer.set_match_engine(MatchEngine[match_engine])
 
     UserConfig.get().update_config(
         update_local_config=False,
@@ -67,6 +111,8 @@ def start_app(
         scale=scale,
         asset_name=pieces_asset,
         timer_config_name=timer,
+        fps=fps,
+        vsync=vsync,
     )
 
     if server_log_stdout:
@@ -93,9 +139,33 @@ def start_app(
         ChessServer.get().start()
         ChessServer.get().run()
 
+    elif app is AppType.ASYNC_SERVER:
+        PieceMovement.load()
+        AsyncChessServer.get().start()
+        AsyncChessServer.get().run()
+
+    elif app is AppType.SHARDED_SERVER:
+        PieceMovement.load()
+        if shards > 0:
+            ShardedChessServer.set_shard_count(shards)
+        ShardedChessServer.get().start()
+        ShardedChessServer.get().run()
+
     elif app is AppType.PLAYER_V_PLAYER:
         ChessPygameLauncher.get().launch_single_player(SinglePlayerGameType.HUMAN_VS_HUMAN)
 
+    elif app is AppType.BUILD_OPENING_BOOK:
+        book_games = read_pgn_games(pgn_file) if pgn_file else ChessDataBase(database_info).get_game_moves()
+        entries: int = build_book(book_games, OPENING_BOOK_FILE, OPENING_BOOK_MAX_PLY)
+        LoggingManager.get_logger(AppLoggers.BOT).info("wrote %s opening book entries to %s", entries,
+                                                       OPENING_BOOK_FILE)
+
+    elif app is AppType.SELF_PLAY:
+        settings: EngineSettings = EngineSettings(UserConfig.get().data.bot_elo, UserConfig.get().data.bot_skill_level)
+        config: SelfPlayConfig = SelfPlayConfig(engine_path, TimerConfig.get_timer_config(timer),
+                                                MatchEngine[match_engine], settings, time_scale, seed)
+        run_self_play(config, games, workers or None, pgn_file or SELF_PLAY_PGN_FILE)
+
 
 if __name__ == "__main__":
     start_app()
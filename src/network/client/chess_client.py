@@ -7,12 +7,15 @@ from chess.chess_player import Player
 from config.logging_manager import AppLoggers, LoggingManager
 from config.pg_config import DATA_SIZE
 from config.tk_config import SERVER_SHUT
+from config.user_config import UserConfig
 from database.models import User
 from event.event import Event, EventContext, EventType
+from event.event_codec import EventDecodeError, EventDecoder
 from event.event_manager import EventManager
 from event.game_events import EndGameEvent, GameEvent
 from event.launcher_events import DisconnectEvent, EnterQueueEvent, LaunchGameEvent, LauncherEvent, \
     ServerVerificationEvent
+from launcher.pg.frame_scheduler import FrameScheduler
 from launcher.pg.pg_launcher import ChessPygameLauncher
 from launcher.tk.global_vars import GlobalUserVars
 from network.chess_network import Net
@@ -29,6 +32,7 @@ class ChessClient(Net):
         self.user: User = user
         self.logger: logging.Logger = LoggingManager.get_logger(AppLoggers.CLIENT)
         self.is_connected: bool = False
+        self.decoder: EventDecoder = EventDecoder()
         self._update_stats = None
 
     def start(self) -> ClientConnectResult:
@@ -49,6 +53,7 @@ class ChessClient(Net):
     def disconnect(self) -> None:
         self.set_is_connected(False)
         self.reset_socket()
+        self.decoder = EventDecoder()
 
     def read(self) -> bytes | None:
         try:
@@ -73,7 +78,12 @@ class ChessClient(Net):
             if event_bytes is None or not event_bytes:
                 break
 
-            events: list[Event] = EventManager.load_events(event_bytes)
+            try:
+                events: list[Event] = self.decoder.feed(event_bytes)
+            except EventDecodeError as err:
+                self.logger.error("could not decode server events due to: %s", err)
+                break
+
             for event in events:
                 if event.context is EventContext.LAUNCHER:
                     process_launcher_events(event)
@@ -98,7 +108,7 @@ class ChessClient(Net):
                                                       self.user.u_pass))
 
     def send_queue_request(self) -> None:
-        EventManager.dispatch(self.socket, EnterQueueEvent())
+        EventManager.dispatch(self.socket, EnterQueueEvent(UserConfig.get().data.timer_config_name))
 
     def process_game_events(self, game_event: Event) -> None:
 
@@ -108,6 +118,7 @@ class ChessClient(Net):
         assert isinstance(game_event, GameEvent)
 
         Player.process_game_event(game_event, ChessPygameLauncher.get().multi_player.match_fen, player)
+        FrameScheduler.wake_up()
 
         if not isinstance(game_event, EndGameEvent):
             return
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+from typing import Sequence
+
+from config.pg_config import DATA_SIZE
+from config.tk_config import ASYNC_LISTEN_BACKLOG
+from config.tk_config import ASYNC_MAX_CONNECTIONS
+from config.tk_config import MATCHMAKING_TICK
+from database.models import User
+from event.event import Event
+from event.event_codec import encode_frame
+from event.launcher_events import DisconnectEvent
+from network.server.chess_server import ChessServer
+from network.server.server_user import ServerUser
+
+
+class AsyncServerUser(ServerUser):
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        super().__init__(writer.get_extra_info('socket'), writer.get_extra_info('peername'))
+        self.reader: asyncio.StreamReader = reader
+        self.writer: asyncio.StreamWriter = writer
+
+    def send(self, payload: Event | Sequence[Event]) -> None:
+        if self.writer.is_closing():
+            return
+        self.writer.write(encode_frame(payload))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncChessServer(ChessServer):
+    """
+    serves the lobby and every match from a single event loop, each connection is a coroutine
+    instead of a thread so idle users only cost their socket buffers
+    """
+    async_chess_server: AsyncChessServer | None = None
+
+    @staticmethod
+    def get() -> AsyncChessServer:
+        if AsyncChessServer.async_chess_server is None:
+            AsyncChessServer.async_chess_server = AsyncChessServer()
+        return AsyncChessServer.async_chess_server
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.max_connections = ASYNC_MAX_CONNECTIONS
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.stream_server: asyncio.Server | None = None
+
+    def run(self, start_control_thread: bool = True) -> None:
+        if not self.get_is_running():
+            if not self.start():
+                return
+
+        if start_control_thread:
+            self.server_control_thread.start()
+        self.clock_thread.start()
+
+        asyncio.run(self.serve())
+
+    async def serve(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.stream_server = await asyncio.start_server(self.handle_connection, sock=self.socket,
+                                                        backlog=ASYNC_LISTEN_BACKLOG)
+        ticks: asyncio.Task[None] = asyncio.create_task(self.run_ticks())
+        async with self.stream_server:
+            try:
+                await self.stream_server.serve_forever()
+            except asyncio.CancelledError:
+                pass
+        ticks.cancel()
+
+    async def run_ticks(self) -> None:
+        while self.get_is_running():
+            await asyncio.sleep(MATCHMAKING_TICK)
+            self.tick()
+
+    def flag_matches(self, match_ids: list[int]) -> None:
+        # the clock thread only finds the matches, they are ended on the event loop with the rest of the match events
+        if match_ids and self.loop is not None:
+            self.loop.call_soon_threadsafe(super().flag_matches, match_ids)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        server_user: AsyncServerUser = AsyncServerUser(reader, writer)
+        if not await self.accept_connection(server_user):
+            server_user.close()
+            return
+
+        self.lobby.add_user(server_user)
+        self.logger.info("client: %s connected", server_user.get_db_user().u_name)
+
+        events: list[Event] | None = server_user.pending_events
+        server_user.pending_events = []
+        while self.get_is_running() and events is not None:
+            for event in events:
+                self.logger.info("command : %s received from client %s", event.type.name,
+                                 server_user.get_db_user().u_name)
+                self.process_event(event, server_user)
+
+            try:
+                await writer.drain()
+            except ConnectionError as error:
+                self.logger.debug("connection error: %s", error)
+                break
+
+            events = await self.read_events(server_user)
+
+        self.remove_user(server_user)
+        server_user.close()
+        self.logger.info("client: %s disconnected", server_user.get_db_user().u_name)
+
+    async def accept_connection(self, server_user: AsyncServerUser) -> bool:
+        events: list[Event] | None = await self.read_events(server_user)
+        if events is None:
+            return False
+
+        verification: Optional[Event]
+        verification, *server_user.pending_events = events
+
+        if self.lobby.get_connection_count() >= self.max_connections:
+            server_user.send([DisconnectEvent("Too Many Connections")])
+            return False
+
+        # the database lookup blocks, so it runs on the default executor instead of the event loop
+        assert self.loop is not None, "connections are only handled while the loop is running"
+        db_user: User | None = await self.loop.run_in_executor(None, self.lobby.fetch_user, verification)
+        if not self.lobby.verify_fetched_user(server_user, verification, db_user):
+            server_user.send([DisconnectEvent("Could not verify user")])
+            self.logger.info("could not verify user")
+            return False
+
+        return True
+
+    async def read_events(self, server_user: AsyncServerUser) -> list[Event] | None:
+        events: list[Event] = []
+        while not events:
+            try:
+                data: bytes = await server_user.reader.read(DATA_SIZE)
+            except ConnectionError as error:
+                self.logger.debug("connection error: %s", error)
+                return None
+
+            if not data:
+                self.logger.debug("invalid data")
+                return None
+
+            decoded: list[Event] | None = self.decode_events(server_user, data)
+            if decoded is None:
+                return None
+            events = decoded
+
+        return events
+
+    def shut_down(self) -> None:
+        if self.loop is None:
+            super().shut_down()
+            return
+
+        self.loop.call_soon_threadsafe(self.shut_down_in_loop)
+
+    def shut_down_in_loop(self) -> None:
+        self.set_is_running(False)
+        self.clock_scheduler.stop()
+        self.disconnect_users()
+        for user in list(self.lobby.users.values()):
+            user.close()
+
+        if self.stream_server is not None:
+            self.stream_server.close()
+        self.database.stop_write_queue()
+        self.logger.info("shutting down server")
@@ -4,20 +4,21 @@ import enum
 import logging
 import socket as skt
 import threading
+import time
 from _thread import start_new_thread
-from pickle import UnpicklingError
 from typing import Optional
 from uuid import uuid1
 
 from chess.board.side import Side
 from chess.game.chess_match import Match
 from chess.game.chess_match import MatchResult
-from chess.timer.timer_config import DefaultConfigs
+from chess.game.move_validator import MatchEngine
 from chess.timer.timer_config import TimerConfig
 from config.logging_manager import AppLoggers
 from config.logging_manager import LoggingManager
 from config.pg_config import DATA_SIZE
 from config.tk_config import LOCAL_CHESS_DB_INFO
+from config.tk_config import MATCHMAKING_TICK
 from config.tk_config import MAX_CONNECTIONS
 from config.tk_config import SERVER_SHUT
 from database.chess_db import ChessDataBase
@@ -25,12 +26,18 @@ from database.chess_db import DataBaseInfo
 from event.event import Event
 from event.event import EventContext
 from event.event import EventType
-from event.event_manager import EventManager
+from event.event_codec import EventDecodeError
 from event.game_events import EndGameEvent
 from event.game_events import GameEvent
 from event.launcher_events import DisconnectEvent
+from event.launcher_events import EnterQueueEvent
 from event.launcher_events import LaunchGameEvent
 from network.chess_network import Net
+from network.server.clock_scheduler import ClockScheduler
+from network.server.match_lifecycle import MatchLifecycle
+from network.server.match_lifecycle import MatchStats
+from network.server.match_lifecycle import ServerMatch
+from network.server.match_lifecycle import get_deep_size
 from network.server.server_lobby import ServerLobby
 from network.server.server_user import ServerUser
 
@@ -40,19 +47,10 @@ you can get the process ID with port with this command : sudo lsof -i:PORT
 '''
 
 
-class ServerMatch:
-    def __init__(self, timer_config: TimerConfig, white: ServerUser, black: ServerUser) -> None:
-        self.match: Match = Match(timer_config)
-        self.white: ServerUser = white
-        self.black: ServerUser = black
-
-    def get_sockets(self) -> tuple[skt.socket, skt.socket]:
-        return self.white.socket, self.black.socket
-
-
 class ChessServer(Net):
     server: ChessServer | None = None
     database_info: DataBaseInfo = DataBaseInfo(*LOCAL_CHESS_DB_INFO)
+    match_engine: MatchEngine = MatchEngine.CHESS_ENGINE
 
     @staticmethod
     def get_host_ipv4() -> str:
@@ -71,6 +69,10 @@ class ChessServer(Net):
     def set_database_info(database_info: DataBaseInfo) -> None:
         ChessServer.database_info = database_info
 
+    @staticmethod
+    def set_match_engine(match_engine: MatchEngine) -> None:
+        ChessServer.match_engine = match_engine
+
     @staticmethod
     def get() -> ChessServer:
         if ChessServer.server is None:
@@ -91,9 +93,14 @@ class ChessServer(Net):
         self.is_running: bool = False
         self.logger: logging.Logger = LoggingManager.get_logger(AppLoggers.SERVER)
         self.server_control_thread: threading.Thread = threading.Thread(target=self.server_control_command_parser)
+        self.tick_thread: threading.Thread = threading.Thread(target=self.tick_loop, daemon=True)
+        self.clock_thread: threading.Thread = threading.Thread(target=self.clock_loop, daemon=True)
+        self.clock_scheduler: ClockScheduler = ClockScheduler()
         self.database: ChessDataBase = ChessDataBase(ChessServer.database_info)
         self.lobby: ServerLobby = ServerLobby(self.logger, self.database)
-        self.matches: dict[int, ServerMatch] = {}
+        self.match_lifecycle: MatchLifecycle = MatchLifecycle()
+        self.games: dict[int, Match] = {}
+        self.max_connections: int = MAX_CONNECTIONS
 
     def start(self, is_server_online: bool | None = None) -> bool:
         if is_server_online is None:
@@ -139,6 +146,8 @@ class ChessServer(Net):
 
         if start_control_thread:
             self.server_control_thread.start()
+        self.tick_thread.start()
+        self.clock_thread.start()
 
         while self.get_is_running():
 
@@ -148,8 +157,8 @@ class ChessServer(Net):
 
             verification: Optional[Event] = self.receive_verification(server_user)
 
-            if self.lobby.get_connection_count() >= MAX_CONNECTIONS:
-                EventManager.dispatch(server_user.socket, [DisconnectEvent("Too Many Connections")])
+            if self.lobby.get_connection_count() >= self.max_connections:
+                server_user.send([DisconnectEvent("Too Many Connections")])
 
             elif self.lobby.verify_user(server_user, verification):
                 self.lobby.add_user(server_user)
@@ -157,8 +166,8 @@ class ChessServer(Net):
                 start_new_thread(self.user_listener, (server_user,))
 
             else:
-                EventManager.dispatch(server_user.socket, [DisconnectEvent("Could not verify user")])
-                server_user.socket.close()
+                server_user.send([DisconnectEvent("Could not verify user")])
+                server_user.close()
                 self.logger.info("could not verify user")
 
     def server_control_command_parser(self) -> None:
@@ -175,31 +184,61 @@ class ChessServer(Net):
         if command is ServerControlCommands.SHUT_DOWN:
             self.shut_down()
 
+        elif command is ServerControlCommands.MATCH_STATS:
+            self.log_match_stats()
+
     def user_listener(self, server_user: ServerUser) -> None:
         with server_user.socket:
-            while self.get_is_running():
-                try:
-                    data: bytes = server_user.socket.recv(DATA_SIZE)
-                except ConnectionResetError as error:
-                    self.logger.debug("connection error: %s", error)
-                    break
-
-                if not data:
-                    self.logger.debug("invalid data")
-                    break
+            events: list[Event] | None = server_user.pending_events
+            server_user.pending_events = []
+            while self.get_is_running() and events is not None:
+                for event in events:
+                    self.logger.info("command : %s received from client %s", event.type.name,
+                                     server_user.get_db_user().u_name)
 
-                event: Event = EventManager.load_event(data)
-                self.logger.info("command : %s received from client %s", event.type.name,
-                                 server_user.get_db_user().u_name)
+                    self.process_event(event, server_user)
 
-                self.process_event(event, server_user)
+                events = self.receive_events(server_user)
 
-        self.lobby.remove_user(server_user)
-        server_user.socket.close()
+        self.remove_user(server_user)
+        server_user.close()
         assert server_user.db_user is not None, "user cannot be None, because at this point the user has been verified"
         self.logger.info("client: %s disconnected", server_user.db_user.u_name)
         return
 
+    def remove_user(self, server_user: ServerUser) -> None:
+        self.lobby.remove_user(server_user)
+        server_match: ServerMatch | None = self.match_lifecycle.user_left(server_user.get_db_user().u_id)
+        if server_match is not None:
+            self.logger.info("client: %s left match %s", server_user.get_db_user().u_name, server_match.match_id)
+
+    def receive_events(self, server_user: ServerUser) -> list[Event] | None:
+        events: list[Event] = []
+        while not events:
+            try:
+                data: bytes = server_user.socket.recv(DATA_SIZE)
+            except ConnectionResetError as error:
+                self.logger.debug("connection error: %s", error)
+                return None
+
+            if not data:
+                self.logger.debug("invalid data")
+                return None
+
+            decoded: list[Event] | None = self.decode_events(server_user, data)
+            if decoded is None:
+                return None
+            events = decoded
+
+        return events
+
+    def decode_events(self, server_user: ServerUser, data: bytes) -> list[Event] | None:
+        try:
+            return server_user.decoder.feed(data)
+        except EventDecodeError as error:
+            self.logger.debug("could not decode events: %s", error)
+            return None
+
     def process_event(self, event: Event, server_user: ServerUser) -> None:
         if event.context is EventContext.LAUNCHER:
             self.process_in_launcher_event(event, server_user)
@@ -209,40 +248,150 @@ class ChessServer(Net):
 
     def process_in_launcher_event(self, event: Event, server_user: ServerUser) -> None:
         if event.type is EventType.ENTER_QUEUE:
-            self.lobby.enter_queue(server_user)
-
-            for players in self.lobby.get_match_ups():
-                self.begin_match(uuid1(), *players)
+            assert isinstance(event, EnterQueueEvent), f"expected EnterQueueEvent instead got: {type(event)}"
+            self.lobby.enter_queue(server_user, event.timer_name)
 
         else:
             raise Exception(f"received unexpected event: {event.type}")
 
     def process_in_game_event(self, game_event: Event) -> None:
         assert isinstance(game_event, GameEvent), f"expected GAME context instead got: {game_event.context}"
-        server_match: ServerMatch = self.matches[game_event.match_id]
+        match: Match | None = self.games.get(game_event.match_id)
+        server_match: ServerMatch | None = self.match_lifecycle.get(game_event.match_id)
+        if match is None or server_match is None:
+            # events the players sent while the match was ending
+            self.logger.debug("event: %s for match %s that is over", game_event.type.name, game_event.match_id)
+            return
+
+        with server_match.lock:
+            if match.is_over():
+                self.logger.debug("event: %s for match %s that is over", game_event.type.name, game_event.match_id)
+                return
+            response: list[GameEvent] = match.process_game_event(game_event)
+            moves: str = match.get_pgn() if match.is_over() else ''
+            self.update_clock(server_match.match_id, match)
+            self.handle_match_response(server_match, response, moves)
+
+    def update_clock(self, match_id: int, match: Match) -> None:
+        if (deadline := match.get_flag_deadline()) is None:
+            self.clock_scheduler.cancel(match_id)
+        else:
+            self.clock_scheduler.schedule(match_id, deadline)
+
+    def clock_loop(self) -> None:
+        while self.get_is_running():
+            try:
+                self.flag_matches(self.clock_scheduler.wait_for_due())
+            except Exception as err:
+                self.logger.error("could not check the match clocks due to : %s", err)
+
+    def flag_matches(self, match_ids: list[int]) -> None:
+        for match_id in match_ids:
+            try:
+                self.flag_match(match_id)
+            except Exception as err:
+                self.logger.error("could not check the clock of match %s due to : %s", match_id, err)
+
+    def flag_match(self, match_id: int) -> None:
+        match: Match | None = self.games.get(match_id)
+        server_match: ServerMatch | None = self.match_lifecycle.get(match_id)
+        if match is None or server_match is None:
+            return
+
+        with server_match.lock:
+            if not (response := match.check_flag(time.monotonic())):
+                self.update_clock(match_id, match)
+                return
+
+            self.logger.info("match %s flag fell", match_id)
+            self.handle_match_response(server_match, response, match.get_pgn())
 
-        response: list[GameEvent] = server_match.match.process_game_event(game_event)
+    def handle_match_response(self, server_match: ServerMatch, response: list[GameEvent], moves: str) -> None:
+        '''
+        moves is the pgn movetext of the match, it is only written once the match is over
+        '''
         for event in response.copy():
-            if isinstance(event, EndGameEvent):
-                result = self.database.create_game(
-                    server_match.white.db_user,
-                    server_match.black.db_user,
-                    "NO MOVES SORRY",
-                    event.result,
-                    server_match.match.timer_config.get_value_str()
-                )
-
-        for sock in server_match.get_sockets():
-            EventManager.dispatch(sock, response)
-
-    def begin_match(self, match_id: uuid1, white_player: ServerUser, black_player: ServerUser) -> None:
-        server_match: ServerMatch = ServerMatch(DefaultConfigs.BLITZ_5_0, white_player, black_player)
-        self.matches[match_id.int] = server_match
-
-        EventManager.dispatch(white_player.socket,
-                              [LaunchGameEvent(match_id.int, server_match.match.timer_config.time, Side.WHITE.name)])
-        EventManager.dispatch(black_player.socket,
-                              [LaunchGameEvent(match_id.int, server_match.match.timer_config.time, Side.BLACK.name)])
+            # a match can only end once, a second end game event lost the race and is dropped
+            if isinstance(event, EndGameEvent) and not self.end_match(server_match, event.result, moves):
+                response.remove(event)
+
+        if not response:
+            return
+        for user in server_match.get_users():
+            user.send(response)
+
+    def end_match(self, server_match: ServerMatch, result: str, moves: str) -> bool:
+        self.clock_scheduler.cancel(server_match.match_id)
+        if self.match_lifecycle.finish(server_match.match_id, result) is None:
+            return False
+
+        self.database.queue_game(server_match.white.get_db_user(), server_match.black.get_db_user(), moves, result,
+                                 server_match.timer_config.get_value_str())
+        self.remove_game(server_match.match_id)
+        self.logger.info("match %s ended, %s matches live", server_match.match_id, len(self.match_lifecycle))
+        return True
+
+    def remove_game(self, match_id: int) -> None:
+        self.games.pop(match_id, None)
+
+    def reap_abandoned_matches(self) -> None:
+        for server_match in self.match_lifecycle.reap_abandoned():
+            assert server_match.abandoned_by is not None, "an abandoned match knows the side that left"
+            self.logger.info("match %s abandoned by %s", server_match.match_id, server_match.abandoned_by.name)
+            self.abandon_game(server_match, server_match.abandoned_by.name)
+
+    def abandon_game(self, server_match: ServerMatch, side: str) -> None:
+        if (match := self.games.get(server_match.match_id)) is None:
+            return
+        with server_match.lock:
+            if match.is_over():
+                return
+            response: list[GameEvent] = match.abandon(side)
+            self.handle_match_response(server_match, response, match.get_pgn())
+
+    def get_game_sizes(self) -> list[int]:
+        return [get_deep_size(game) for game in list(self.games.values())]
+
+    def get_match_stats(self) -> MatchStats:
+        return self.match_lifecycle.get_stats(self.get_game_sizes())
+
+    def log_match_stats(self) -> None:
+        stats: MatchStats = self.get_match_stats()
+        self.logger.info("matches live: %s abandoned: %s finished: %s archived: %s, bytes per game mean: %s max: %s",
+                         *stats)
+
+    def matchmaking_tick(self) -> None:
+        for timer_config, white_player, black_player in self.lobby.get_match_ups():
+            self.begin_match(uuid1(), white_player, black_player, timer_config)
+
+    def tick(self) -> None:
+        # one failing step must not stop matchmaking or reaping for the whole server
+        for step in (self.matchmaking_tick, self.reap_abandoned_matches):
+            try:
+                step()
+            except Exception as err:
+                self.logger.error("server tick: %s failed due to : %s", step.__name__, err)
+
+    def tick_loop(self) -> None:
+        while self.get_is_running():
+            time.sleep(MATCHMAKING_TICK)
+            self.tick()
+
+    def begin_match(self, match_id: uuid1, white_player: ServerUser, black_player: ServerUser,
+                    timer_config: TimerConfig) -> None:
+        server_match: ServerMatch = ServerMatch(match_id.int, timer_config, white_player, black_player)
+        self.add_game(match_id.int, server_match.timer_config)
+        self.match_lifecycle.add(server_match)
+
+        white_player.send([LaunchGameEvent(match_id.int, server_match.timer_config.time, Side.WHITE.name)])
+        black_player.send([LaunchGameEvent(match_id.int, server_match.timer_config.time, Side.BLACK.name)])
+        # a player that left while being paired is not removed from the match by their listener, it was not added yet
+        for player in server_match.get_users():
+            if not self.lobby.is_connected(player):
+                self.match_lifecycle.user_left(player.get_db_user().u_id)
+
+    def add_game(self, match_id: int, timer_config: TimerConfig) -> None:
+        self.games[match_id] = Match(timer_config, ChessServer.match_engine)
 
     def shut_down(self) -> None:
         self.set_is_running(False)
@@ -251,32 +400,30 @@ class ChessServer(Net):
         except OSError:
             pass
         self.reset_socket()
+        self.clock_scheduler.stop()
+        self.disconnect_users()
+        self.database.stop_write_queue()
+        self.logger.info("shutting down server")
 
+    def disconnect_users(self) -> None:
         disconnect: DisconnectEvent = DisconnectEvent(SERVER_SHUT)
         end_game: EndGameEvent = EndGameEvent(-1, MatchResult.DRAW.name, SERVER_SHUT)
-        for user in self.lobby.users:
-            EventManager.dispatch(user.socket, [disconnect, end_game])
+        for user in self.lobby.users.values():
+            user.send([disconnect, end_game])
         self.logger.info("telling clients to disconnect")
-        self.logger.info("shutting down server")
 
     def receive_verification(self, user: ServerUser) -> Optional[Event]:
-        try:
-            data: bytes = user.socket.recv(DATA_SIZE)
-        except ConnectionResetError as error:
-            self.logger.debug("connection error: %s", error)
+        events: list[Event] | None = self.receive_events(user)
+        if events is None:
             return None
 
-        try:
-            return EventManager.load_event(data)
-        except UnpicklingError:
-            return None
-
-        except EOFError:
-            return None
+        verification, *user.pending_events = events
+        return verification
 
 
 class ServerControlCommands(enum.Enum):
     SHUT_DOWN = enum.auto()
+    MATCH_STATS = enum.auto()
 
     def get_one_word(self) -> str:
         one_word: str = self.name
@@ -305,8 +452,8 @@ class ServerControlCommands(enum.Enum):
             return ServerControlCommands.get("_".join(input_command.split(' ')).upper())
 
         else:
-            if input_command.upper() == ServerControlCommands.SHUT_DOWN.get_one_word():
-                return ServerControlCommands.SHUT_DOWN
+            for command in ServerControlCommands:
+                if input_command.upper() == command.get_one_word():
+                    return command
 
-            else:
-                return None
+            return None
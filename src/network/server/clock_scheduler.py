@@ -0,0 +1,101 @@
+import heapq
+import threading
+import time
+
+'''
+the flag fall deadline of every running clock in one min heap, so finding the clocks that ran out only looks at
+the top of the heap whatever the number of matches. rescheduling a match pushes a new entry and leaves the old one
+in the heap, entries are matched against the current version of their match and the stale ones are skipped
+'''
+# the heap is rebuilt without stale entries once they outnumber the live ones by this factor
+STALE_ENTRY_FACTOR: int = 2
+
+
+class ClockScheduler:
+    def __init__(self) -> None:
+        # (deadline, version, match_id), the version is unique so the match ids are never compared
+        self.deadlines: list[tuple[float, int, int]] = []
+        self.versions: dict[int, int] = {}
+        self.version: int = 0
+        self.is_stopped: bool = False
+        self.lock: threading.Lock = threading.Lock()
+        self.condition: threading.Condition = threading.Condition(self.lock)
+        # a thread is in wait_for_due, only then a new earliest deadline needs a notify
+        self.is_waiting: bool = False
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def schedule(self, match_id: int, deadline: float) -> None:
+        with self.lock:
+            self.version += 1
+            self.versions[match_id] = self.version
+            heapq.heappush(self.deadlines, (deadline, self.version, match_id))
+            if len(self.deadlines) > STALE_ENTRY_FACTOR * len(self.versions) + 1:
+                self.compact()
+            # the waiting thread might be sleeping until a later deadline
+            if self.is_waiting and self.deadlines[0][1] == self.version:
+                self.condition.notify()
+
+    def cancel(self, match_id: int) -> None:
+        with self.lock:
+            self.versions.pop(match_id, None)
+
+    def get_next_deadline(self) -> float | None:
+        with self.lock:
+            self.discard_stale()
+            return self.deadlines[0][0] if self.deadlines else None
+
+    def get_timeout(self, now: float | None = None) -> float | None:
+        # how long a caller can block before the next clock runs out, None when no clock is running
+        deadline: float | None = self.get_next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - (time.monotonic() if now is None else now))
+
+    def pop_due(self, now: float | None = None) -> list[int]:
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            return self.pop_due_locked(now)
+
+    def pop_due_locked(self, now: float) -> list[int]:
+        due: list[int] = []
+        while self.deadlines and self.deadlines[0][0] <= now:
+            _, version, match_id = heapq.heappop(self.deadlines)
+            if self.versions.get(match_id) != version:
+                continue
+            del self.versions[match_id]
+            due.append(match_id)
+
+        return due
+
+    def wait_for_due(self) -> list[int]:
+        '''
+        blocks until a clock runs out and returns the matches whose clock did, returns nothing once stopped
+        '''
+        with self.condition:
+            self.is_waiting = True
+            try:
+                while not self.is_stopped:
+                    self.discard_stale()
+                    timeout: float | None = self.deadlines[0][0] - time.monotonic() if self.deadlines else None
+                    if timeout is not None and timeout <= 0:
+                        return self.pop_due_locked(time.monotonic())
+                    self.condition.wait(timeout)
+            finally:
+                self.is_waiting = False
+
+        return []
+
+    def stop(self) -> None:
+        with self.condition:
+            self.is_stopped = True
+            self.condition.notify_all()
+
+    def discard_stale(self) -> None:
+        while self.deadlines and self.versions.get(self.deadlines[0][2]) != self.deadlines[0][1]:
+            heapq.heappop(self.deadlines)
+
+    def compact(self) -> None:
+        self.deadlines = [entry for entry in self.deadlines if self.versions.get(entry[2]) == entry[1]]
+        heapq.heapify(self.deadlines)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import collections
+import enum
+import statistics
+import sys
+import threading
+import time
+import types
+import typing
+from array import array
+
+from chess.board.side import Side
+from chess.timer.timer_config import TimerConfig
+from config.tk_config import MATCH_ABANDON_TIMEOUT
+from config.tk_config import MATCH_ARCHIVE_SIZE
+from network.server.server_user import ServerUser
+
+'''
+the server only keeps the matches that are being played, a finished match is evicted straight away and a short
+summary of it is kept in a bounded archive, the full game is in the database.
+when a player disconnects mid game the match is abandoned, a disconnected player can not rejoin it. the first tick
+after MATCH_ABANDON_TIMEOUT ends it as a forfeit in favour of the opponent, straight away when both players left
+'''
+
+
+class MatchState(enum.Enum):
+    LIVE = enum.auto()
+    ABANDONED = enum.auto()
+    # the server asked the game to end, waiting for its end game response
+    REAPED = enum.auto()
+
+
+class ServerMatch:
+    def __init__(self, match_id: int, timer_config: TimerConfig, white: ServerUser, black: ServerUser) -> None:
+        self.match_id: int = match_id
+        self.timer_config: TimerConfig = timer_config
+        self.white: ServerUser = white
+        self.black: ServerUser = black
+        self.state: MatchState = MatchState.LIVE
+        self.started_at: float = time.monotonic()
+        self.abandoned_at: float = 0
+        self.abandoned_by: Side | None = None
+        self.left: set[int] = set()
+        # the listener threads, the clock thread and the tick thread all change the match
+        self.lock: threading.Lock = threading.Lock()
+
+    def get_users(self) -> tuple[ServerUser, ServerUser]:
+        return self.white, self.black
+
+    def get_side(self, u_id: int) -> Side:
+        return Side.WHITE if self.white.get_db_user().u_id == u_id else Side.BLACK
+
+
+class ArchivedMatch(typing.NamedTuple):
+    match_id: int
+    white: str
+    black: str
+    result: str
+    time_config: str
+    seconds: float
+
+
+class MatchStats(typing.NamedTuple):
+    live: int
+    abandoned: int
+    finished: int
+    archived: int
+    # mean and max deep size in bytes of the games held by this process
+    mean_game_bytes: int
+    max_game_bytes: int
+
+
+class MatchLifecycle:
+    def __init__(self) -> None:
+        self.matches: dict[int, ServerMatch] = {}
+        # match id of every user that is playing, keyed by u_id
+        self.user_matches: dict[int, int] = {}
+        self.archive: collections.deque[ArchivedMatch] = collections.deque(maxlen=MATCH_ARCHIVE_SIZE)
+        self.finished: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def add(self, server_match: ServerMatch) -> None:
+        with self.lock:
+            self.matches[server_match.match_id] = server_match
+            for user in server_match.get_users():
+                self.user_matches[user.get_db_user().u_id] = server_match.match_id
+
+    def get(self, match_id: int) -> ServerMatch | None:
+        return self.matches.get(match_id)
+
+    def finish(self, match_id: int, result: str) -> ServerMatch | None:
+        with self.lock:
+            if (server_match := self.matches.pop(match_id, None)) is None:
+                return None
+
+            for user in server_match.get_users():
+                u_id: int = user.get_db_user().u_id
+                if self.user_matches.get(u_id) == match_id:
+                    del self.user_matches[u_id]
+
+            self.finished += 1
+            self.archive.append(ArchivedMatch(match_id, server_match.white.get_db_user().u_name,
+                                              server_match.black.get_db_user().u_name, result,
+                                              server_match.timer_config.get_value_str(),
+                                              time.monotonic() - server_match.started_at))
+            return server_match
+
+    def user_left(self, u_id: int, now: float | None = None) -> ServerMatch | None:
+        with self.lock:
+            if (match_id := self.user_matches.get(u_id)) is None:
+                return None
+
+            server_match: ServerMatch = self.matches[match_id]
+            server_match.left.add(u_id)
+            if server_match.state is MatchState.LIVE:
+                server_match.state = MatchState.ABANDONED
+                server_match.abandoned_at = time.monotonic() if now is None else now
+                server_match.abandoned_by = server_match.get_side(u_id)
+            return server_match
+
+    def reap_abandoned(self, now: float | None = None) -> list[ServerMatch]:
+        '''
+        the abandoned matches that timed out, or that both players left, they are only returned once
+        '''
+        now = time.monotonic() if now is None else now
+        reaped: list[ServerMatch] = []
+        with self.lock:
+            for server_match in self.matches.values():
+                if server_match.state is not MatchState.ABANDONED:
+                    continue
+
+                if len(server_match.left) < 2 and now - server_match.abandoned_at < MATCH_ABANDON_TIMEOUT:
+                    continue
+
+                server_match.state = MatchState.REAPED
+                reaped.append(server_match)
+
+        return reaped
+
+    def get_stats(self, game_sizes: list[int]) -> MatchStats:
+        with self.lock:
+            abandoned: int = sum(server_match.state is not MatchState.LIVE for server_match in self.matches.values())
+            return MatchStats(len(self.matches), abandoned, self.finished, len(self.archive),
+                              int(statistics.mean(game_sizes)) if game_sizes else 0, max(game_sizes, default=0))
+
+
+def get_deep_size(obj: object, seen: set[int] | None = None) -> int:
+    '''
+    size of the object and of everything it references, classes, modules, functions and enum members are shared
+    between matches so they are not counted
+    '''
+    seen = set() if seen is None else seen
+    if id(obj) in seen or isinstance(obj, (type, types.ModuleType, types.FunctionType, types.MethodType,
+                                           types.BuiltinFunctionType, enum.Enum)):
+        return 0
+
+    seen.add(id(obj))
+    size: int = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, array, int, float)):
+        return size
+
+    if isinstance(obj, dict):
+        size += sum(get_deep_size(key, seen) + get_deep_size(value, seen) for key, value in obj.items())
+
+    elif isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+        size += sum(get_deep_size(item, seen) for item in obj)
+
+    if hasattr(obj, '__dict__'):
+        size += get_deep_size(vars(obj), seen)
+
+    for slot in getattr(type(obj), '__slots__', ()):
+        if hasattr(obj, slot):
+            size += get_deep_size(getattr(obj, slot), seen)
+
+    return size
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import enum
+import logging
+import multiprocessing
+import queue
+import time
+import typing
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+
+from chess_engine.movement.piece_movement import PieceMovement
+
+from chess.game.chess_match import Match
+from chess.game.move_validator import MatchEngine
+from chess.timer.timer_config import TimerConfig
+from config.logging_manager import AppLoggers
+from config.logging_manager import LoggingConfig
+from config.logging_manager import LoggingManager
+from event.event import Event
+from event.event_codec import FRAME_HEADER
+from event.event_codec import decode_payload
+from event.event_codec import encode_frame
+from event.game_events import GameEvent
+from network.server.clock_scheduler import ClockScheduler
+
+'''
+every shard is a worker process that owns the Match of a subset of the match ids, the front end process
+forwards game events to the shard of their match and reads the responses back from a queue shared by every shard.
+events cross the process boundary as wire codec frames so they do not need to be pickled
+'''
+
+
+class ShardCommand(enum.Enum):
+    ADD_GAME = enum.auto()
+    GAME_EVENT = enum.auto()
+    ABANDON = enum.auto()
+
+
+class ShardRequest(typing.NamedTuple):
+    command: ShardCommand
+    match_id: int
+    # (TimerConfig, MatchEngine) for ADD_GAME, an encoded frame for GAME_EVENT, the side that left for ABANDON
+    data: typing.Any
+
+
+class ShardResponse(typing.NamedTuple):
+    match_id: int
+    frame: bytes
+    # pgn movetext once the match is over, written by the shard so the front end does not replay the game
+    moves: str
+
+
+class MatchShard:
+    def __init__(self, shard_id: int, responses: Queue[ShardResponse | None]) -> None:
+        self.shard_id: int = shard_id
+        self.requests: Queue[ShardRequest | None] = multiprocessing.Queue()
+        # a spawned process does not inherit the loaded logging configs
+        self.process: BaseProcess = multiprocessing.Process(
+            target=run_shard, args=(self.requests, responses, LoggingManager.get_config(AppLoggers.SERVER)),
+            name=f"match-shard-{shard_id}", daemon=True)
+
+    def start(self) -> None:
+        self.process.start()
+
+    def add_game(self, match_id: int, timer_config: TimerConfig, engine: MatchEngine) -> None:
+        self.requests.put(ShardRequest(ShardCommand.ADD_GAME, match_id, (timer_config, engine)))
+
+    def send_game_event(self, game_event: GameEvent) -> None:
+        self.requests.put(ShardRequest(ShardCommand.GAME_EVENT, game_event.match_id, encode_frame(game_event)))
+
+    def abandon_game(self, match_id: int, side: str) -> None:
+        self.requests.put(ShardRequest(ShardCommand.ABANDON, match_id, side))
+
+    def stop(self) -> None:
+        if not self.process.is_alive():
+            return
+        self.requests.put(None)
+        self.process.join()
+
+
+def run_shard(requests: Queue[ShardRequest | None], responses: Queue[ShardResponse | None],
+              logging_config: LoggingConfig) -> None:
+    # the move tables are not shared with the front end when the process is spawned instead of forked
+    PieceMovement.load()
+    LoggingManager.configs[AppLoggers.SERVER] = logging_config
+    logger: logging.Logger = LoggingManager.get_logger(AppLoggers.SERVER)
+    games: dict[int, Match] = {}
+    # the shard runs the clocks of its games, waiting for a request never goes past the next flag fall
+    clocks: ClockScheduler = ClockScheduler()
+
+    while True:
+        try:
+            if (request := requests.get(timeout=clocks.get_timeout())) is None:
+                break
+        except queue.Empty:
+            request = None
+
+        # one bad event must not stop the other matches of the shard
+        if request is not None:
+            try:
+                process_request(request, games, clocks, responses)
+            except Exception as err:
+                logger.error("shard could not process %s for match %s due to : %s", request.command.name,
+                             request.match_id, err)
+
+        for match_id in clocks.pop_due():
+            if (match := games.get(match_id)) is None:
+                continue
+            try:
+                send_response(responses, match_id, match, match.check_flag(time.monotonic()), games, clocks)
+            except Exception as err:
+                logger.error("shard could not check the clock of match %s due to : %s", match_id, err)
+
+
+def process_request(request: ShardRequest, games: dict[int, Match], clocks: ClockScheduler,
+                    responses: Queue[ShardResponse | None]) -> None:
+    if request.command is ShardCommand.ADD_GAME:
+        games[request.match_id] = Match(*request.data)
+
+    elif request.match_id not in games:
+        # the match is over, the players sent these events while it was ending
+        return
+
+    elif request.command is ShardCommand.GAME_EVENT:
+        events: list[Event] = decode_payload(request.data, FRAME_HEADER.size, len(request.data))
+        match: Match = games[request.match_id]
+        response: list[GameEvent] = []
+        for event in events:
+            assert isinstance(event, GameEvent), f"expected GAME context instead got: {event.context}"
+            response.extend(match.process_game_event(event))
+        send_response(responses, request.match_id, match, response, games, clocks)
+
+    elif request.command is ShardCommand.ABANDON:
+        match = games[request.match_id]
+        send_response(responses, request.match_id, match, match.abandon(request.data), games, clocks)
+
+    else:
+        raise Exception(f"shard command: {request.command} not recognised")
+
+
+def send_response(responses: Queue[ShardResponse | None], match_id: int, match: Match, response: list[GameEvent],
+                  games: dict[int, Match], clocks: ClockScheduler) -> None:
+    if not match.is_over():
+        if (deadline := match.get_flag_deadline()) is not None:
+            clocks.schedule(match_id, deadline)
+        # a flag that had not fallen yet sends nothing
+        if response:
+            responses.put(ShardResponse(match_id, encode_frame(response), ''))
+        return
+
+    # a finished match is only kept by the database
+    del games[match_id]
+    clocks.cancel(match_id)
+    responses.put(ShardResponse(match_id, encode_frame(response), match.get_pgn()))
+
+
+def get_shard_index(match_id: int, shard_count: int) -> int:
+    # the low bits of a uuid1 are the node id of the server, the time_low field at the top varies between matches
+    return (match_id >> 96) % shard_count
@@ -0,0 +1,127 @@
+import random
+import threading
+import time
+import typing
+
+from chess.timer.timer_config import TimerConfig
+from config.tk_config import ELO_BUCKET_SIZE
+from config.tk_config import MAX_RATING_WINDOW
+from config.tk_config import RATING_WINDOW
+from config.tk_config import RATING_WINDOW_GROWTH
+
+'''
+every time control has its own queue, queued users are indexed by elo bucket so an opponent is found by looking at
+the buckets around the user instead of the whole queue. the accepted rating difference starts at RATING_WINDOW and
+grows with the time the user has been waiting, pairing happens on the server matchmaking tick
+'''
+
+
+class QueueEntry(typing.NamedTuple):
+    u_id: int
+    elo: int
+    queued_at: float
+
+
+class MatchUp(typing.NamedTuple):
+    timer_config: TimerConfig
+    white_id: int
+    black_id: int
+
+
+def get_bucket(elo: int) -> int:
+    return elo // ELO_BUCKET_SIZE
+
+
+def get_rating_window(waited: float) -> float:
+    return min(RATING_WINDOW + RATING_WINDOW_GROWTH * waited, MAX_RATING_WINDOW)
+
+
+class TimeControlQueue:
+    def __init__(self, timer_config: TimerConfig) -> None:
+        self.timer_config: TimerConfig = timer_config
+        # dicts keep insertion order, so the first entries of a bucket are the ones waiting the longest
+        self.entries: dict[int, QueueEntry] = {}
+        self.buckets: dict[int, dict[int, QueueEntry]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entry: QueueEntry) -> None:
+        self.entries[entry.u_id] = entry
+        self.buckets.setdefault(get_bucket(entry.elo), {})[entry.u_id] = entry
+
+    def remove(self, u_id: int) -> None:
+        entry: QueueEntry = self.entries.pop(u_id)
+        bucket: int = get_bucket(entry.elo)
+        del self.buckets[bucket][u_id]
+        if not self.buckets[bucket]:
+            del self.buckets[bucket]
+
+    def find_opponent(self, entry: QueueEntry, window: float) -> QueueEntry | None:
+        own_bucket: int = get_bucket(entry.elo)
+        reach: int = int(window) // ELO_BUCKET_SIZE + 1
+        # the own bucket first, then the buckets next to it further and further away
+        for offset in range(reach + 1):
+            for bucket in {own_bucket - offset, own_bucket + offset}:
+                for other in self.buckets.get(bucket, {}).values():
+                    if other.u_id != entry.u_id and abs(other.elo - entry.elo) <= window:
+                        return other
+        return None
+
+    def get_match_ups(self, now: float) -> list[MatchUp]:
+        match_ups: list[MatchUp] = []
+        for entry in list(self.entries.values()):
+            if entry.u_id not in self.entries:
+                continue
+
+            # the oldest entry has the widest window, so it decides if the difference is acceptable
+            opponent: QueueEntry | None = self.find_opponent(entry, get_rating_window(now - entry.queued_at))
+            if opponent is None:
+                continue
+
+            self.remove(entry.u_id)
+            self.remove(opponent.u_id)
+            white, black = (entry, opponent) if random.random() < 0.5 else (opponent, entry)
+            match_ups.append(MatchUp(self.timer_config, white.u_id, black.u_id))
+
+        return match_ups
+
+
+class Matchmaker:
+    def __init__(self) -> None:
+        # keyed by the timer value string so a custom timer matching a default one shares its queue
+        self.queues: dict[str, TimeControlQueue] = {}
+        self.queued: dict[int, str] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.queued)
+
+    def add(self, u_id: int, elo: int, timer_config: TimerConfig, now: float | None = None) -> None:
+        with self.lock:
+            if u_id in self.queued:
+                return
+
+            key: str = timer_config.get_value_str()
+            if key not in self.queues:
+                self.queues[key] = TimeControlQueue(timer_config)
+            self.queues[key].add(QueueEntry(u_id, elo, time.monotonic() if now is None else now))
+            self.queued[u_id] = key
+
+    def remove(self, u_id: int) -> None:
+        with self.lock:
+            if (key := self.queued.pop(u_id, None)) is None:
+                return
+            self.queues[key].remove(u_id)
+
+    def tick(self, now: float | None = None) -> list[MatchUp]:
+        now = time.monotonic() if now is None else now
+        match_ups: list[MatchUp] = []
+        with self.lock:
+            for time_control_queue in self.queues.values():
+                for match_up in time_control_queue.get_match_ups(now):
+                    del self.queued[match_up.white_id]
+                    del self.queued[match_up.black_id]
+                    match_ups.append(match_up)
+
+        return match_ups
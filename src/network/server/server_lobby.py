@@ -1,11 +1,14 @@
 import logging
-from random import shuffle
+import threading
 from typing import Optional
 
+from chess.timer.timer_config import DefaultConfigs
+from chess.timer.timer_config import TimerConfig
 from database.chess_db import ChessDataBase
 from database.models import User
 from event.event import Event
 from event.launcher_events import ServerVerificationEvent
+from network.server.matchmaker import Matchmaker
 from network.server.server_user import ServerUser
 
 
@@ -13,51 +16,96 @@ class ServerLobby:
     def __init__(self, logger: logging.Logger, database: ChessDataBase) -> None:
         self.logger: logging.Logger = logger
         self.database: ChessDataBase = database
-        self.ready_to_play: list[ServerUser] = []
-        self.users: set[ServerUser] = set()
-
-    def enter_queue(self, server_user: ServerUser) -> None:
-        self.ready_to_play.append(server_user)
+        self.matchmaker: Matchmaker = Matchmaker()
+        # queued users keyed by u_id, the matchmaker only knows the ids
+        self.queued_users: dict[int, ServerUser] = {}
+        # verified users keyed by user name
+        self.users: dict[str, ServerUser] = {}
+        # the listener threads queue and remove users while the tick thread pairs them
+        self.lock: threading.Lock = threading.Lock()
+
+    def enter_queue(self, server_user: ServerUser, timer_name: str) -> None:
+        db_user: User = server_user.get_db_user()
+        with self.lock:
+            self.queued_users[db_user.u_id] = server_user
+            self.matchmaker.add(db_user.u_id, db_user.elo, get_queue_timer_config(timer_name))
 
     def add_user(self, server_user: ServerUser) -> None:
         assert server_user.db_user is not None, "user should already be verified"
-        self.users.add(server_user)
-
-    def get_match_ups(self) -> list[tuple[ServerUser, ServerUser]]:
-        match_ups: list[tuple[ServerUser, ServerUser]] = []
+        with self.lock:
+            self.users[server_user.db_user.u_name] = server_user
+
+    def get_match_ups(self) -> list[tuple[TimerConfig, ServerUser, ServerUser]]:
+        match_ups: list[tuple[TimerConfig, ServerUser, ServerUser]] = []
+        # users are only removed between ticks, so requeue never puts back a user that already left
+        with self.lock:
+            for match_up in self.matchmaker.tick():
+                white: ServerUser | None = self.queued_users.pop(match_up.white_id, None)
+                black: ServerUser | None = self.queued_users.pop(match_up.black_id, None)
+                if white is not None and black is not None:
+                    match_ups.append((match_up.timer_config, white, black))
+                    continue
+
+                # a user disconnected after being paired, their partner goes back in the queue
+                for server_user in (white, black):
+                    if server_user is not None:
+                        self.requeue(server_user, match_up.timer_config)
+        return match_ups
 
-        while len(self.ready_to_play) >= 2:
-            shuffle(self.ready_to_play)
-            match_ups.append((self.ready_to_play.pop(), self.ready_to_play.pop()))
+    def requeue(self, server_user: ServerUser, timer_config: TimerConfig) -> None:
+        db_user: User = server_user.get_db_user()
+        self.logger.info("user: %s lost their opponent, back in the queue", db_user.u_name)
+        self.queued_users[db_user.u_id] = server_user
+        self.matchmaker.add(db_user.u_id, db_user.elo, timer_config)
 
-        return match_ups
+    def is_connected(self, server_user: ServerUser) -> bool:
+        return self.users.get(server_user.get_db_user().u_name) is server_user
 
     def remove_user(self, server_user: ServerUser) -> None:
-        if server_user not in self.users:
-            self.logger.info("user: %s is not in the lobby", server_user.db_user.u_name)
-            return
+        user_name: str = server_user.get_db_user().u_name
+        with self.lock:
+            if self.users.get(user_name) is not server_user:
+                self.logger.info("user: %s is not in the lobby", user_name)
+                return
 
-        self.users.remove(server_user)
+            del self.users[user_name]
+            self.matchmaker.remove(server_user.get_db_user().u_id)
+            self.queued_users.pop(server_user.get_db_user().u_id, None)
 
     def get_connection_count(self) -> int:
         return len(self.users)
 
     def verify_user(self, server_user: ServerUser, verification: Optional[Event]) -> bool:
+        return self.verify_fetched_user(server_user, verification, self.fetch_user(verification))
+
+    def fetch_user(self, verification: Optional[Event]) -> User | None:
         if verification is None:
-            return False
+            return None
 
         if not isinstance(verification, ServerVerificationEvent):
             self.logger.info("Expected ServerVerificationEvent instead got : %s", verification.type.name)
-            return False
+            return None
 
-        db_user: User | None = self.database.get_user(verification.user_name)
+        db_user: User | None = self.database.get_cached_user(verification.user_name)
         if db_user is None:
             self.logger.info("database could not find user : %s", verification.user_name)
+
+        return db_user
+
+    def verify_fetched_user(self, server_user: ServerUser, verification: Optional[Event],
+                            db_user: User | None) -> bool:
+        if db_user is None or not isinstance(verification, ServerVerificationEvent):
             return False
 
-        for server_users in self.users:
-            if server_users.get_db_user().u_name == db_user.u_name:
-                self.logger.info("user : %s is already connected", db_user.u_name)
-                return False
+        if db_user.u_name in self.users:
+            self.logger.info("user : %s is already connected", db_user.u_name)
+            return False
 
         return server_user.set_db_user(verification, db_user)
+
+
+def get_queue_timer_config(timer_name: str) -> TimerConfig:
+    try:
+        return TimerConfig.get_timer_config(timer_name)
+    except Exception:
+        return DefaultConfigs.BLITZ_5_0
@@ -1,6 +1,10 @@
 import socket as skt
+import typing
 
 from database.models import User
+from event.event import Event
+from event.event_codec import EventDecoder
+from event.event_manager import EventManager
 from event.launcher_events import ServerVerificationEvent
 
 
@@ -9,6 +13,8 @@ class ServerUser:
         self.socket: skt.socket = socket
         self.address: tuple[str, int] = address
         self.db_user: User | None = None
+        self.decoder: EventDecoder = EventDecoder()
+        self.pending_events: list[Event] = []
 
     def set_db_user(self, verification: ServerVerificationEvent, compare_user: User) -> bool:
 
@@ -19,6 +25,19 @@ class ServerUser:
         self.db_user = compare_user
         return True
 
+    def send(self, payload: Event | typing.Sequence[Event]) -> None:
+        # the socket of a user that left is closed, their match can still end afterwards
+        if self.socket.fileno() == -1:
+            return
+        # the connection can break before the listener closes the socket, the listener removes the user then
+        try:
+            EventManager.dispatch(self.socket, payload)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self.socket.close()
+
     def get_db_user(self) -> User:
         if self.db_user is None:
             raise Exception("user not verified yet")
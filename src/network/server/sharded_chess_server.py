@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from multiprocessing.queues import Queue
+
+from chess.timer.timer_config import TimerConfig
+from event.event import Event
+from event.event_codec import FRAME_HEADER
+from event.event_codec import decode_payload
+from event.game_events import GameEvent
+from network.server.chess_server import ChessServer
+from network.server.match_lifecycle import ServerMatch
+from network.server.match_shard import MatchShard
+from network.server.match_shard import ShardResponse
+from network.server.match_shard import get_shard_index
+
+
+class ShardedChessServer(ChessServer):
+    """
+    sockets and the lobby stay in this process, every match is validated by one of the match shard
+    processes so move validation is not limited by a single interpreter lock
+    """
+    sharded_chess_server: ShardedChessServer | None = None
+    shard_count: int = os.cpu_count() or 1
+
+    @staticmethod
+    def get() -> ShardedChessServer:
+        if ShardedChessServer.sharded_chess_server is None:
+            ShardedChessServer.sharded_chess_server = ShardedChessServer()
+        return ShardedChessServer.sharded_chess_server
+
+    @staticmethod
+    def set_shard_count(shard_count: int) -> None:
+        assert shard_count > 0, "the server needs at least one match shard"
+        ShardedChessServer.shard_count = shard_count
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.responses: Queue[ShardResponse | None] = multiprocessing.Queue()
+        self.shards: list[MatchShard] = [MatchShard(shard_id, self.responses)
+                                         for shard_id in range(ShardedChessServer.shard_count)]
+        self.response_thread: threading.Thread = threading.Thread(target=self.response_listener, daemon=True)
+
+    def start(self, is_server_online: bool | None = None) -> bool:
+        if not super().start(is_server_online):
+            return False
+
+        for shard in self.shards:
+            shard.start()
+        self.response_thread.start()
+        self.logger.info("started %s match shards", len(self.shards))
+        return True
+
+    def get_shard(self, match_id: int) -> MatchShard:
+        return self.shards[get_shard_index(match_id, len(self.shards))]
+
+    def add_game(self, match_id: int, timer_config: TimerConfig) -> None:
+        self.get_shard(match_id).add_game(match_id, timer_config, ChessServer.match_engine)
+
+    def process_in_game_event(self, game_event: Event) -> None:
+        assert isinstance(game_event, GameEvent), f"expected GAME context instead got: {game_event.context}"
+        if self.match_lifecycle.get(game_event.match_id) is None:
+            self.logger.debug("event: %s for match %s that is over", game_event.type.name, game_event.match_id)
+            return
+        self.get_shard(game_event.match_id).send_game_event(game_event)
+
+    def abandon_game(self, server_match: ServerMatch, side: str) -> None:
+        self.get_shard(server_match.match_id).abandon_game(server_match.match_id, side)
+
+    def get_game_sizes(self) -> list[int]:
+        # the games are in the shard processes, they drop a game as soon as it is over
+        return []
+
+    def response_listener(self) -> None:
+        while (response := self.responses.get()) is not None:
+            # one bad response must not stop the responses of every shard
+            try:
+                self.handle_shard_response(response)
+            except Exception as err:
+                self.logger.error("could not handle the shard response for match %s due to : %s", response.match_id,
+                                  err)
+
+    def handle_shard_response(self, response: ShardResponse) -> None:
+        events: list[Event] = decode_payload(response.frame, FRAME_HEADER.size, len(response.frame))
+        game_events: list[GameEvent] = [event for event in events if isinstance(event, GameEvent)]
+        if (server_match := self.match_lifecycle.get(response.match_id)) is None:
+            return
+        self.handle_match_response(server_match, game_events, response.moves)
+
+    def shut_down(self) -> None:
+        super().shut_down()
+        for shard in self.shards:
+            shard.stop()
+        self.responses.put(None)
+        if self.response_thread.is_alive():
+            self.response_thread.join()
+        # games that ended while the shards were stopping
+        self.database.stop_write_queue()
+        self.logger.info("stopped match shards")